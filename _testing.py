@@ -0,0 +1,17 @@
+import random
+
+from Cinos import Drink
+
+# Helpers shared by the test modules
+
+
+def order(**spec):
+    # Drink.from_spec() with the spec as keyword arguments
+    return Drink.from_spec(spec)
+
+
+def random_drinks(n, seed=0):
+    # n orders with every category's code or mask drawn uniformly
+    rng = random.Random(seed)
+    radices = [len(c.table) for c in Drink.MENU]
+    return [Drink.from_key([rng.randrange(r) for r in radices]) for _ in range(n)]
@@ -0,0 +1,250 @@
+import argparse
+import csv
+import json
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from Cinos import Drink
+from service import build_drink
+
+# CSV orders have one column per menu category (the order spec field
+# names); multi-choice cells list their items separated by ";" and an
+# empty cell means nothing was chosen from that category
+MULTI_SEPARATOR = ";"
+
+
+def parse_jsonl(line):
+    # Anything but an object is rejected by Drink.from_spec()
+    return json.loads(line)
+
+
+@lru_cache(maxsize=8)
+def csv_parser(header):
+    fields = next(csv.reader([header]))
+    known = {c.name: c.multi for c in Drink.MENU}
+    unknown = [f for f in fields if f not in known]
+    if unknown:
+        raise ValueError(f"Invalid CSV columns: {unknown}.")
+    multi = [known[f] for f in fields]
+
+    def parse(line):
+        row = next(csv.reader([line]))
+        if len(row) != len(fields):
+            raise ValueError(f"Expected {len(fields)} columns, got {len(row)}.")
+        spec = {}
+        for field, is_multi, cell in zip(fields, multi, row):
+            cell = cell.strip()
+            if cell:
+                spec[field] = [v.strip() for v in cell.split(MULTI_SEPARATOR)] if is_multi else cell
+        return spec
+
+    return parse
+
+
+class Invalid(str):
+    # The reason a line was rejected, remembered like any other result
+    pass
+
+
+# Order files repeat the same few hundred popular orders over and over, so
+# each distinct line is parsed, validated and priced once per run
+MEMO_SIZE = 1 << 16
+_memo = {}
+
+
+def _results(menu, header, receipts):
+    # Promotions with "hours" windows price the same line differently from
+    # one hour to the next, so their results are kept per hour
+    promotions = Drink.PROMOTIONS
+    hour = None
+    if promotions is not None and promotions.compile(menu).timed:
+        hour = promotions.hour()
+    run = (menu, header, receipts, promotions, hour)
+    memo = _memo.get(run)
+    if memo is None:
+        _memo.clear()  # the menu, the run or the hour changed, old results are stale
+        memo = _memo[run] = ({}, PiecePricer(menu))
+    return memo
+
+
+# Totals for JSONL lines laid out the way json.dumps() writes them, such as
+#   {"base": "water", "flavor": ["lemon", "lime"], "food": null}
+# are priced field by field. Each '"field": value' piece is validated once
+# through Drink.from_spec() and remembered, so a line never seen before
+# costs neither a JSON parse nor a Drink when its pieces have been seen;
+# distinct orders share most of their pieces. Lines laid out any other way
+# (spacing, escapes, a repeated field) or with a piece that does not
+# validate take price_line().
+_PIECE = re.compile(r'"[^"\\]+": (?:"[^"\\]*"|null|\[(?:"[^"\\]*"(?:, "[^"\\]*")*)?\])')
+LANE = 32  # bits per category when counting how often each field appears
+
+
+class PiecePricer:
+    # Each piece is remembered as one int: its items' price in cents in the
+    # low bits and, above them, a 1 in its category's LANE-bit lane. Adding
+    # up a line's pieces gives its subtotal and how often each field was
+    # given in a single sum.
+
+    def __init__(self, menu):
+        self.menu = menu
+        self.shift = menu.max_subtotal.bit_length()
+        self.once = sum(1 << (LANE * i) for i in range(len(menu.categories)))
+        self.packed = {}  # piece -> cents | lane << shift
+        self.codes = {}  # piece -> (position in key(), code)
+        self.texts = {}  # total cents -> "x.xx\n"
+
+    def _learn(self, piece):
+        # Validates and remembers piece; False if it does not validate (or
+        # there is no room left to remember it)
+        if len(self.packed) >= MEMO_SIZE:
+            return False
+        try:
+            spec = json.loads("{" + piece + "}")
+            key = Drink.from_spec(spec).key()
+        except ValueError:
+            return False
+        field, = spec
+        index = [c.name for c in self.menu.categories].index(field)
+        cents = self.menu.categories[index].table[key[index]]
+        self.packed[piece] = cents | 1 << (LANE * index + self.shift)
+        self.codes[piece] = index, key[index]
+        return True
+
+    def price(self, line):
+        # The totals-only result for line, or None to price it in full
+        found = _PIECE.findall(line)
+        if "{" + ", ".join(found) + "}" != line:
+            return None
+        try:
+            total = sum(map(self.packed.__getitem__, found))
+        except KeyError:
+            if not all(piece in self.packed or self._learn(piece) for piece in found):
+                return None
+            total = sum(map(self.packed.__getitem__, found))
+        if total >> self.shift | self.once != self.once:
+            return None  # a field given twice
+        subtotal = total & ((1 << self.shift) - 1)
+        promotions = Drink.PROMOTIONS
+        if promotions is not None:
+            key = [0] * len(self.menu.categories)
+            for index, code in map(self.codes.__getitem__, found):
+                key[index] = code
+            subtotal -= promotions.discount_cents(self.menu, tuple(key))
+        text = self.texts.get(subtotal)
+        if text is None:
+            text = self.texts[subtotal] = f"{self.menu.totals[subtotal] / 100:.2f}\n"
+        return text
+
+
+def price_line(line, parse, receipts=False):
+    # The total (or the full receipt) for one order line
+    try:
+        drink = build_drink(parse(line))
+    except (TypeError, ValueError) as e:
+        return Invalid(e)
+    if receipts:
+        return drink.generate_receipt() + "\n"
+    return f"{drink.get_cost():.2f}\n"
+
+
+def price_chunk(chunk, header=None, receipts=False):
+    # chunk is a list of (line number, text). Returns the output text for
+    # the valid orders and a "line N: reason" message for each invalid one.
+    parse = csv_parser(header) if header is not None else parse_jsonl
+    memo, pricer = _results(Drink.MENU, header, receipts)
+    fast = pricer.price if header is None and not receipts else None
+    out = []
+    errors = []
+    for lineno, line in chunk:
+        result = memo.get(line)
+        if result is None:
+            result = fast and fast(line) or price_line(line, parse, receipts)
+            if len(memo) < MEMO_SIZE:
+                memo[line] = result
+        if result.__class__ is Invalid:
+            errors.append(f"line {lineno}: {result}")
+        elif receipts:
+            out.append(result)
+        else:
+            out.append(f"{lineno}\t{result}")
+    return "".join(out), errors
+
+
+def numbered_lines(stream, first=1):
+    for lineno, line in enumerate(stream, first):
+        line = line.strip()
+        if line:
+            yield lineno, line
+
+
+def run(stream, out, err, fmt="jsonl", receipts=False, workers=1, chunksize=2048):
+    # Prices every order in stream. Returns (orders priced, lines skipped).
+    header = None
+    first = 1
+    if fmt == "csv":
+        header = stream.readline().strip()
+        first = 2
+        csv_parser(header)  # reject a bad header before reading any orders
+    lines = numbered_lines(stream, first)
+    chunks = iter(lambda: list(islice(lines, chunksize)), [])
+    priced = skipped = 0
+
+    def emit(result, size):
+        nonlocal priced, skipped
+        text, errors = result
+        out.write(text)
+        for message in errors:
+            err.write(message + "\n")
+        skipped += len(errors)
+        priced += size - len(errors)
+
+    if workers <= 1:
+        for chunk in chunks:
+            emit(price_chunk(chunk, header, receipts), len(chunk))
+        return priced, skipped
+    # Keep a bounded number of chunks in flight and write them back in order
+    pending = deque()
+    with ProcessPoolExecutor(workers) as pool:
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                future, size = pending.popleft()
+                emit(future.result(), size)
+            pending.append((pool.submit(price_chunk, chunk, header, receipts), len(chunk)))
+        while pending:
+            future, size = pending.popleft()
+            emit(future.result(), size)
+    return priced, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m Cinos batch",
+        description="Price a file of orders, one JSON object or CSV row per line.")
+    parser.add_argument("input", nargs="?", default="-", help="order file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="where to write results, - for stdout")
+    parser.add_argument("--format", choices=("jsonl", "csv"),
+                        help="input format (default: from the file extension, else jsonl)")
+    parser.add_argument("--receipts", action="store_true",
+                        help="write full receipts instead of 'line<TAB>total' rows")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        priced, skipped = run(stream, out, sys.stderr, fmt, args.receipts, args.workers)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"priced {priced} orders, skipped {skipped} invalid lines", file=sys.stderr)
+    return 0
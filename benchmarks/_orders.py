@@ -0,0 +1,76 @@
+import random
+
+from benchmarks._legacy import Drink as LegacyDrink
+
+# (setter, menu) pairs in the order main() asks for them
+SETTERS = (
+    ("set_base", LegacyDrink._Drink__valid_bases, False),
+    ("add_flavor", LegacyDrink._Drink__valid_flavors, True),
+    ("add_size", LegacyDrink._Drink__valid_sizes, False),
+    ("add_food", LegacyDrink._Drink__valid_food, False),
+    ("add_topping", LegacyDrink._Drink__valid_toppings, True),
+    ("set_icecream_flavor", LegacyDrink._Drink__valid_icecream_flavor, False),
+    ("add_icecream_topping", LegacyDrink._Drink__valid_icecreamtoppings, True),
+)
+
+
+def random_orders(n, seed=0):
+    return list(iter_orders(n, seed))
+
+
+def iter_orders(n, seed=0):
+    # Each order is a list of (setter name, item) calls
+    rng = random.Random(seed)
+    for _ in range(n):
+        calls = []
+        for setter, items, multi in SETTERS:
+            names = list(items)
+            if multi:
+                calls.extend((setter, name) for name in names if rng.random() < 0.3)
+            elif rng.random() < 0.85:
+                calls.append((setter, rng.choice(names)))
+        yield calls
+
+
+# Setter name -> (order spec field, multi-choice)
+SPEC_FIELDS = {
+    "set_base": ("base", False),
+    "add_flavor": ("flavor", True),
+    "add_size": ("size", False),
+    "add_food": ("food", False),
+    "add_topping": ("topping", True),
+    "set_icecream_flavor": ("icecream_flavor", False),
+    "add_icecream_topping": ("icecream_topping", True),
+}
+
+
+def to_spec(calls):
+    # The order spec dict (see service.py) for a list of setter calls
+    spec = {}
+    for setter, item in calls:
+        field, multi = SPEC_FIELDS[setter]
+        if multi:
+            spec.setdefault(field, []).append(item)
+        else:
+            spec[field] = item
+    return spec
+
+
+def build(cls, orders):
+    drinks = []
+    for calls in orders:
+        d = cls()
+        for setter, item in calls:
+            getattr(d, setter)(item)
+        drinks.append(d)
+    return drinks
+
+
+def best_of(fn, repeat=5):
+    import time
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
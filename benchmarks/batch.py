@@ -0,0 +1,59 @@
+# Throughput of 'python -m Cinos batch' (totals only) on skewed traffic, where
+# a few hundred popular orders make up most lines, and on all-distinct lines.
+# Exits with status 1 if one worker prices fewer than TARGET distinct lines a
+# second, the case the per-line memo cannot help with.
+# Run with: python -m benchmarks.batch [orders] [workers]
+import io
+import json
+import random
+import sys
+
+import batch
+from benchmarks._orders import best_of, random_orders, to_spec
+
+TARGET = 100_000  # orders/s
+
+
+def skewed_lines(n, popular=300):
+    combos = [json.dumps(to_spec(o)) for o in random_orders(popular, seed=1)]
+    rare = [json.dumps(to_spec(o)) for o in random_orders(n // 20, seed=2)]
+    rng = random.Random(3)
+    weights = [1 / (rank + 1) for rank in range(popular)]
+    lines = rng.choices(combos, weights, k=n - len(rare)) + rare
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def unique_lines(n):
+    return "".join(json.dumps(to_spec(o)) + "\n" for o in random_orders(n, seed=4))
+
+
+def measure(label, text, n, workers):
+    # Best of three cold runs, each starting with nothing memoized
+
+    def run():
+        batch._memo.clear()
+        priced, skipped = batch.run(io.StringIO(text), io.StringIO(), io.StringIO(), workers=workers)
+        assert priced == n and skipped == 0
+
+    elapsed = best_of(run, repeat=3)
+    print(f"  {label:>9}, {workers} worker(s): {n / elapsed / 1e3:7.1f} k orders/s")
+    return n / elapsed
+
+
+def main(n=500_000, workers=1):
+    print(f"orders: {n}")
+    skewed = skewed_lines(n)
+    unique = unique_lines(n)
+    status = 0
+    for w in sorted({1, workers}):
+        measure("skewed", skewed, n, w)
+        rate = measure("distinct", unique, n, w)
+        if w == 1 and rate < TARGET:
+            print(f"  FAIL: distinct lines on one worker below {TARGET / 1e3:.0f} k orders/s")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,43 @@
+# Rendering cost with and without RENDER_CACHE on skewed traffic where a few
+# hundred configurations make up most orders.
+# Run with: python -m benchmarks.cache [orders] [popular combos]
+import random
+import sys
+
+from Cinos import RENDER_CACHE, Drink
+from benchmarks._orders import best_of, build, random_orders
+
+
+def skewed_drinks(n, popular):
+    combos = build(Drink, random_orders(popular, seed=1))
+    rare = build(Drink, random_orders(n // 10, seed=2))
+    rng = random.Random(3)
+    weights = [1 / (rank + 1) for rank in range(popular)]
+    drinks = rng.choices(combos, weights, k=n - len(rare)) + rare
+    rng.shuffle(drinks)
+    return drinks
+
+
+def render_all(drinks):
+    for d in drinks:
+        d.generate_receipt()
+        str(d)
+        repr(d)
+
+
+def main(n=200_000, popular=300):
+    drinks = skewed_drinks(n, popular)
+    print(f"orders: {n}, popular combos: {popular}")
+    for maxsize in (0, 256, 1024, 8192):
+        RENDER_CACHE.resize(maxsize)
+        RENDER_CACHE.invalidate()
+        RENDER_CACHE.clear_stats()
+        render_all(drinks)
+        info = RENDER_CACHE.info()
+        elapsed = best_of(lambda: render_all(drinks), repeat=3)
+        print(f"  maxsize {maxsize:5}: {elapsed / n * 1e6:5.2f} us/order "
+              f"(first pass hit rate {info.hits / max(info.hits + info.misses, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+# Carts of 1 to 1000 lines: filling one, pricing it, removing every line and
+# rendering its receipt, against pricing and printing the drinks one by one.
+# Run with: python -m benchmarks.cart [carts]
+import sys
+import time
+import timeit
+
+from Cinos import Drink
+from benchmarks._orders import best_of, random_orders, to_spec
+from cart import Cart
+
+
+def removing(ticket, carts):
+    # Best time to take every line off `carts` full carts
+    ids = range(1, len(ticket) + 1)
+    best = float("inf")
+    for _ in range(3):
+        full = [Cart(ticket) for _ in range(carts)]
+        start = time.perf_counter()
+        for cart in full:
+            for line_id in ids:
+                cart.remove(line_id)
+        best = min(best, time.perf_counter() - start)
+    return best / carts
+
+
+def main(carts=20):
+    drinks = [Drink.from_spec(to_spec(o)) for o in random_orders(1000)]
+    for lines in (1, 10, 100, 1000):
+        ticket = drinks[:lines]
+        cart = Cart(ticket)
+        fill = best_of(lambda: [Cart(ticket) for _ in range(carts)], repeat=3) / carts
+        empty = removing(ticket, carts)
+        number = 100_000 // lines
+        total = timeit.timeit(cart.total_cents, number=number) / number
+        separate = timeit.timeit(lambda: sum(map(Drink.get_cost_cents, ticket)), number=number) / number
+        receipt = best_of(lambda: [cart.generate_receipt() for _ in range(carts)], repeat=3) / carts
+        one_by_one = best_of(lambda: [[d.generate_receipt() for d in ticket] for _ in range(carts)],
+                             repeat=3) / carts
+        print(f"{lines:5d} lines: add {fill / lines * 1e6:5.2f} us/line, remove {empty / lines * 1e6:5.2f} us/line, "
+              f"total {total * 1e6:6.2f} us (per drink {separate * 1e6:8.2f} us), "
+              f"receipt {receipt * 1e3:7.3f} ms (per drink {one_by_one * 1e3:7.3f} ms)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
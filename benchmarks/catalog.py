@@ -0,0 +1,37 @@
+# Menu lookups from the catalog before and after a hot reload, against the
+# class-private dict lookups the old Drink did.
+# Run with: python -m benchmarks.catalog [lookups]
+import sys
+import time
+import timeit
+
+from Cinos import CATALOG, Drink
+from benchmarks._legacy import Drink as LegacyDrink
+
+
+def per_call(stmt, n, **names):
+    return min(timeit.repeat(stmt, globals=names, number=n, repeat=5)) / n * 1e9
+
+
+def report(label, n):
+    bases = Drink.MENU["base"]
+    print(f"  {label}:")
+    print(f"    name -> code -> cents:  {per_call('table[codes[name]]', n, table=bases.table, codes=bases.codes, name='hill fog'):6.1f} ns")
+    print(f"    Drink set_base+get_cost: {per_call('d.set_base(name); d.get_cost()', n, d=Drink(), name='hill fog'):6.1f} ns")
+
+
+def main(n=1_000_000):
+    legacy = LegacyDrink._Drink__valid_bases
+    print(f"lookups: {n}")
+    print(f"  legacy dict[name]:         {per_call('prices[name]', n, prices=legacy, name='hill fog'):6.1f} ns")
+    print(f"  legacy set_base+get_cost:  "
+          f"{per_call('d.set_base(name); d.get_cost()', n, d=LegacyDrink(), name='hill fog'):6.1f} ns")
+    report("before reload", n)
+    start = time.perf_counter()
+    CATALOG.reload()
+    print(f"  reload took {(time.perf_counter() - start) * 1e3:.2f} ms")
+    report("after reload", n)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
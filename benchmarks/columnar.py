@@ -0,0 +1,29 @@
+# Throughput of columnar price_orders() against one Drink.get_cost() per row.
+# Run with: python -m benchmarks.columnar [orders]
+import sys
+
+from Cinos import Drink
+from benchmarks._orders import best_of, build, random_orders
+from columnar import columns_from, np, price_orders
+
+
+def main(n=1_000_000):
+    orders = random_orders(n)
+    drinks = build(Drink, orders)
+    batch = columns_from(drinks)
+    if np is not None:
+        batch = {name: np.asarray(col) for name, col in batch.items()}
+
+    totals = price_orders(batch)["total"]
+    assert all(t / 100 == d.get_cost() for t, d in zip(totals, drinks))
+
+    # Today's path: one Drink per row, then get_cost()
+    loop = best_of(lambda: [d.get_cost() for d in build(Drink, orders)], repeat=3)
+    vector = best_of(lambda: price_orders(batch), repeat=3)
+    print(f"orders: {n} ({'numpy' if np is not None else 'pure Python'} path)")
+    print(f"  per-object loop: {n / loop / 1e6:6.2f} M orders/s")
+    print(f"    price_orders(): {n / vector / 1e6:6.2f} M orders/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+# Build time, file size and lookup latency of the precomputed price table,
+# against pricing the same keys through Menu and through Drink.
+# Run with: python -m benchmarks.configs [lookups]
+import os
+import random
+import sys
+import tempfile
+import time
+
+import configs
+from Cinos import Drink
+from benchmarks._orders import best_of
+
+
+def main(n=200_000):
+    menu = Drink.MENU
+    rng = random.Random(1)
+    rdx = configs.radices()
+    keys = [tuple(rng.randrange(r) for r in rdx) for _ in range(n)]
+    indexes = [configs.pack(k) for k in keys]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "prices.bin")
+        start = time.perf_counter()
+        size = configs.build_table(path)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        table = configs.PriceTable(path)
+        opened = time.perf_counter() - start
+        print(f"configurations: {configs.count():,}")
+        print(f"  build: {built * 1e3:.0f} ms, file: {size / 1e6:.2f} MB, open: {opened * 1e3:.2f} ms")
+        assert [table.total_cents(i) for i in indexes] == [menu.totals[menu.subtotal_cents(k)] for k in keys]
+        lookup = table.total_cents
+        t = best_of(lambda: [lookup(i) for i in indexes], repeat=3)
+        print(f"  table lookup, packed index:   {t / n * 1e9:6.0f} ns")
+        t = best_of(lambda: [table.price(k) for k in keys], repeat=3)
+        print(f"  table lookup, key (packs):    {t / n * 1e9:6.0f} ns")
+        t = best_of(lambda: [menu.totals[menu.subtotal_cents(k)] for k in keys], repeat=3)
+        print(f"  Menu.subtotal_cents + totals: {t / n * 1e9:6.0f} ns")
+        t = best_of(lambda: [Drink.from_key(k).get_cost_cents() for k in keys], repeat=3)
+        print(f"  Drink.from_key().get_cost:    {t / n * 1e9:6.0f} ns")
+        table.close()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,67 @@
+# Building orders from spec dicts: Drink.from_spec()/Drink.many() against
+# one setter call per choice, on valid orders and on orders with mistakes.
+# Run with: python -m benchmarks.from_spec [orders]
+import sys
+
+from Cinos import Drink, InvalidOrder
+from benchmarks._orders import best_of, random_orders, to_spec
+
+SETTERS = {
+    "base": Drink.set_base,
+    "flavor": Drink.add_flavor,
+    "size": Drink.add_size,
+    "food": Drink.add_food,
+    "topping": Drink.add_topping,
+    "icecream_flavor": Drink.set_icecream_flavor,
+    "icecream_topping": Drink.add_icecream_topping,
+}
+
+
+def by_setters(specs):
+    # The old service.build_drink(): stops at the first bad field
+    drinks = []
+    for spec in specs:
+        d = Drink()
+        try:
+            for name, value in spec.items():
+                setter = SETTERS[name]
+                if Drink.MENU[name].multi:
+                    for item in value:
+                        setter(d, item)
+                else:
+                    setter(d, value)
+        except ValueError:
+            continue
+        drinks.append(d)
+    return drinks
+
+
+def by_spec(specs):
+    drinks = []
+    for spec in specs:
+        try:
+            drinks.append(Drink.from_spec(spec))
+        except InvalidOrder:
+            pass
+    return drinks
+
+
+def main(n=100_000):
+    specs = [to_spec(o) for o in random_orders(n)]
+    bad = [dict(spec, base="lava") if i % 10 == 0 else spec for i, spec in enumerate(specs)]
+    assert [d.key() for d in by_spec(specs)] == [d.key() for d in by_setters(specs)]
+    print(f"orders: {n}")
+    t = best_of(lambda: by_setters(specs), repeat=3)
+    print(f"  setter calls:     {t / n * 1e6:6.2f} us/order")
+    t = best_of(lambda: by_spec(specs), repeat=3)
+    print(f"  from_spec():      {t / n * 1e6:6.2f} us/order")
+    t = best_of(lambda: Drink.many(specs), repeat=3)
+    print(f"  many():           {t / n * 1e6:6.2f} us/order")
+    t = best_of(lambda: by_setters(bad), repeat=3)
+    print(f"  setter calls, 10% invalid: {t / n * 1e6:6.2f} us/order")
+    t = best_of(lambda: by_spec(bad), repeat=3)
+    print(f"  from_spec(), 10% invalid:  {t / n * 1e6:6.2f} us/order")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
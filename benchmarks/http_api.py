@@ -0,0 +1,84 @@
+# Load generator for the HTTP ordering API: keep-alive clients posting
+# orders, reporting requests/s and latency percentiles.
+# Starts a server in a subprocess unless --port names one already running.
+# Run with: python -m benchmarks.http_api [--clients 8] [--requests 2000] [--batch 100]
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks._orders import random_orders, to_spec
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server():
+    proc = subprocess.Popen([sys.executable, "-m", "http_api", "--port", "0"], cwd=ROOT,
+                            stdout=subprocess.PIPE, text=True)
+    port = int(proc.stdout.readline().rsplit(":", 1)[1])
+    return proc, port
+
+
+def client(host, port, path, bodies, latencies):
+    conn = http.client.HTTPConnection(host, port)
+    headers = {"Content-Type": "application/json"}
+    for body in bodies:
+        start = time.perf_counter()
+        conn.request("POST", path, body, headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            raise RuntimeError(f"{path} returned {response.status}")
+    conn.close()
+
+
+def load(host, port, path, bodies, clients):
+    per_client = [bodies[i::clients] for i in range(clients)]
+    latencies = []
+    threads = [threading.Thread(target=client, args=(host, port, path, b, latencies)) for b in per_client]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return len(bodies) / elapsed, latencies[len(latencies) // 2], latencies[len(latencies) * 99 // 100]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.http_api")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="an already running server (default: start one)")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=100, help="orders per /batch request")
+    args = parser.parse_args(argv)
+
+    proc = None
+    port = args.port
+    if port is None:
+        proc, port = start_server()
+    try:
+        specs = [to_spec(o) for o in random_orders(args.requests)]
+        singles = [json.dumps(s).encode() for s in specs]
+        batches = [json.dumps(specs[i:i + args.batch]).encode() for i in range(0, len(specs), args.batch)]
+        print(f"{args.clients} keep-alive clients against {args.host}:{port}")
+        for path, bodies, orders in (("/price", singles, 1), ("/receipt", singles, 1),
+                                     ("/batch", batches * max(1, args.clients), args.batch)):
+            rate, p50, p99 = load(args.host, port, path, bodies, args.clients)
+            print(f"  {path:<9} {rate:8.0f} req/s ({rate * orders:8.0f} orders/s)  "
+                  f"p50 {p50 * 1e3:6.2f} ms  p99 {p99 * 1e3:6.2f} ms")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Cost of the instrument hooks: never enabled, enabled, and enabled then
+# disabled again (which should match never enabled).
+# Run with: python -m benchmarks.instrument [orders]
+import sys
+
+import instrument
+from Cinos import Drink
+from benchmarks._orders import best_of, random_orders
+
+
+def price_all(orders):
+    for order in orders:
+        d = Drink()
+        for setter, item in order:
+            getattr(d, setter)(item)
+        d.get_cost()
+        d.generate_receipt()
+
+
+def main(n=20_000):
+    orders = list(random_orders(n, seed=1))
+    print(f"orders: {n}")
+    off = best_of(lambda: price_all(orders), repeat=5)
+    instrument.enable()
+    on = best_of(lambda: price_all(orders), repeat=5)
+    # best_of ran the batch several times, so count calls for a single pass
+    instrument.METRICS.reset()
+    price_all(orders)
+    calls = sum(h.count for h in instrument.METRICS.snapshot().values())
+    instrument.disable()
+    after = best_of(lambda: price_all(orders), repeat=5)
+    print(f"  disabled:          {off / n * 1e6:6.2f} us/order")
+    print(f"  enabled:           {on / n * 1e6:6.2f} us/order "
+          f"({(on - off) / max(calls, 1) * 1e9:.0f} ns per timed call, {calls} calls)")
+    print(f"  enabled->disabled: {after / n * 1e6:6.2f} us/order")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
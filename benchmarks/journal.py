@@ -0,0 +1,76 @@
+# Append and replay throughput of the binary order journal against the same
+# orders kept as JSON lines.
+# Run with: python -m benchmarks.journal [orders] [group size]
+import json
+import os
+import sys
+import tempfile
+
+from Cinos import Drink
+from benchmarks._orders import best_of, build, random_orders, to_spec
+from columnar import price_orders
+from journal import Journal, JournalWriter
+from service import build_drink
+
+
+def append_journal(path, drinks, group):
+    if os.path.exists(path):
+        os.remove(path)
+    with JournalWriter(path, group=group) as writer:
+        for d in drinks:
+            writer.append(d)
+
+
+def append_jsonl(path, specs, drinks, group):
+    # Same group fsync policy, so only the encoding differs
+    with open(path, "w", encoding="utf-8") as f:
+        for i, (spec, d) in enumerate(zip(specs, drinks), 1):
+            f.write(json.dumps(dict(spec, total=d.get_cost())) + "\n")
+            if i % group == 0:
+                f.flush()
+                os.fsync(f.fileno())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def replay_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            spec = json.loads(line)
+            del spec["total"]
+            build_drink(spec).get_cost()
+
+
+def replay_journal(path):
+    with Journal(path) as journal:
+        for d in journal.drinks():
+            d.get_cost()
+
+
+def reprice_journal(path):
+    journal = Journal(path)
+    price_orders(journal.columns())
+    journal.close()
+
+
+def main(n=200_000, group=256):
+    orders = random_orders(n)
+    drinks = build(Drink, orders)
+    specs = [to_spec(o) for o in orders]
+    with tempfile.TemporaryDirectory() as tmp:
+        binary, text = os.path.join(tmp, "orders.journal"), os.path.join(tmp, "orders.jsonl")
+        print(f"orders: {n}, fsync every {group}")
+        t = best_of(lambda: append_journal(binary, drinks, group), repeat=3)
+        print(f"  append journal:   {n / t / 1e3:8.0f} k orders/s, {os.path.getsize(binary) / n:5.1f} bytes/order")
+        t = best_of(lambda: append_jsonl(text, specs, drinks, group), repeat=3)
+        print(f"  append JSONL:     {n / t / 1e3:8.0f} k orders/s, {os.path.getsize(text) / n:5.1f} bytes/order")
+        t = best_of(lambda: replay_journal(binary), repeat=3)
+        print(f"  replay journal -> Drink:     {n / t / 1e3:8.0f} k orders/s")
+        t = best_of(lambda: replay_jsonl(text), repeat=3)
+        print(f"  replay JSONL -> Drink:       {n / t / 1e3:8.0f} k orders/s")
+        t = best_of(lambda: reprice_journal(binary), repeat=3)
+        print(f"  re-price journal columns:    {n / t / 1e3:8.0f} k orders/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
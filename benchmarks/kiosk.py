@@ -0,0 +1,73 @@
+# Load test for the asyncio kiosk: many simulated customers on one event loop.
+# Every session first connects and parks at the base prompt so the memory of
+# that many open sessions can be read, then all of them order at once.
+# Run with: python -m benchmarks.kiosk [sessions]
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from kiosk_async import handle_client
+
+SCRIPT = ['2', '1', '2', 'done', '1', '1', '1', '6', 'done', '2', '4', '8', 'done']
+
+
+async def customer(port, parked, go, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await reader.readuntil(b": ")
+    parked.release()
+    await go.wait()
+    start = time.perf_counter()
+    for step, line in enumerate(SCRIPT, 1):
+        sent = time.perf_counter()
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+        if step < len(SCRIPT):
+            await reader.readuntil(b": ")
+        latencies.append(time.perf_counter() - sent)
+    await reader.read()
+    writer.close()
+    return time.perf_counter() - start
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, len(ordered) * p // 100)]
+
+
+async def run(sessions):
+    tracemalloc.start()
+    server = await asyncio.start_server(handle_client, "127.0.0.1", 0, backlog=sessions)
+    port = server.sockets[0].getsockname()[1]
+    base, _ = tracemalloc.get_traced_memory()
+    parked = asyncio.Semaphore(0)
+    go = asyncio.Event()
+    latencies = []
+    tasks = [asyncio.create_task(customer(port, parked, go, latencies)) for _ in range(sessions)]
+    for _ in range(sessions):
+        await parked.acquire()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    go.set()
+    durations = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+
+    print(f"sessions: {sessions} (client and server share one event loop)")
+    print(f"  memory with every session open: {(held - base) / sessions / 1024:.1f} KiB/session "
+          f"(both ends of the connection)")
+    print(f"  {sessions * len(SCRIPT) / elapsed:,.0f} inputs/s, {sessions / elapsed:,.0f} sessions/s")
+    print(f"  per-input latency p50 {percentile(latencies, 50) * 1e3:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1e3:.2f} ms")
+    print(f"  session duration p50 {percentile(durations, 50) * 1e3:.1f} ms, "
+          f"p99 {percentile(durations, 99) * 1e3:.1f} ms")
+
+
+def main(sessions=2000):
+    asyncio.run(run(sessions))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,29 @@
+# The kitchen simulation under rising synthetic load: throughput, latency
+# and late orders with batched prep against one item at a time, and how fast
+# the simulator itself runs.
+# Run with: python -m benchmarks.kitchen [hours]
+import sys
+import time
+
+from kitchen import STATIONS, Kitchen, simulate, synthetic_arrivals
+
+
+def main(hours=8):
+    single = [s._replace(max_batch=1) for s in STATIONS]
+    print(f"{hours} hour shift, stations: " + ", ".join(
+        f"{s.name} x{s.workers} (batch {s.max_batch})" for s in STATIONS))
+    for rate in (60, 120, 240, 360, 480):
+        arrivals = synthetic_arrivals(rate, hours)
+        for label, stations in (("batched", STATIONS), ("one by one", single)):
+            start = time.perf_counter()
+            stats = simulate(arrivals, Kitchen(stations))
+            wall = time.perf_counter() - start
+            print(f"  {rate:4d}/h {label:10s} throughput {stats.throughput:6.1f}/h, "
+                  f"latency mean {stats.mean_latency / 60:6.1f} min p95 {stats.p95_latency / 60:6.1f} min, "
+                  f"late {stats.late / max(stats.orders, 1):4.0%}, "
+                  f"grill batch {stats.mean_batch['grill']:4.1f}, "
+                  f"simulated in {wall * 1e3:6.1f} ms ({wall / max(stats.orders, 1) * 1e6:4.1f} us/order)")
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:]))
@@ -0,0 +1,28 @@
+# Per-keystroke cost of the CLI menus: rebuilding the key list and
+# re-formatting prices as main() used to, against the precomputed Listing.
+# Run with: python -m benchmarks.listing [selections]
+import sys
+import timeit
+
+from Cinos import STEPS, Drink
+from benchmarks._legacy import Drink as LegacyDrink
+from listing import listings
+
+
+def per_call(stmt, n, **names):
+    return min(timeit.repeat(stmt, globals=names, number=n, repeat=5)) / n * 1e9
+
+
+def main(n=500_000):
+    toppings = LegacyDrink._Drink__valid_toppings
+    listing = listings(Drink.MENU, STEPS)[4]
+    print(f"selections: {n} (toppings menu, {len(toppings)} items)")
+    print(f"  list(keys())[choice - 1]: {per_call('list(items.keys())[int(c) - 1]', n, items=toppings, c='7'):6.1f} ns")
+    print(f"  Listing.choose(choice):   {per_call('listing.choose(c)', n, listing=listing, c='7'):6.1f} ns")
+    render = "[f'{i}. {name} - ${price:.2f}' for i, (name, price) in enumerate(items.items(), 1)]"
+    print(f"  format menu each time:    {per_call(render, n // 10, items=toppings):6.1f} ns")
+    print(f"  Listing.text:             {per_call('listing.text', n, listing=listing):6.1f} ns")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+# Free-text item lookup over the whole Cinos menu: building every category's
+# index, then resolving exact names, prefixes and typos for every item,
+# uncached and through the per-index cache, against the plain name dict.
+# Run with: python -m benchmarks.lookup [rounds]
+import sys
+import time
+
+from Cinos import Drink
+from benchmarks._orders import best_of
+from lookup import CategoryIndex, compact
+
+
+def queries(category):
+    # (kind, text) for every item: how a kiosk customer might type it
+    for name in category.names:
+        key = compact(name)
+        yield "exact", name.upper()
+        yield "prefix", key[:max(3, len(key) // 2)]
+        if len(key) >= 5:
+            middle = len(key) // 2
+            yield "typo", key[:middle] + key[middle + 1:]
+            yield "typo", key[:middle - 1] + key[middle] + key[middle - 1] + key[middle + 1:]
+
+
+def main(rounds=200):
+    menu = Drink.MENU
+    start = time.perf_counter()
+    indexes = [CategoryIndex(c) for c in menu.categories]
+    print(f"index for {sum(len(c.names) for c in menu.categories)} items built in "
+          f"{(time.perf_counter() - start) * 1e3:.1f} ms")
+    work = [(ix, kind, text) for ix in indexes for kind, text in queries(ix.category)]
+    names = [(ix.category.codes, ix.category.names[0]) for ix in indexes]
+    t = best_of(lambda: [codes.get(name) for _ in range(rounds) for codes, name in names])
+    print(f"  exact name, codes dict:  {t / (rounds * len(names)) * 1e6:6.2f} us")
+    for kind in ("exact", "prefix", "typo"):
+        batch = [(ix, text) for ix, k, text in work if k == kind]
+        found = sum(ix._resolve(text) is not None for ix, text in batch)
+        t = best_of(lambda: [ix._resolve(text) for _ in range(rounds) for ix, text in batch], repeat=3)
+        cached = best_of(lambda: [ix.resolve(text) for _ in range(rounds) for ix, text in batch], repeat=3)
+        n = rounds * len(batch)
+        print(f"  {kind:7s} {len(batch):3d} queries ({found} resolved): {t / n * 1e6:6.2f} us, "
+              f"cached {cached / n * 1e6:5.2f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,32 @@
+# Memory held by a day's worth of orders: the set-based legacy Drink against
+# the __slots__/bitmask one.  Run with: python -m benchmarks.memory [orders]
+import gc
+import sys
+import tracemalloc
+
+from Cinos import Drink
+from benchmarks._legacy import Drink as LegacyDrink
+from benchmarks._orders import build, iter_orders
+
+
+def measure(cls, n):
+    gc.collect()
+    tracemalloc.start()
+    drinks = build(cls, iter_orders(n))
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del drinks
+    return held
+
+
+def main(n=1_000_000):
+    legacy = measure(LegacyDrink, n)
+    compact = measure(Drink, n)
+    print(f"orders: {n}")
+    print(f"  legacy: {legacy / 2**20:8.1f} MiB ({legacy / n:6.1f} B/order)")
+    print(f" compact: {compact / 2**20:8.1f} MiB ({compact / n:6.1f} B/order)")
+    print(f"   saved: {1 - compact / legacy:.0%}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+# Accuracy and speed of integer-cent money against the old float arithmetic.
+# Accuracy: how often the old float formulas are off by a cent, per subtotal
+# and over a bulk sum. Speed: summing a day's totals.
+# Run with: python -m benchmarks.money [orders]
+import sys
+
+from Cinos import Drink, sum_totals
+from benchmarks._orders import best_of, build, random_orders
+from money import HALF_UP, TaxPolicy, format_cents
+
+RATES = (0.0725, 0.08875, 0.0625, 0.1025)
+
+
+def float_footer(total_cents, rate):
+    # What the receipt used to print: subtotal recovered from the total
+    subtotal = total_cents / 100 / (1 + rate)
+    return f"{subtotal:.2f}", f"{subtotal * rate:.2f}"
+
+
+def main(n=1_000_000):
+    print("per-subtotal errors of the old float formulas, $0.00 - $50.00:")
+    for rate in RATES:
+        policy = TaxPolicy(rate, HALF_UP)
+        totals = drift = 0
+        for s in range(5001):
+            cost = s / 100
+            exact = policy.total_cents(s)
+            totals += round(round(cost + cost * rate, 2) * 100) != exact
+            drift += float_footer(exact, rate) != (format_cents(s), format_cents(exact - s))
+        print(f"  {rate:7.3%}: {totals:4} totals off a half-cent tie, {drift:4} receipt footers off by a cent")
+
+    drinks = build(Drink, random_orders(n))
+    exact = sum_totals(drinks)
+    floats = sum(d.get_cost() for d in drinks)
+    print(f"\norders: {n}")
+    print(f"  exact takings ${format_cents(exact)}, float sum ${floats:.6f} "
+          f"(off by {abs(floats * 100 - exact):.6f} cents)")
+    t_float = best_of(lambda: sum(d.get_cost() for d in drinks), repeat=3)
+    t_cents = best_of(lambda: sum_totals(drinks), repeat=3)
+    print(f"  sum of get_cost() floats: {n / t_float / 1e6:6.2f} M orders/s")
+    print(f"  sum_totals() cents:       {n / t_cents / 1e6:6.2f} M orders/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,40 @@
+# Compares the compiled integer-cent pricing in Cinos.Drink with the original
+# float implementation.  Run with: python -m benchmarks.pricing [orders]
+import sys
+
+from Cinos import Drink
+from money import exact_rate
+from benchmarks._legacy import Drink as LegacyDrink
+from benchmarks._orders import best_of, build, random_orders
+
+
+def main(n=200_000):
+    orders = random_orders(n)
+    legacy = build(LegacyDrink, orders)
+    compiled = build(Drink, orders)
+
+    # Totals must agree; the only allowed difference is one cent on a
+    # half-cent tie, where the exact tax ends in exactly half a cent and the
+    # float sum (and so the old answer) depends on set iteration order
+    num, den = exact_rate(Drink.MENU.tax_rate)
+    mismatches = [
+        (old, new)
+        for old, new in zip(legacy, compiled)
+        if old.get_cost() != new.get_cost()
+    ]
+    non_ties = [
+        (old, new) for old, new in mismatches
+        if 2 * (new.get_subtotal_cents() * num % den) != den
+        or abs(round(old.get_cost() * 100) - new.get_cost_cents()) != 1
+    ]
+    print(f"orders: {n}, mismatched totals: {len(mismatches)} (non-tie: {len(non_ties)})")
+
+    for label, drinks in (("legacy", legacy), ("compiled", compiled)):
+        cost = best_of(lambda: [d.get_cost() for d in drinks])
+        receipt = best_of(lambda: [d.generate_receipt() for d in drinks], repeat=3)
+        print(f"{label:>9}: get_cost {cost / n * 1e9:7.1f} ns/order, "
+              f"generate_receipt {receipt / n * 1e6:6.2f} us/order")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,61 @@
+# Promotion rules against 1 to 1000 rules: compiling them, finding the rules
+# an order matches, pricing those (RuleSet.apply), and get_cost_cents() on
+# repeat orders, which the memo answers.
+# Run with: python -m benchmarks.promotions [orders]
+import random
+import sys
+import time
+from unittest.mock import patch
+
+from Cinos import Drink
+from benchmarks._orders import best_of, random_orders, to_spec
+from promotions import Promotions
+
+
+def random_rules(n, menu, seed=0):
+    # Combos naming one to three items in each of two or three categories,
+    # as a promotions list tends to be; about one rule in twenty has hours
+    rng = random.Random(seed)
+    rules = []
+    for number in range(n):
+        when = {}
+        for category in rng.sample(menu.categories, rng.randint(2, 3)):
+            names = rng.sample(category.names, rng.randint(1, min(3, len(category.names))))
+            when[category.name] = names
+        rule = {"name": f"promo {number}", "when": when}
+        if rng.random() < 0.5:
+            rule["cents_off"] = rng.randint(10, 100)
+        else:
+            rule["percent_off"] = rng.randint(5, 50)
+        if rng.random() < 0.05:
+            rule["hours"] = sorted(rng.sample(range(25), 2))
+        rules.append(rule)
+    return rules
+
+
+def main(n=20_000):
+    menu = Drink.MENU
+    drinks = [Drink.from_spec(to_spec(o)) for o in random_orders(n)]
+    keys = [d.key() for d in drinks]
+    # the same 500 configurations over and over, as a day's orders are
+    popular = [drinks[i % 500] for i in range(n)]
+    print(f"orders: {n}")
+    t = best_of(lambda: [d.get_cost_cents() for d in drinks], repeat=3)
+    print(f"  no promotions: get_cost_cents {t / n * 1e6:6.2f} us/order")
+    for count in (1, 10, 100, 300, 1000):
+        promotions = Promotions(random_rules(count, menu))
+        start = time.perf_counter()
+        rules = promotions.compile(menu)
+        built = time.perf_counter() - start
+        matched = sum(rules.match(key).bit_count() for key in keys)
+        found = best_of(lambda: [rules.match(key) for key in keys], repeat=3)
+        priced = best_of(lambda: [rules.apply(key) for key in keys], repeat=3)
+        with patch.object(Drink, "PROMOTIONS", promotions):
+            cached = best_of(lambda: [d.get_cost_cents() for d in popular], repeat=3)
+        print(f"  {count:5d} rules ({matched / n:4.1f} match an order): compile {built * 1e3:6.1f} ms, "
+              f"match {found / n * 1e6:5.2f} us, apply {priced / n * 1e6:5.2f} us, "
+              f"repeat get_cost_cents {cached / n * 1e6:5.2f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
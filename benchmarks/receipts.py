@@ -0,0 +1,44 @@
+# Bulk receipt output: print-style generate_receipt() per order against the
+# streaming write_receipts().  Run with: python -m benchmarks.receipts [orders]
+import os
+import sys
+import time
+import tracemalloc
+
+from Cinos import Drink, write_receipts
+from benchmarks._legacy import Drink as LegacyDrink
+from benchmarks._orders import build, random_orders
+
+
+def one_by_one(drinks, out):
+    for d in drinks:
+        out.write(d.generate_receipt() + "\n")
+
+
+def run(label, fn, drinks):
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        fn(drinks, out)
+        elapsed = time.perf_counter() - start
+    sample = drinks[:50_000]
+    with open(os.devnull, "w") as out:
+        tracemalloc.start()
+        fn(sample, out)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{label:>26}: {len(drinks) / elapsed / 1e3:7.1f} k receipts/s, "
+          f"peak memory {peak / 1024:7.1f} KiB over 50k receipts")
+
+
+def main(n=500_000):
+    orders = random_orders(n)
+    legacy = build(LegacyDrink, orders)
+    drinks = build(Drink, orders)
+    print(f"orders: {n}")
+    run("legacy generate_receipt", one_by_one, legacy)
+    run("generate_receipt", one_by_one, drinks)
+    run("write_receipts", write_receipts, drinks)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
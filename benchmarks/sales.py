@@ -0,0 +1,47 @@
+# Ingest rate of SalesAggregator and the cost of a report, against today's
+# way of answering the same question: re-scan every Drink.
+# Run with: python -m benchmarks.sales [orders]
+import sys
+import time
+
+from Cinos import Drink
+from benchmarks._orders import best_of, build, random_orders
+from pricing import to_cents
+from sales import SalesAggregator
+
+
+def rescan(drinks):
+    by_base = {}
+    total = 0
+    for d in drinks:
+        cents = to_cents(d.get_cost())
+        total += cents
+        by_base[d.get_base()] = by_base.get(d.get_base(), 0) + cents
+    return total, by_base
+
+
+def ingest(drinks, start):
+    sales = SalesAggregator()
+    for i, d in enumerate(drinks):
+        sales.add_drink(d, start + i)
+    return sales
+
+
+def main(n=200_000):
+    drinks = build(Drink, random_orders(n))
+    start = time.time() - n
+    sales = ingest(drinks, start)
+    assert sales.report().total_cents == rescan(drinks)[0]
+    print(f"orders: {n}")
+    t = best_of(lambda: ingest(drinks, start), repeat=3)
+    print(f"  ingest:           {n / t / 1e3:8.0f} k orders/s")
+    t = best_of(lambda: rescan(drinks), repeat=3)
+    print(f"  re-scan report:   {t * 1e3:8.2f} ms")
+    t = best_of(sales.report, repeat=20)
+    print(f"  aggregate report: {t * 1e3:8.2f} ms")
+    t = best_of(lambda: sales.rollup(3600), repeat=5)
+    print(f"  hourly rollup:    {t * 1e3:8.2f} ms ({len(sales.rollup(3600))} windows)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,29 @@
+# OrderService throughput by pool type and worker count.
+# Run with: python -m benchmarks.service [orders] [max workers]
+import os
+import sys
+import time
+
+from benchmarks._orders import random_orders, to_spec
+from service import OrderService
+
+
+def main(n=200_000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    specs = [to_spec(calls) for calls in random_orders(n)]
+    print(f"orders: {n}, cpus: {os.cpu_count()}")
+    for mode in ("thread", "process"):
+        workers = 1
+        while workers <= max_workers:
+            service = OrderService(workers=workers, mode=mode, chunksize=256)
+            start = time.perf_counter()
+            for _ in service.run(specs):
+                pass
+            elapsed = time.perf_counter() - start
+            p99 = {stage: f"{p[99] * 1e6:.1f}us" for stage, p in service.stats.percentiles().items()}
+            print(f"  {mode:>7} x{workers:<3}: {n / elapsed / 1e3:7.1f} k orders/s, p99 {p99}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
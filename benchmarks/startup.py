@@ -0,0 +1,48 @@
+# Cold import cost of each entry point, from python -X importtime, and the
+# modules it drags in. test_startup.py holds the suite to BUDGET_US.
+# Run with: python -m benchmarks.startup [runs]
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed per entry point, in microseconds. Generous
+# enough for a loaded CI box; a regression that doubles startup trips it.
+BUDGET_US = {"Cinos": 80_000, "drink": 50_000}
+
+# Nothing the plain ordering flow uses may pull these in at import
+HEAVY = ("numpy", "fractions", "decimal", "csv", "asyncio", "concurrent", "argparse",
+         "mmap", "columnar", "service", "batch", "kiosk_async")
+
+
+def import_time(module, runs=5):
+    # Best cumulative import time of module over several fresh interpreters
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+        for line in proc.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                cumulative = int(fields[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best
+
+
+def imported_modules(module):
+    proc = subprocess.run([sys.executable, "-c", f"import sys, {module}; print(*sorted(sys.modules))"],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(proc.stdout.split())
+
+
+def main(runs=5):
+    for module, budget in BUDGET_US.items():
+        us = import_time(module, runs)
+        heavy = sorted(m for m in imported_modules(module) if m.split(".")[0] in HEAVY)
+        print(f"  import {module:<6} {us / 1000:6.1f} ms (budget {budget / 1000:.0f} ms)"
+              f"{', heavy: ' + ', '.join(heavy) if heavy else ''}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
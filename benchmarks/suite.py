@@ -0,0 +1,179 @@
+# Hot-path timings for both Drink implementations, with JSON baselines.
+#
+#   python -m benchmarks.suite run [-o results.json]     time every case
+#   python -m benchmarks.suite save                      refresh baseline.json
+#   python -m benchmarks.suite compare [--threshold 0.2] [results.json]
+#
+# compare times the cases (or reads a results file) and exits with status 1
+# when any case is slower than the baseline by more than the threshold.
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from io import StringIO
+from unittest.mock import patch
+
+import Cinos
+import drink
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Scripted sessions, the same inputs the main() tests feed in
+CINOS_SESSION = ['2', '1', '2', 'done', '1', '1', '1', '6', 'done', '2', '4', '8', 'done']
+DRINK_SESSION = ['2', '1', '2', 'done']
+
+
+def _full_cinos():
+    d = Cinos.Drink()
+    d.set_base("pokecola")
+    d.add_flavor("lime")
+    d.add_size("Mega")
+    d.add_food("ice cream")
+    d.add_topping("Chilli")
+    d.set_icecream_flavor("Chocolate")
+    d.add_icecream_topping("Cookie Dough")
+    return d
+
+
+def _full_drink():
+    d = drink.Drink()
+    d.set_base("leaf wine")
+    d.add_flavor("blueberry")
+    d.add_flavor("mint")
+    return d
+
+
+def _session(module, inputs):
+    def run():
+        with patch("builtins.input", side_effect=inputs), patch("sys.stdout", new_callable=StringIO):
+            module.main()
+    return run
+
+
+def cases():
+    # name -> (statement, globals); statements run many times each
+    c, d = _full_cinos(), _full_drink()
+    return {
+        "cinos.construct": ("Drink()", {"Drink": Cinos.Drink}),
+        "cinos.set_base": ("d.set_base('sbrite')", {"d": Cinos.Drink()}),
+        "cinos.add_flavor": ("d.add_flavor('mint')", {"d": Cinos.Drink()}),
+        "cinos.add_size": ("d.add_size('large')", {"d": Cinos.Drink()}),
+        "cinos.add_food": ("d.add_food('corndog')", {"d": Cinos.Drink()}),
+        "cinos.add_topping": ("d.add_topping('Bacon Bits')", {"d": Cinos.Drink()}),
+        "cinos.set_icecream_flavor": ("d.set_icecream_flavor('Banana')", {"d": Cinos.Drink()}),
+        "cinos.add_icecream_topping": ("d.add_icecream_topping('Pecans')", {"d": Cinos.Drink()}),
+        "cinos.get_cost": ("d.get_cost()", {"d": c}),
+        "cinos.generate_receipt": ("d.generate_receipt()", {"d": c}),
+        "cinos.str": ("str(d)", {"d": c}),
+        "cinos.repr": ("repr(d)", {"d": c}),
+        "cinos.main_session": ("run()", {"run": _session(Cinos, CINOS_SESSION)}),
+        "drink.construct": ("Drink()", {"Drink": drink.Drink}),
+        "drink.set_base": ("d.set_base('sbrite')", {"d": drink.Drink()}),
+        "drink.add_flavor": ("d.add_flavor('mint')", {"d": drink.Drink()}),
+        "drink.get_cost": ("d.get_cost()", {"d": d}),
+        "drink.generate_receipt": ("d.generate_receipt()", {"d": d}),
+        "drink.str": ("str(d)", {"d": d}),
+        "drink.repr": ("repr(d)", {"d": d}),
+        "drink.main_session": ("run()", {"run": _session(drink, DRINK_SESSION)}),
+    }
+
+
+def time_case(stmt, names, budget=0.05, repeat=9):
+    # Best of several runs, each sized to take roughly `budget` seconds
+    timer = timeit.Timer(stmt, globals=names)
+    number, _ = timer.autorange()
+    number = max(1, int(number * budget / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run_all(only=None, names=None):
+    results = {}
+    for name, (stmt, globals_) in cases().items():
+        if (only and not name.startswith(only)) or (names is not None and name not in names):
+            continue
+        results[name] = round(time_case(stmt, globals_), 1)
+    return {"machine": machine(), "ns_per_op": results}
+
+
+def machine():
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "system": platform.system(), "processor": platform.machine()}
+
+
+def regressed(current, baseline, threshold):
+    return [name for name, base in sorted(baseline["ns_per_op"].items())
+            if name in current["ns_per_op"] and current["ns_per_op"][name] / base - 1 > threshold]
+
+
+def report(current, baseline, threshold):
+    for name, base in sorted(baseline["ns_per_op"].items()):
+        now = current["ns_per_op"].get(name)
+        if now is None:
+            continue
+        change = now / base - 1
+        flag = "REGRESSED" if change > threshold else ""
+        print(f"  {name:<28} {base:10.1f} -> {now:10.1f} ns  {change:+7.1%} {flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="time every case")
+    run_p.add_argument("-o", "--output", help="write results JSON here")
+    run_p.add_argument("--only", help="only cases starting with this prefix")
+    save_p = sub.add_parser("save", help="time every case and store the baseline")
+    save_p.add_argument("--baseline", default=BASELINE)
+    cmp_p = sub.add_parser("compare", help="fail when a case is slower than the baseline")
+    cmp_p.add_argument("results", nargs="?", help="results JSON from 'run' (default: time now)")
+    cmp_p.add_argument("--baseline", default=BASELINE)
+    cmp_p.add_argument("--threshold", type=float, default=0.20,
+                       help="allowed slowdown as a fraction (default 0.20)")
+    cmp_p.add_argument("--retries", type=int, default=2,
+                       help="re-time apparently regressed cases this many times, keeping the best")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_all(args.only)
+        text = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        print(text)
+        return 0
+    if args.command == "save":
+        results = run_all()
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"saved {len(results['ns_per_op'])} cases to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.results:
+        with open(args.results) as f:
+            current = json.load(f)
+    else:
+        current = run_all()
+        # A single slow run is usually noise from elsewhere on the machine
+        for _ in range(args.retries):
+            suspects = regressed(current, baseline, args.threshold)
+            if not suspects:
+                break
+            for name, ns in run_all(names=suspects)["ns_per_op"].items():
+                current["ns_per_op"][name] = min(ns, current["ns_per_op"][name])
+    if current["machine"] != baseline["machine"]:
+        print(f"note: baseline was recorded on {baseline['machine']}, this is {current['machine']}")
+    report(current, baseline, args.threshold)
+    regressions = regressed(current, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
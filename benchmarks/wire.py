@@ -0,0 +1,58 @@
+# Moving orders between processes: the binary wire format (Drink.dumps_many /
+# loads_many, and to_bytes / from_bytes one at a time) against pickle and
+# JSON, by size and encode/decode time.
+# Run with: python -m benchmarks.wire [orders]
+import json
+import pickle
+import random
+import sys
+import time
+
+from Cinos import Drink
+
+
+def random_drinks(n, seed=0):
+    rng = random.Random(seed)
+    radices = [len(c.table) for c in Drink.MENU]
+    return [Drink.from_key([rng.randrange(r) for r in radices]) for _ in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def report(name, n, size, encode, decode):
+    print(f"  {name:24s} {size / n:6.1f} bytes/order, encode {encode / n * 1e9:6.0f} ns/order, "
+          f"decode {decode / n * 1e9:6.0f} ns/order")
+
+
+def main(n=1_000_000):
+    drinks = random_drinks(n)
+    keys = [d.key() for d in drinks]
+    print(f"orders: {n}")
+
+    data, encode = timed(lambda: Drink.dumps_many(drinks))
+    loaded, decode = timed(lambda: Drink.loads_many(data))
+    assert [d.key() for d in loaded] == keys
+    report("dumps_many/loads_many", n, len(data), encode, decode)
+    del loaded
+
+    each, encode = timed(lambda: [d.to_bytes() for d in drinks])
+    loaded, decode = timed(lambda: list(map(Drink.from_bytes, each)))
+    report("to_bytes/from_bytes", n, sum(map(len, each)), encode, decode)
+    del each, loaded
+
+    data, encode = timed(lambda: pickle.dumps(drinks, pickle.HIGHEST_PROTOCOL))
+    loaded, decode = timed(lambda: pickle.loads(data))
+    report("pickle", n, len(data), encode, decode)
+    del data, loaded
+
+    data, encode = timed(lambda: json.dumps(keys).encode())
+    loaded, decode = timed(lambda: list(map(Drink.from_key, json.loads(data))))
+    report("JSON keys", n, len(data), encode, decode)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
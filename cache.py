@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class RenderCache:
+    # Bounded LRU cache of rendered text, keyed by (kind, order key).
+    # Orders with the same configuration render the same text, so popular
+    # combinations are formatted once.  The cache is tied to the menu it was
+    # filled from and empties itself when a different menu is passed in.
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._menu = None
+        self._lock = threading.Lock()
+
+    def lookup(self, menu, kind, key, render):
+        # render() is only called on a miss
+        entry = (kind, key)
+        with self._lock:
+            if menu is not self._menu:
+                self._entries.clear()
+                self._menu = menu
+            try:
+                value = self._entries[entry]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                self._entries.move_to_end(entry)
+                return value
+            self.misses += 1
+        value = render()
+        if self.maxsize > 0:
+            with self._lock:
+                if menu is self._menu:
+                    self._entries[entry] = value
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+        return value
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._menu = None
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear_stats(self):
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,110 @@
+from itertools import count
+
+from Cinos import Drink
+
+# A ticket of several drinks. (engine.Order is already the name of one
+# drink's order, so the ticket is a Cart.)
+#
+# Each line is a snapshot of a drink as it was added: its key, its subtotal
+# after promotions and the promotions applied. The cart keeps the sum of the
+# line subtotals as lines come and go, so adding, removing and pricing are
+# O(1) whatever the number of lines, and tax is charged once on the cart's
+# subtotal rather than rounded on every drink. A menu reload reprices every
+# line once, the next time the cart is priced.
+
+
+class Cart:
+
+    def __init__(self, drinks=(), kind=Drink):
+        # kind: the Drink class whose menu, promotions and receipt format the
+        # cart uses
+        self.kind = kind
+        self._lines = {}  # line id -> (key, subtotal cents, promotions applied)
+        self._ids = count(1)
+        self._subtotal = 0
+        self._priced = kind.MENU
+        for drink in drinks:
+            self.add(drink)
+
+    def _line(self, menu, key):
+        promotions = self.kind.PROMOTIONS
+        if promotions is None:
+            return key, menu.subtotal_cents(key), ()
+        applied = promotions.apply(menu, key)
+        return key, menu.subtotal_cents(key) - sum([cents for _, cents in applied]), applied
+
+    def _menu(self):
+        menu = self.kind.MENU
+        if self._priced is not menu:
+            # reprice every line against the reloaded menu
+            lines = self._lines
+            for line_id, (key, _, _) in lines.items():
+                lines[line_id] = self._line(menu, key)
+            self._subtotal = sum([line[1] for line in lines.values()])
+            self._priced = menu
+        return menu
+
+    def add(self, drink):
+        # Adds a line for drink as it is now and returns the line's id
+        line = self._line(self._menu(), drink.key())
+        line_id = next(self._ids)
+        self._lines[line_id] = line
+        self._subtotal += line[1]
+        return line_id
+
+    def extend(self, drinks):
+        return [self.add(drink) for drink in drinks]
+
+    def remove(self, line_id):
+        # Takes a line off the ticket and returns its drink; KeyError if there
+        # is no such line
+        self._menu()
+        key, subtotal, _ = self._lines.pop(line_id)
+        self._subtotal -= subtotal
+        return self.kind.from_key(key)
+
+    def clear(self):
+        self._lines.clear()
+        self._subtotal = 0
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __contains__(self, line_id):
+        return line_id in self._lines
+
+    def __iter__(self):
+        # (line id, drink) in the order the lines were added
+        from_key = self.kind.from_key
+        for line_id, (key, _, _) in list(self._lines.items()):
+            yield line_id, from_key(key)
+
+    def keys(self):
+        return [line[0] for line in self._lines.values()]
+
+    def subtotal_cents(self):
+        self._menu()
+        return self._subtotal
+
+    def tax_cents(self):
+        return self._menu().tax.tax_cents(self._subtotal)
+
+    def total_cents(self):
+        return self._menu().tax.total_cents(self._subtotal)
+
+    def get_cost(self):
+        return self.total_cents() / 100
+
+    def generate_receipt(self):
+        # One receipt for the whole ticket: the header, each drink's item
+        # lines and promotions under its number, and a single footer
+        menu = self._menu()
+        template = self.kind.receipt_template(menu)
+        blocks = template.blocks
+        parts = [template.header]
+        for number, (key, _, applied) in enumerate(self._lines.values(), 1):
+            parts.append(f"-- Drink {number} --\n")
+            parts.extend([b[v] for b, v in zip(blocks, key)])
+            parts.extend(template.discount_lines(applied))
+        parts.append(self.kind._footer(self._subtotal, menu.tax.total_cents(self._subtotal), menu))
+        return "".join(parts)
@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+
+from money import HALF_UP
+from pricing import Category, Menu
+
+MENU_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "menus")
+
+
+def load_menu(path):
+    # JSON: {"tax_rate": 0.0725, "tax_rounding": "half_up",
+    #        "categories": [{"name": "base", "multi": false,
+    #        "items": {"water": 1.00, ...}}, ...]}
+    # CSV:  a header of category,name,price,multi and one row per item, in
+    #       menu order; a row with category "tax_rate" gives the rate as price
+    #       and one with category "tax_rounding" gives the mode as name
+    # tax_rounding is one of the money.ROUNDING modes, half_up if omitted
+    if path.endswith(".csv"):
+        return _load_csv(path)
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    _check_document(doc, path)
+    return Menu(
+        (Category(c["name"], c["items"], multi=c.get("multi", False)) for c in doc["categories"]),
+        doc.get("tax_rate", 0.0),
+        doc.get("tax_rounding", HALF_UP),
+    )
+
+
+def _check_document(doc, path):
+    # A hand-edited file with the wrong shape is a ValueError like any other
+    # bad menu, not whatever building the categories happens to trip over
+    if not isinstance(doc, dict) or not isinstance(doc.get("categories"), list):
+        raise ValueError(f"Menu file {path} needs a \"categories\" list.")
+    for c in doc["categories"]:
+        if not isinstance(c, dict) or not isinstance(c.get("name"), str) or not isinstance(c.get("items"), dict):
+            raise ValueError(f"Each category in menu file {path} needs a \"name\" and an \"items\" object.")
+        if not isinstance(c.get("multi", False), bool):
+            raise ValueError(f"\"multi\" for category '{c['name']}' in menu file {path} must be true or false.")
+
+
+def _load_csv(path):
+    import csv  # only CSV menus pay for importing it
+
+    tax_rate = 0.0
+    rounding = HALF_UP
+    categories = {}
+    multi = {}
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            if row["category"] == "tax_rate":
+                tax_rate = float(row["price"])
+                continue
+            if row["category"] == "tax_rounding":
+                rounding = row["name"]
+                continue
+            try:
+                price = float(row["price"])
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid price for {row['name']} in category '{row['category']}': "
+                                 f"{row['price']!r}.") from None
+            categories.setdefault(row["category"], {})[row["name"]] = price
+            multi[row["category"]] = row.get("multi", "").strip().lower() in ("1", "true", "yes")
+    return Menu((Category(name, items, multi=multi[name]) for name, items in categories.items()),
+                tax_rate, rounding)
+
+
+def check_compatible(old, new):
+    # Orders already in flight keep their codes across a reload, so a new
+    # menu may change prices and append items but not drop, rename or
+    # reorder what is already there
+    if [(c.name, c.multi) for c in old] != [(c.name, c.multi) for c in new]:
+        raise ValueError("Menu reload cannot add, remove or reorder categories.")
+    for before, after in zip(old, new):
+        if after.names[:len(before.names)] != before.names:
+            raise ValueError(f"Menu reload can only append items to category '{before.name}'.")
+
+
+class Catalog:
+    # The live menu for one Drink class, loaded from a file.
+    # Readers take catalog.menu once per operation; a reload builds a
+    # complete new Menu and swaps the reference, so readers never lock and
+    # never see half a menu.  Subscribers are told about each new menu.
+
+    def __init__(self, path):
+        self.path = path
+        self.menu = load_menu(path)
+        self._stamp = self._file_stamp()
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def reload(self):
+        with self._lock:
+            stamp = self._file_stamp()
+            menu = load_menu(self.path)
+            check_compatible(self.menu, menu)
+            self.menu = menu
+            self._stamp = stamp
+            for listener in self._listeners:
+                listener(menu)
+            return menu
+
+    def reload_if_changed(self):
+        if self._file_stamp() != self._stamp:
+            return self.reload()
+        return None
+
+    def watch(self, interval=5.0):
+        # Polls the file from a daemon thread; set the returned event to stop
+        stop = threading.Event()
+
+        def poll():
+            while not stop.wait(interval):
+                try:
+                    self.reload_if_changed()
+                except Exception:
+                    pass  # keep serving the last good menu, and keep watching
+
+        threading.Thread(target=poll, name="catalog-watch", daemon=True).start()
+        return stop
@@ -0,0 +1,167 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import product
+from math import prod
+
+from Cinos import Drink
+from wire import as_words
+
+# Every order is a key of one code or mask per menu category, so the whole
+# configuration space is a mixed-radix number: category i has
+# len(category.table) digits, the first category being most significant.
+# For the shipped Cinos menu that is 7*64*5*8*512*7*512, about 3.3e10
+# configurations. A table with one price per configuration would be tens of
+# gigabytes, so PriceTable stores the space split in two: subtotals for every
+# combination of the first `split` categories and for every combination of
+# the rest. A packed key is then priced with two array lookups and the menu's
+# totals table instead of one, and the file is a few megabytes.
+#
+# The table is not a faster way to price an order key: packing the key costs
+# more than the lookups save, and table.price(key) is slower than
+# Menu.subtotal_cents() plus the totals table (python -m benchmarks.configs).
+# It only wins for callers that already hold packed indexes, where
+# total_cents(index) skips the per-category work entirely.
+
+
+def radices(menu=None):
+    return tuple(len(c.table) for c in (menu or Drink.MENU))
+
+
+def count(menu=None):
+    return prod(radices(menu))
+
+
+def configurations(menu=None):
+    # Every key in packed order, generated lazily
+    return product(*map(range, radices(menu)))
+
+
+def pack(key, menu=None):
+    return _pack(key, radices(menu))
+
+
+def _pack(key, rdx):
+    if len(key) != len(rdx):
+        raise ValueError(f"Order key needs {len(rdx)} codes, got {len(key)}.")
+    index = 0
+    for value, radix in zip(key, rdx):
+        if not 0 <= value < radix:
+            raise ValueError(f"Invalid code in order key: {value}.")
+        index = index * radix + value
+    return index
+
+
+def unpack(index, menu=None):
+    key = []
+    for radix in reversed(radices(menu)):
+        index, value = divmod(index, radix)
+        key.append(value)
+    if index:
+        raise ValueError("Packed key is out of range.")
+    return tuple(reversed(key))
+
+
+def fingerprint(menu):
+    # Changes whenever any price, the item list or the tax does
+    data = repr(([c.table for c in menu.categories], menu.totals)).encode()
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _subtotals(categories, typecode):
+    # Subtotal of every combination of these categories, in packed order
+    table = array(typecode, [0])
+    for category in categories:
+        cents = category.table
+        grown = array(typecode)
+        for base in table:
+            grown.extend(map(base.__add__, cents))
+        table = grown
+    return table
+
+
+# magic+version, menu fingerprint, array typecode, split, category count,
+# then one uint32 radix per category and the length of the totals table
+HEADER = struct.Struct("<8s8scBB5x")
+MAGIC = b"CNPT\x01\x00\x00\x00"
+
+
+def build_table(path, menu=None, split=4):
+    # Writes the price table file for menu and returns its size in bytes
+    menu = menu or Drink.MENU
+    typecode = "H" if menu.totals[-1] < 1 << 16 else "I"
+    head = _subtotals(menu.categories[:split], typecode)
+    tail = _subtotals(menu.categories[split:], typecode)
+    totals = array(typecode, menu.totals)
+    if sys.byteorder != "little":
+        for a in (head, tail, totals):
+            a.byteswap()
+    rdx = radices(menu)
+    meta = HEADER.pack(MAGIC, fingerprint(menu), typecode.encode(), split, len(rdx))
+    meta += struct.pack(f"<{len(rdx) + 1}I", *rdx, len(totals))
+    meta += bytes(-len(meta) % 8)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(meta)
+        head.tofile(f)
+        tail.tofile(f)
+        totals.tofile(f)
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+class PriceTable:
+    # A built table, memory-mapped read-only. Raises ValueError if the file
+    # was built for a different menu (prices, items or tax changed).
+
+    def __init__(self, path, menu=None):
+        menu = menu or Drink.MENU
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, stamp, typecode, split, size = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a price table (or an unsupported version): {path}.")
+        if stamp != fingerprint(menu):
+            self._map.close()
+            raise ValueError(f"Price table {path} was built for a different menu.")
+        *rdx, n_totals = struct.unpack_from(f"<{size + 1}I", self._map, HEADER.size)
+        self.split = split
+        self.radices = tuple(rdx)
+        self._tail_size = prod(rdx[split:])
+        self._size = prod(rdx)
+        offset = HEADER.size + 4 * (size + 1)
+        offset += -offset % 8
+        words = as_words(memoryview(self._map)[offset:], typecode.decode())
+        head_size = prod(rdx[:split])
+        self.head = words[:head_size]
+        self.tail = words[head_size:head_size + self._tail_size]
+        self.totals = words[head_size + self._tail_size:head_size + self._tail_size + n_totals]
+
+    def __len__(self):
+        return self._size
+
+    def total_cents(self, index):
+        # Total for a packed configuration index
+        if not 0 <= index < self._size:
+            raise ValueError("Packed key is out of range.")
+        head, tail = divmod(index, self._tail_size)
+        return self.totals[self.head[head] + self.tail[tail]]
+
+    def price(self, key):
+        return self.total_cents(_pack(key, self.radices))
+
+    def close(self):
+        for view in (self.head, self.tail, self.totals):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
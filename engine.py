@@ -0,0 +1,313 @@
+from collections.abc import Mapping
+
+import lookup
+import wire
+from cache import RenderCache
+from receipts import ReceiptTemplate
+
+
+class InvalidOrder(ValueError):
+    # Every problem found in an order spec, not just the first
+    def __init__(self, errors):
+        super().__init__("; ".join(errors))
+        self.errors = tuple(errors)
+
+
+class Order:
+    # The order engine both shops' Drink classes are built on.
+    # A subclass names its catalog, receipt labels and receipt footer:
+    #
+    #   class Drink(Order, catalog=CATALOG, labels=("Base", ...), footer=f):
+    #       __slots__ = ()
+    #
+    # and supplies the public setters and text formats on top of _choose(),
+    # _add() and _selected(). Prices and tax come from the catalog's menu
+    # (see pricing.Menu and money.TaxPolicy) and follow its reloads.
+    #
+    # The order is stored as _codes: one code (single-choice categories, 0
+    # for none) or bitmask (multi-choice) per menu category, with a running
+    # subtotal in cents. _priced is the menu that subtotal was added up
+    # against.
+    __slots__ = ("_codes", "_subtotal", "_priced")
+
+    # A promotions.Promotions whose discounts come off the subtotal before
+    # tax and are listed on the receipt, or None for list prices
+    PROMOTIONS = None
+
+    def __init_subclass__(cls, catalog=None, labels=(), footer=None, nouns=None, cache_size=1024, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if catalog is None:
+            return
+        cls.CATALOG = catalog
+        cls.RECEIPT_LABELS = labels
+        # How error messages name a category when it is not just its name
+        cls._nouns = nouns or {}
+        # footer(subtotal_cents, total_cents, menu) -> the receipt's last lines
+        cls._footer = staticmethod(footer)
+        cls._receipt = None
+        # Rendered receipts and summaries of recently seen configurations
+        cls.RENDER_CACHE = RenderCache(maxsize=cache_size)
+        cls._use_menu(catalog.menu)
+        catalog.subscribe(cls._use_menu)
+
+    @classmethod
+    def _use_menu(cls, menu):
+        # Reloads can land while orders are being built on other threads, so
+        # everything derived from the menu is published with it in a single
+        # assignment, and readers take the menu (or _derived) once and work
+        # from that: (menu, empty key, order spec field -> (position in
+        # key(), category, error noun))
+        fields = {c.name: (i, c, cls._nouns.get(c.name, c.name)) for i, c in enumerate(menu.categories)}
+        cls._derived = (menu, [0] * len(menu.categories), fields)
+        cls.MENU = menu
+        cls.TAX_RATE = menu.tax_rate
+
+    @classmethod
+    def from_key(cls, key):
+        # Rebuilds an order from the codes and masks key() returned, e.g. a
+        # record read back from the order journal
+        menu = cls.MENU
+        key = tuple(key)
+        if len(key) != len(menu.categories):
+            raise ValueError(f"Order key needs {len(menu.categories)} codes, got {len(key)}.")
+        for category, value in zip(menu.categories, key):
+            if not 0 <= value < len(category.table):
+                raise ValueError(f"Invalid {category.name} code: {value}.")
+        order = cls.__new__(cls)
+        order._codes = list(key)
+        order._subtotal = menu.subtotal_cents(key)
+        order._priced = menu
+        return order
+
+    @classmethod
+    def from_spec(cls, spec):
+        # Builds an order from a spec dict keyed by MENU category name, a
+        # name for single-choice categories and a list of names for
+        # multi-choice ones (None or missing for nothing), e.g.
+        #   {"base": "sbrite", "flavor": ["lemon", "lime"], "size": "small"}
+        # Every field is checked in one pass straight against the menu's
+        # code tables, with no setter calls, and all problems are raised
+        # together as InvalidOrder.
+        if spec.__class__ is not dict and not isinstance(spec, Mapping):
+            raise InvalidOrder(["Order must be a mapping."])
+        menu, empty, fields = cls._derived
+        codes = empty.copy()
+        errors = []
+        for field, value in spec.items():
+            slot = fields.get(field)
+            if slot is None:
+                errors.append(f"Invalid order field: {field}.")
+                continue
+            if value is None:
+                continue
+            index, category, noun = slot
+            lookup = category.codes.get
+            try:
+                if not category.multi:
+                    code = lookup(value)
+                    if code is None:
+                        errors.append(f"Invalid {noun}: {value}.")
+                    else:
+                        codes[index] = code
+                    continue
+                if not isinstance(value, (list, tuple)):
+                    errors.append(f"{field} takes a list of items.")
+                    continue
+                mask = codes[index]
+                for item in value:
+                    bit = lookup(item)
+                    if bit is None:
+                        errors.append(f"Invalid {noun}: {item}.")
+                    else:
+                        mask |= bit
+                codes[index] = mask
+            except TypeError:  # an unhashable value or item
+                errors.append(f"Invalid {noun}: {value}.")
+        if errors:
+            raise InvalidOrder(errors)
+        order = cls.__new__(cls)
+        order._codes = codes
+        order._subtotal = menu.subtotal_cents(codes)
+        order._priced = menu
+        return order
+
+    @classmethod
+    def many(cls, specs):
+        # from_spec() for each spec; raises one InvalidOrder naming every bad
+        # spec by position ("order 3: Invalid base: lava.") if any are bad
+        orders = []
+        errors = []
+        from_spec = cls.from_spec
+        for number, spec in enumerate(specs):
+            try:
+                orders.append(from_spec(spec))
+            except InvalidOrder as e:
+                errors.extend(f"order {number}: {error}" for error in e.errors)
+        if errors:
+            raise InvalidOrder(errors)
+        return orders
+
+    @classmethod
+    def resolve(cls, category, text):
+        # The menu name free text typed for a MENU category stands for
+        # ("mr salt" -> "Mr.Salt", see lookup.py), or None. The setters and
+        # from_spec() take exact names only; text entry goes through here.
+        return lookup.resolve(cls.MENU[category], text)
+
+    @classmethod
+    def from_bytes(cls, data):
+        # The order to_bytes() encoded (see wire.py)
+        return cls.from_key(wire.loads(data))
+
+    @classmethod
+    def dumps_many(cls, orders):
+        # Every order's key in one buffer, loads_many() reads it back
+        return wire.dumps_many(map(cls.key, orders), len(cls.MENU.categories))
+
+    @classmethod
+    def loads_many(cls, data):
+        # The orders dumps_many() encoded, read out of data without copying
+        # it; codes are checked a category column at a time over strided
+        # views of the buffer. Each order is priced on first use, as after a
+        # menu reload, so decoding pays for no arithmetic.
+        menu = cls.MENU
+        size = len(menu.categories)
+        records = wire.records(data, size)
+        for i, category in enumerate(menu.categories):
+            if max(records[i::size], default=0) >= len(category.table):
+                raise ValueError(f"Invalid {category.name} code in batch.")
+        new = cls.__new__
+        orders = []
+        for start in range(0, len(records), size):
+            order = new(cls)
+            order._codes = records[start:start + size].tolist()
+            order._subtotal = 0
+            order._priced = None
+            orders.append(order)
+        return orders
+
+    @classmethod
+    def receipt_template(cls, menu=None):
+        # Receipt text for every menu item and total, formatted once per menu.
+        # Built on first use rather than at import, since most entry points
+        # never print a receipt, and rebuilt for each reloaded menu.
+        menu = menu or cls.MENU
+        template = cls._receipt
+        if template is None or template.menu is not menu:
+            footer = cls._footer
+            template = cls._receipt = ReceiptTemplate(
+                menu, cls.RECEIPT_LABELS, lambda subtotal, total: footer(subtotal, total, menu))
+        return template
+
+    def __init__(self):
+        menu, empty, _ = self._derived
+        self._codes = empty.copy()
+        self._subtotal = 0
+        self._priced = menu
+
+    def _choose(self, index, name):
+        # Swap a single-choice code, keeping the subtotal in step.
+        # Returns False when name is not on the menu.
+        menu = self.MENU
+        items = menu.categories[index]
+        code = items.codes.get(name)
+        if code is None:
+            return False
+        if self._priced is not menu:
+            self._reprice(menu)
+        codes = self._codes
+        self._subtotal += items.table[code] - items.table[codes[index]]
+        codes[index] = code
+        return True
+
+    def _add(self, index, name):
+        # Set an item's bit in a multi-choice mask, keeping the subtotal in step
+        menu = self.MENU
+        items = menu.categories[index]
+        bit = items.codes.get(name)
+        if bit is None:
+            return False
+        if self._priced is not menu:
+            self._reprice(menu)
+        codes = self._codes
+        if not codes[index] & bit:
+            self._subtotal += items.table[bit]
+            codes[index] |= bit
+        return True
+
+    def _reprice(self, menu):
+        # The menu was reloaded since this order was last priced
+        self._subtotal = menu.subtotal_cents(self._codes)
+        self._priced = menu
+
+    def _selected(self, index):
+        # The chosen item's name (or None), or a tuple of names for a mask
+        return self.MENU.categories[index].selections[self._codes[index]]
+
+    def key(self):
+        # The whole order as codes and masks, one per MENU category
+        return tuple(self._codes)
+
+    def to_bytes(self):
+        # 2 + 2 * categories bytes, see wire.py
+        return wire.dumps(self._codes)
+
+    def __reduce__(self):
+        # Pickles as its key, which stays valid across menu reloads
+        return self.__class__.from_key, (tuple(self._codes),)
+
+    # Cost including all selected items, promotions and tax, looked up
+    # from the subtotal
+    def get_cost(self):
+        menu = self.MENU
+        if self._priced is not menu:
+            self._reprice(menu)
+        promotions = self.PROMOTIONS
+        if promotions is None:
+            return menu.totals[self._subtotal] / 100
+        return menu.totals[self._subtotal - promotions.discount_cents(menu, tuple(self._codes))] / 100
+
+    # The same total as exact integer cents
+    def get_cost_cents(self):
+        menu = self.MENU
+        if self._priced is not menu:
+            self._reprice(menu)
+        promotions = self.PROMOTIONS
+        if promotions is None:
+            return menu.totals[self._subtotal]
+        return menu.totals[self._subtotal - promotions.discount_cents(menu, tuple(self._codes))]
+
+    # The subtotal charged: item prices less promotions, before tax
+    def get_subtotal_cents(self):
+        menu = self.MENU
+        if self._priced is not menu:
+            self._reprice(menu)
+        promotions = self.PROMOTIONS
+        if promotions is None:
+            return self._subtotal
+        return self._subtotal - promotions.discount_cents(menu, tuple(self._codes))
+
+    def _discounts(self, menu, key):
+        # ((promotion name, cents off), ...) for this order right now
+        promotions = self.PROMOTIONS
+        return () if promotions is None else promotions.apply(menu, key)
+
+    # Prints a formatted receipt of the full order
+    def generate_receipt(self):
+        key = tuple(self._codes)
+        menu = self.MENU
+        discounts = self._discounts(menu, key)
+        return self.RENDER_CACHE.lookup(menu, ("receipt", discounts) if discounts else "receipt", key,
+                                        lambda: self.receipt_template(menu).render(key, discounts))
+
+    # Text output is cached per order configuration (and promotions applied),
+    # see RENDER_CACHE; subclasses write _summary() and _debug()
+    def __str__(self):
+        key = tuple(self._codes)
+        discounts = self._discounts(self.MENU, key)
+        return self.RENDER_CACHE.lookup(self.MENU, ("str", discounts) if discounts else "str", key, self._summary)
+
+    def __repr__(self):
+        key = tuple(self._codes)
+        discounts = self._discounts(self.MENU, key)
+        return self.RENDER_CACHE.lookup(self.MENU, ("repr", discounts) if discounts else "repr", key, self._debug)
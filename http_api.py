@@ -0,0 +1,153 @@
+import argparse
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Cinos import Drink, InvalidOrder
+
+# Local HTTP ordering API. Orders are the spec dicts Drink.from_spec() takes.
+#   GET  /menu     the live menu in the menu file format, with an ETag
+#   POST /price    one order -> its subtotal, tax and total
+#   POST /receipt  one order -> its total and receipt text
+#   POST /batch    a list of orders -> one result per order, in order
+# Failed orders get {"errors": [...]}; a bad request gets status 400.
+MAX_BODY = 1 << 20
+
+
+def menu_document(menu):
+    return {
+        "tax_rate": menu.tax_rate,
+        "tax_rounding": menu.tax.rounding,
+        "categories": [{"name": c.name, "multi": c.multi, "items": dict(c.items())} for c in menu],
+    }
+
+
+_snapshot = (None, b"", "")
+
+
+def menu_snapshot(menu):
+    # (body, etag) for menu, serialised once per menu; a reload changes the
+    # Menu object and so the snapshot and its ETag
+    global _snapshot
+    cached, body, etag = _snapshot
+    if cached is not menu:
+        body = json.dumps(menu_document(menu), separators=(",", ":")).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        _snapshot = (menu, body, etag)
+    return body, etag
+
+
+def price(spec):
+    drink = Drink.from_spec(spec)
+    total = drink.get_cost_cents()
+    subtotal = drink.get_subtotal_cents()
+    return {"subtotal_cents": subtotal, "tax_cents": total - subtotal, "total_cents": total,
+            "total": total / 100}
+
+
+def receipt(spec):
+    drink = Drink.from_spec(spec)
+    return {"total": drink.get_cost(), "receipt": drink.generate_receipt()}
+
+
+def batch(specs):
+    if not isinstance(specs, list):
+        raise InvalidOrder(["A batch must be a JSON list of orders."])
+    results = []
+    for spec in specs:
+        try:
+            results.append(price(spec))
+        except InvalidOrder as e:
+            results.append({"errors": list(e.errors)})
+    return {"results": results}
+
+
+POST_ROUTES = {"/price": price, "/receipt": receipt, "/batch": batch}
+
+
+class OrderHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1, so clients keep their connection open between requests
+    protocol_version = "HTTP/1.1"
+    server_version = "CinosHTTP/1.0"
+    # Headers and body go out as separate writes; without this a reused
+    # connection waits on delayed ACKs for every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path != "/menu":
+            return self._send_json(404, {"errors": ["Not found."]})
+        body, etag = menu_snapshot(Drink.MENU)
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, body, etag)
+
+    def do_POST(self):
+        route = POST_ROUTES.get(self.path)
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            return self._send_json(411, {"errors": ["Content-Length is required."]})
+        length = int(length)
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._send_json(413, {"errors": [f"Request body is over {MAX_BODY} bytes."]})
+        data = self.rfile.read(length)
+        if route is None:
+            return self._send_json(404, {"errors": ["Not found."]})
+        try:
+            result = route(json.loads(data))
+        except ValueError as e:  # InvalidOrder, or a JSON decode error
+            errors = list(e.errors) if isinstance(e, InvalidOrder) else [f"Invalid JSON: {e}."]
+            return self._send_json(400, {"errors": errors})
+        self._send_json(200, result)
+
+    def _send_json(self, status, document):
+        self._send(status, json.dumps(document, separators=(",", ":")).encode())
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would cost more than pricing the order
+
+
+class OrderServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # socketserver's default backlog of 5 makes a burst of new keep-alive
+    # clients wait out a one second SYN retry
+    request_queue_size = 128
+
+
+def make_server(host="127.0.0.1", port=8080):
+    return OrderServer((host, port), OrderHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Cinos serve", description="Serve the ordering HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+    server = make_server(args.host, args.port)
+    print(f"serving on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
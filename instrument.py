@@ -0,0 +1,227 @@
+import bisect
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from Cinos import Drink
+
+# Methods timed by default: every setter plus pricing and the receipt
+METHODS = ("set_base", "add_flavor", "add_size", "add_food", "add_topping",
+           "set_icecream_flavor", "add_icecream_topping", "get_cost", "generate_receipt")
+
+# Histogram bucket upper bounds in seconds (Prometheus style, +Inf implied)
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+
+
+class Histogram:
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.errors = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def copy(self):
+        h = Histogram()
+        h.counts, h.total, h.count, h.errors = list(self.counts), self.total, self.count, self.errors
+        return h
+
+
+class Metrics:
+    # Call counts, error counts and latency histograms per method
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, seconds, failed=False):
+        with self._lock:
+            h = self._histograms.get(method)
+            if h is None:
+                h = self._histograms[method] = Histogram()
+            h.observe(seconds)
+            if failed:
+                h.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {method: h.copy() for method, h in self._histograms.items()}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+METRICS = Metrics()
+_originals = {}
+
+
+def _timed(cls, name, func, metrics):
+    label = f"{cls.__module__}.{cls.__qualname__}.{name}"
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            metrics.record(label, clock() - start, failed=True)
+            raise
+        metrics.record(label, clock() - start)
+        return result
+
+    return wrapper
+
+
+def enable(cls=Drink, methods=None, metrics=METRICS):
+    # Wraps the methods with timers. Nothing is wrapped until this is
+    # called, and disable() puts the original functions back, so turned off
+    # the instrumentation costs nothing at all.
+    # Methods inherited from engine.Order are wrapped on cls itself and
+    # removed again on disable, leaving the base class untouched.
+    # methods defaults to those of METHODS that cls has; named methods it
+    # lacks raise AttributeError before anything is wrapped.
+    if methods is None:
+        methods = [name for name in METHODS if callable(getattr(cls, name, None))]
+    missing = [name for name in methods if not callable(getattr(cls, name, None))]
+    if missing:
+        raise AttributeError(f"{cls.__name__} has no methods {missing}.")
+    for name in methods:
+        if (cls, name) not in _originals:
+            _originals[cls, name] = cls.__dict__.get(name)
+            setattr(cls, name, _timed(cls, name, getattr(cls, name), metrics))
+
+
+def disable():
+    while _originals:
+        (cls, name), func = _originals.popitem()
+        if func is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, func)
+
+
+def enabled(cls=Drink):
+    return any(c is cls for c, _ in _originals)
+
+
+class InMemorySink:
+    # Keeps the latest snapshot, for tests and interactive debugging
+
+    def __init__(self):
+        self.latest = {}
+
+    def emit(self, snapshot):
+        self.latest = snapshot
+
+
+class LogSink:
+    # One log line per method with its count, errors, mean and bucket counts
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("drink.metrics")
+        self.level = level
+
+    def emit(self, snapshot):
+        for method, h in sorted(snapshot.items()):
+            mean = h.total / h.count if h.count else 0.0
+            self.logger.log(self.level, "%s calls=%d errors=%d mean=%.1fus buckets=%s",
+                            method, h.count, h.errors, mean * 1e6, h.counts)
+
+
+class PrometheusFileSink:
+    # Writes the Prometheus text format to a file, replacing it atomically so
+    # a node_exporter textfile collector never reads half a file
+
+    def __init__(self, path, prefix="drink"):
+        self.path = path
+        self.prefix = prefix
+
+    def emit(self, snapshot):
+        text = render_prometheus(snapshot, self.prefix)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, self.path)
+
+
+def render_prometheus(snapshot, prefix="drink"):
+    lines = [f"# HELP {prefix}_call_seconds Time spent in Drink methods.",
+             f"# TYPE {prefix}_call_seconds histogram"]
+    errors = [f"# HELP {prefix}_errors_total Drink method calls that raised.",
+              f"# TYPE {prefix}_errors_total counter"]
+    for method, h in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS + (float("inf"),), h.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{prefix}_call_seconds_bucket{{method="{method}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_call_seconds_sum{{method="{method}"}} {h.total!r}')
+        lines.append(f'{prefix}_call_seconds_count{{method="{method}"}} {h.count}')
+        errors.append(f'{prefix}_errors_total{{method="{method}"}} {h.errors}')
+    return "\n".join(lines + errors) + "\n"
+
+
+def start_export(sink, interval=60.0, metrics=METRICS):
+    # Emits a snapshot to the sink every interval seconds from a daemon
+    # thread, and once more when the returned event is set
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            sink.emit(metrics.snapshot())
+        sink.emit(metrics.snapshot())
+
+    threading.Thread(target=loop, name="drink-metrics", daemon=True).start()
+    return stop
+
+
+@contextmanager
+def profile(sort="cumulative", limit=25):
+    # cProfile whatever runs inside the block; the report text is in
+    # result["report"] afterwards
+    result = {}
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+        result["report"] = out.getvalue()
+
+
+@contextmanager
+def trace_memory(limit=10):
+    # tracemalloc over the block; result["top"] lists the biggest allocation
+    # sites and result["peak"] the peak traced bytes
+    result = {}
+    already = tracemalloc.is_tracing()
+    if not already:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    try:
+        yield result
+    finally:
+        after = tracemalloc.take_snapshot()
+        result["peak"] = tracemalloc.get_traced_memory()[1]
+        if not already:
+            tracemalloc.stop()
+        result["top"] = after.compare_to(before, "lineno")[:limit]
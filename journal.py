@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+import threading
+import time
+
+from Cinos import Drink
+from wire import as_words
+
+# File layout: an 8 byte header (magic and format version) followed by
+# fixed-width little-endian records, one per completed order:
+#   7 x uint32  the order's codes and masks, in Drink.MENU category order
+#   uint32      subtotal in cents, as charged (after promotions)
+#   uint32      total in cents, as charged
+#   4 bytes     reserved, keeping the timestamp 8-byte aligned
+#   uint64      completion time, nanoseconds since the epoch
+# Codes are stable across menu reloads (items can only be appended), so old
+# records still decode against the live menu.
+MAGIC = b"CNJL\x01\x00\x00\x00"
+RECORD = struct.Struct("<9I4xQ")
+FIELDS = 12  # uint32 words per record
+CATEGORIES = 7
+
+
+class JournalWriter:
+    # Appends are packed into a buffer and written plus fsynced together,
+    # every `group` records or once `max_delay` seconds have passed since the
+    # first unsynced one, whichever comes first; a timer thread does the
+    # sync when no further append arrives in time. flush() forces a sync;
+    # records still buffered when the process dies are lost, nothing already
+    # synced is.
+
+    def __init__(self, path, group=256, max_delay=1.0):
+        self.path = path
+        self.group = group
+        self.max_delay = max_delay
+        self._buffer = bytearray()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._timer = None
+        self._file = open(path, "ab")
+        size = self._file.tell()
+        if size == 0:
+            self._file.write(MAGIC)
+            self._sync()
+        else:
+            try:
+                _check_header(path)
+            except ValueError:
+                self._file.close()
+                raise
+            # A crash mid-write leaves part of a record at the end; appending
+            # after it would misalign every record that follows
+            whole = len(MAGIC) + (size - len(MAGIC)) // RECORD.size * RECORD.size
+            if whole != size:
+                self._file.truncate(whole)
+                self._sync()
+
+    def append(self, drink, timestamp=None):
+        self.append_key(drink.key(), drink.get_cost_cents(), timestamp, drink.get_subtotal_cents())
+
+    def append_key(self, key, total_cents, timestamp=None, subtotal_cents=None):
+        # subtotal_cents defaults to the list price of key
+        if timestamp is None:
+            timestamp = time.time_ns()
+        if subtotal_cents is None:
+            subtotal_cents = Drink.MENU.subtotal_cents(key)
+        record = RECORD.pack(*key, subtotal_cents, total_cents, timestamp)
+        with self._lock:
+            self._buffer += record
+            self._pending += 1
+            if self._pending >= self.group:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+            self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(path):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not an order journal (or an unsupported version): {path}.")
+
+
+class Journal:
+    # Read side: the whole file mapped read-only. records() decodes in place
+    # from the mapping, columns() hands out strided memoryviews over it, and
+    # nothing is copied on little-endian machines. A torn record at the end
+    # (a crash mid-append) is ignored. Release any columns() views before
+    # close(), the mapping cannot be unmapped while they are alive.
+
+    def __init__(self, path):
+        _check_header(path)
+        size = os.path.getsize(path)
+        self._count = (size - len(MAGIC)) // RECORD.size
+        self._map = None
+        self._view = memoryview(b"")
+        if self._count:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            end = len(MAGIC) + self._count * RECORD.size
+            self._view = memoryview(self._map)[len(MAGIC):end]
+
+    def __len__(self):
+        return self._count
+
+    def records(self):
+        # (key, subtotal cents, total cents, timestamp ns) for every record,
+        # in append order
+        for record in RECORD.iter_unpack(self._view):
+            yield record[:CATEGORIES], record[CATEGORIES], record[CATEGORIES + 1], record[CATEGORIES + 2]
+
+    def drinks(self):
+        from_key = Drink.from_key
+        for record in RECORD.iter_unpack(self._view):
+            yield from_key(record[:CATEGORIES])
+
+    def columns(self, menu=None):
+        # The batch layout columnar.price_orders() takes, plus the recorded
+        # "subtotal", "total" and "timestamp" columns
+        menu = menu or Drink.MENU
+        words = as_words(self._view, "I")
+        batch = {c.name: words[i::FIELDS] for i, c in enumerate(menu.categories)}
+        batch["subtotal"] = words[CATEGORIES::FIELDS]
+        batch["total"] = words[CATEGORIES + 1::FIELDS]
+        # Each record is also whole uint64 words, the last being the timestamp
+        wide = FIELDS // 2
+        batch["timestamp"] = as_words(self._view, "Q")[wide - 1::wide]
+        return batch
+
+    def close(self):
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
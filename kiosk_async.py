@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import sys
+
+from Cinos import STEPS, Drink
+from listing import listings
+
+
+async def order_session(reader, writer):
+    # Runs one customer through the same steps as Cinos.main(). Returns the
+    # finished Drink, or None when the customer disconnects part way through.
+    drink = Drink()
+    for step, listing in zip(STEPS, listings(Drink.MENU, STEPS)):
+        writer.write(listing.text.encode() + b"\n")
+        while True:
+            writer.write(step.prompt.encode())
+            await writer.drain()
+            line = await reader.readline()
+            if not line:
+                return None
+            choice = line.decode(errors="replace").strip().lower()  # bad bytes: an invalid choice
+            if step.end_word is not None and choice == step.end_word:
+                break
+            try:
+                getattr(drink, step.setter)(listing.pick(choice))
+            except ValueError:
+                writer.write(f"{step.error}\n".encode())
+                continue
+            if not step.repeat:
+                break
+    writer.write(f"\nYour drink summary:\n{drink}\n\nReceipt:\n{drink.generate_receipt()}\n".encode())
+    await writer.drain()
+    return drink
+
+
+async def handle_client(reader, writer):
+    try:
+        await order_session(reader, writer)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8765):
+    server = await asyncio.start_server(handle_client, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+async def run_stdio():
+    # A single session on this process's stdin/stdout
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return await order_session(reader, writer)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the drink ordering flow over asyncio streams.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stdio", action="store_true", help="run one session on stdin/stdout")
+    args = parser.parse_args(argv)
+    asyncio.run(run_stdio() if args.stdio else serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
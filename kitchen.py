@@ -0,0 +1,194 @@
+import heapq
+import random
+from collections import namedtuple
+from itertools import count
+
+from Cinos import Drink
+
+# Fulfillment: how orders get made once they are placed.
+#
+# Each order is split into prep tasks, one per station whose menu category it
+# has something chosen in: the drink base is poured, the food cooked and the
+# ice cream scooped. A station works in batches of one item at a time, all
+# the french fries or all the Banana scoops that are waiting, up to max_batch, and
+# a batch takes setup + per_item * size seconds. Whenever a station worker
+# comes free it takes the item whose oldest waiting task has the earliest
+# deadline (earliest deadline first), together with every other task for the
+# same item that fits in the batch. An order is done when its last task is.
+#
+# simulate() runs the kitchen as a discrete-event simulation over a list of
+# timed arrivals, so throughput and latency under a synthetic load can be
+# measured without a kitchen.
+
+Station = namedtuple("Station", ["name", "category", "setup", "per_item", "max_batch", "workers"])
+
+STATIONS = (
+    Station("bar", "base", setup=5.0, per_item=10.0, max_batch=4, workers=2),
+    Station("grill", "food", setup=120.0, per_item=5.0, max_batch=8, workers=2),
+    Station("freezer", "icecream_flavor", setup=15.0, per_item=20.0, max_batch=6, workers=1),
+)
+
+# orders: the order ids whose task is in the batch; start and end in seconds
+Batch = namedtuple("Batch", ["station", "item", "orders", "start", "end"])
+
+Stats = namedtuple("Stats", ["orders", "makespan", "throughput", "mean_latency", "p50_latency",
+                             "p95_latency", "max_latency", "late", "batches", "mean_batch", "utilization"])
+
+
+class Kitchen:
+    # Queued prep work for every station. target is how long after it is
+    # submitted an order is due, unless submit() is given a deadline.
+
+    def __init__(self, stations=STATIONS, target=600.0, menu=None):
+        menu = menu or Drink.MENU
+        positions = {c.name: i for i, c in enumerate(menu.categories)}
+        self.stations = {s.name: s for s in stations}
+        self.target = target
+        self._menu = menu
+        # station -> (key position, {item code: task heap}, station heap)
+        self._queues = {s.name: (positions[s.category], {}, []) for s in stations}
+        self._orders = {}  # order id -> [tasks left, submitted, deadline]
+        self._ids = count(1)
+        self._seq = count()
+
+    def submit(self, drink, now, deadline=None):
+        # Queues drink's prep and returns its order id
+        key = drink.key()
+        order_id = next(self._ids)
+        if deadline is None:
+            deadline = now + self.target
+        tasks = 0
+        for position, groups, heap in self._queues.values():
+            code = key[position]
+            if not code:
+                continue
+            tasks += 1
+            group = groups.get(code)
+            if group is None:
+                group = groups[code] = []
+            heapq.heappush(group, (deadline, next(self._seq), order_id))
+            if group[0][2] == order_id:
+                # the item's most urgent task changed, so its place does too
+                heapq.heappush(heap, (deadline, group[0][1], code))
+        if tasks:
+            self._orders[order_id] = [tasks, now, deadline]
+        return order_id
+
+    def __contains__(self, order_id):
+        # Whether the order is still being made; one that needs no prep is
+        # done as soon as it is submitted
+        return order_id in self._orders
+
+    def pending(self, station=None):
+        # Tasks waiting for a station (or for all of them)
+        names = self._queues if station is None else (station,)
+        return sum(len(group) for name in names for group in self._queues[name][1].values())
+
+    def next_batch(self, station, now):
+        # The batch a free worker at station should start now, or None
+        _, groups, heap = self._queues[station]
+        while heap:
+            deadline, seq, code = heapq.heappop(heap)
+            group = groups.get(code)
+            if group and group[0][1] == seq:
+                break
+        else:
+            return None
+        spec = self.stations[station]
+        take = min(len(group), spec.max_batch)
+        orders = tuple(heapq.heappop(group)[2] for _ in range(take))
+        if group:
+            heapq.heappush(heap, (group[0][0], group[0][1], code))
+        else:
+            del groups[code]
+        name = self._menu[spec.category].selections[code]
+        return Batch(station, name, orders, now, now + spec.setup + spec.per_item * take)
+
+    def finish(self, batch):
+        # Marks batch done; returns [(order id, submitted, deadline)] for the
+        # orders it completed
+        done = []
+        for order_id in batch.orders:
+            state = self._orders[order_id]
+            state[0] -= 1
+            if not state[0]:
+                del self._orders[order_id]
+                done.append((order_id, state[1], state[2]))
+        return done
+
+
+def synthetic_arrivals(rate, hours, seed=0, menu=None):
+    # (time, drink) with Poisson arrivals at `rate` orders an hour and every
+    # category chosen with a fixed probability, oldest first
+    rng = random.Random(seed)
+    menu = menu or Drink.MENU
+    chance = {"base": 0.95, "food": 0.5, "icecream_flavor": 0.3}
+    radices = [(len(c.table), chance.get(c.name, 0.3)) for c in menu.categories]
+    now = 0.0
+    end = hours * 3600
+    arrivals = []
+    while True:
+        now += rng.expovariate(rate / 3600)
+        if now >= end:
+            return arrivals
+        key = [rng.randrange(1, r) if rng.random() < p else 0 for r, p in radices]
+        arrivals.append((now, Drink.from_key(key)))
+
+
+def simulate(arrivals, kitchen=None):
+    # Runs the kitchen over (time, drink) arrivals until every order is made
+    kitchen = kitchen or Kitchen()
+    idle = {name: spec.workers for name, spec in kitchen.stations.items()}
+    busy = dict.fromkeys(idle, 0.0)
+    batches = dict.fromkeys(idle, 0)
+    items = dict.fromkeys(idle, 0)
+    latencies = []
+    late = 0
+    events = []  # (time, seq, batch or None, drink)
+    seq = count()
+    for when, drink in arrivals:
+        heapq.heappush(events, (when, next(seq), None, drink))
+    now = 0.0
+
+    def completed(submitted, deadline):
+        nonlocal late
+        latencies.append(now - submitted)
+        late += now > deadline
+
+    while events:
+        now, _, batch, drink = heapq.heappop(events)
+        if batch is None:
+            if kitchen.submit(drink, now) not in kitchen:
+                completed(now, now)
+        else:
+            idle[batch.station] += 1
+            for _, submitted, deadline in kitchen.finish(batch):
+                completed(submitted, deadline)
+        for station in idle:
+            while idle[station]:
+                work = kitchen.next_batch(station, now)
+                if work is None:
+                    break
+                idle[station] -= 1
+                busy[station] += work.end - work.start
+                batches[station] += 1
+                items[station] += len(work.orders)
+                heapq.heappush(events, (work.end, next(seq), work, None))
+
+    latencies.sort()
+    n = len(latencies)
+    makespan = now
+    return Stats(
+        orders=n,
+        makespan=makespan,
+        throughput=n / makespan * 3600 if makespan else 0.0,
+        mean_latency=sum(latencies) / n if n else 0.0,
+        p50_latency=latencies[n // 2] if n else 0.0,
+        p95_latency=latencies[min(n - 1, n * 95 // 100)] if n else 0.0,
+        max_latency=latencies[-1] if n else 0.0,
+        late=late,
+        batches=batches,
+        mean_batch={s: items[s] / batches[s] if batches[s] else 0.0 for s in batches},
+        utilization={s: busy[s] / (makespan * kitchen.stations[s].workers) if makespan else 0.0
+                     for s in busy},
+    )
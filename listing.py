@@ -0,0 +1,69 @@
+from collections import namedtuple
+from functools import lru_cache
+
+import lookup
+
+# One step of an interactive ordering flow. setter is the name of the
+# order method a choice is passed to, looked up on the order each time so
+# wrappers installed later (instrument.enable()) are called too.
+# Steps without an end word take exactly one valid choice.  Steps with one
+# also stop when it is typed, and keep taking choices while repeat is set.
+# confirm, when given, is printed after each accepted choice with {item}
+# filled in.
+Step = namedtuple("Step", ["category", "setter", "heading", "prompt", "error",
+                           "end_word", "repeat", "confirm"],
+                  defaults=(None, False, None))
+
+
+class Listing:
+    # A category's numbered menu, formatted once, and the number -> item
+    # table that selections are read from
+
+    def __init__(self, category, heading):
+        self.category = category
+        self.items = category.names
+        self.text = "\n".join([heading] + [f"{idx}. {label}" for idx, label in enumerate(category.labels, 1)])
+
+    def choose(self, choice):
+        # The item for a typed menu number; ValueError for anything else
+        index = int(choice)
+        if not 1 <= index <= len(self.items):
+            raise ValueError(f"Invalid selection: {choice}.")
+        return self.items[index - 1]
+
+    def pick(self, choice):
+        # The item for a typed menu number or for typed text naming one
+        # ("mr salt", "whipped"), see lookup.py; ValueError for anything else
+        if choice.isdigit():
+            return self.choose(choice)
+        item = lookup.resolve(self.category, choice)
+        if item is None:
+            raise ValueError(f"Invalid selection: {choice}.")
+        return item
+
+
+@lru_cache(maxsize=16)
+def listings(menu, steps):
+    # Rebuilt only when the menu itself is replaced
+    return tuple(Listing(menu[step.category], step.heading) for step in steps)
+
+
+def run_steps(drink, menu, steps):
+    # Walks the customer through every step with input() and print()
+    for step, listing in zip(steps, listings(menu, steps)):
+        print(listing.text)
+        while True:
+            choice = input(step.prompt).strip().lower()
+            if step.end_word is not None and choice == step.end_word:
+                break
+            try:
+                item = listing.pick(choice)
+                getattr(drink, step.setter)(item)
+            except ValueError:
+                print(step.error)
+                continue
+            if step.confirm is not None:
+                print(step.confirm.format(item=item))
+            if not step.repeat:
+                break
+    return drink
@@ -0,0 +1,166 @@
+from functools import lru_cache
+
+# Free-text item lookup for kiosks: "mr salt", "whipped", "vanila" -> the
+# menu's own names ("Mr.Salt", "Whipped Cream", "Vanilla Bean").
+#
+# Text is compared in a compact form: casefolded, with everything but
+# letters and digits dropped. A category's index is built once and answers,
+# in order of preference:
+#   1. the exact compact name
+#   2. a name that alone starts with the text (at least MIN_PREFIX
+#      characters), or failing that a name with one word that does
+#      ("cream" -> "Whipped Cream"); prefixes are stored flattened, each
+#      trie node keyed by its path, so this is one dict lookup
+#   3. the name or word within a few typos of the text (optimal string
+#      alignment distance: insertions, deletions, substitutions and
+#      swapped neighbours), candidates found through shared trigrams
+# Anything matching two names equally well resolves to nothing.
+MIN_PREFIX = 2
+MIN_FUZZY = 3
+
+
+def compact(text):
+    return "".join(ch for ch in text.casefold() if ch.isalnum())
+
+
+def _words(name):
+    # Compact form of each word and of the name from each word on
+    words = [compact(w) for w in name.replace(".", " ").replace("-", " ").split()]
+    words = [w for w in words if w]
+    return words, ["".join(words[i:]) for i in range(1, len(words))]
+
+
+def _trigrams(text):
+    padded = f"^{text}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def typo_limit(length):
+    return 1 if length <= 4 else 2 if length <= 8 else 3
+
+
+def distance(a, b, limit):
+    # Optimal string alignment distance, or limit + 1 once it is certainly
+    # over limit. Only the band of cells within limit of the diagonal can
+    # stay within limit, so only those are filled in.
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    width = len(b) + 1
+    before = None
+    previous = [j if j <= limit else over for j in range(width)]
+    for i in range(1, len(a) + 1):
+        current = [over] * width
+        if i <= limit:
+            current[0] = i
+        ca = a[i - 1]
+        best = current[0]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cb = b[j - 1]
+            value = previous[j - 1] if ca == cb else previous[j - 1] + 1
+            if previous[j] < value:
+                value = previous[j] + 1
+            if current[j - 1] < value:
+                value = current[j - 1] + 1
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb and before[j - 2] < value:
+                value = before[j - 2] + 1
+            if value > over:
+                value = over
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        before, previous = previous, current
+    return previous[-1]
+
+
+class CategoryIndex:
+
+    def __init__(self, category):
+        self.category = category
+        self.exact = {}
+        self.prefixes = {}
+        self.word_prefixes = {}
+        self.terms = {}  # compact name or word -> names it stands for
+        self.grams = {}  # trigram -> terms containing it
+        for name in category.names:
+            key = compact(name)
+            words, tails = _words(name)
+            self.exact.setdefault(key, name)
+            for end in range(MIN_PREFIX, len(key) + 1):
+                self.prefixes.setdefault(key[:end], set()).add(name)
+            for tail in tails:
+                for end in range(MIN_PREFIX, len(tail) + 1):
+                    self.word_prefixes.setdefault(tail[:end], set()).add(name)
+            for term in {key, *words}:
+                self.terms.setdefault(term, set()).add(name)
+        for term in self.terms:
+            for gram in _trigrams(term):
+                self.grams.setdefault(gram, []).append(term)
+        self._cache = {}
+
+    def resolve(self, text):
+        # The menu name text stands for, or None
+        try:
+            return self._cache[text]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable
+            return None
+        name = self._resolve(text) if isinstance(text, str) else None
+        if len(self._cache) >= 4096:
+            self._cache.clear()
+        self._cache[text] = name
+        return name
+
+    def _resolve(self, text):
+        key = compact(text)
+        if not key:
+            return None
+        name = self.exact.get(key)
+        if name is not None:
+            return name
+        for table in (self.prefixes, self.word_prefixes):
+            names = table.get(key)
+            if names:
+                return next(iter(names)) if len(names) == 1 else None
+        if len(key) < MIN_FUZZY:
+            return None
+        return self._closest(key)
+
+    def _closest(self, key):
+        limit = typo_limit(len(key))
+        shared = {}
+        for gram in _trigrams(key):
+            for term in self.grams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        # Most shared trigrams first: the best match usually comes early and
+        # then bounds how far every later distance is worked out
+        candidates = sorted(shared, key=shared.__getitem__, reverse=True) if shared else self.terms
+        best = limit + 1
+        found = set()
+        for term in candidates:
+            score = distance(key, term, min(best, limit))
+            if score < best:
+                best = score
+                found = set(self.terms[term])
+            elif score == best and score <= limit:
+                found |= self.terms[term]
+        return next(iter(found)) if best <= limit and len(found) == 1 else None
+
+
+@lru_cache(maxsize=64)
+def index(category):
+    # Built on first use for each category object, so a menu reload (new
+    # Category objects) gets fresh indexes
+    return CategoryIndex(category)
+
+
+def resolve(category, text):
+    return index(category).resolve(text)
+
+
+def search(menu, text):
+    # [(category name, item name)] for every category text resolves in
+    return [(c.name, name) for c in menu.categories if (name := resolve(c, text)) is not None]
@@ -0,0 +1,87 @@
+from math import gcd
+
+# How a fractional cent of tax is rounded
+HALF_UP = "half_up"      # 14.5 -> 15, the usual sales tax rule
+HALF_EVEN = "half_even"  # 14.5 -> 14, 15.5 -> 16
+DOWN = "down"            # always in the customer's favour
+UP = "up"                # never under-collect
+
+
+def _half_up(n, d):
+    return (2 * n + d) // (2 * d)
+
+
+def _half_even(n, d):
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q & 1):
+        q += 1
+    return q
+
+
+def _down(n, d):
+    return n // d
+
+
+def _up(n, d):
+    return -(-n // d)
+
+
+# mode -> f(numerator, denominator), the rounded non-negative quotient
+ROUNDING = {HALF_UP: _half_up, HALF_EVEN: _half_even, DOWN: _down, UP: _up}
+
+
+def exact_rate(rate):
+    # 0.0725 as written in the menu, i.e. (29, 400), not the nearest binary
+    # float. Parsed by hand: fractions and decimal cost more to import than
+    # the whole menu costs to build.
+    mantissa, _, exponent = str(rate).lower().partition("e")
+    whole, _, decimals = mantissa.partition(".")
+    num, den = int(whole + decimals), 10 ** len(decimals)
+    shift = int(exponent or 0)
+    if shift >= 0:
+        num *= 10 ** shift
+    else:
+        den *= 10 ** -shift
+    common = gcd(num, den)
+    return num // common, den // common
+
+
+class TaxPolicy:
+    # A tax rate held as an exact fraction plus the rounding mode for the
+    # fractional cent; all arithmetic is on integers
+    __slots__ = ("rounding", "_num", "_den", "_round")
+
+    def __init__(self, rate, rounding=HALF_UP):
+        if rounding not in ROUNDING:
+            raise ValueError(f"Invalid tax rounding: {rounding}.")
+        set_ = object.__setattr__
+        num, den = exact_rate(rate)
+        set_(self, "rounding", rounding)
+        set_(self, "_num", num)
+        set_(self, "_den", den)
+        set_(self, "_round", ROUNDING[rounding])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Tax policy is frozen.")
+
+    @property
+    def rate(self):
+        from fractions import Fraction
+        return Fraction(self._num, self._den)
+
+    def tax_cents(self, subtotal_cents):
+        return self._round(subtotal_cents * self._num, self._den)
+
+    def total_cents(self, subtotal_cents):
+        return subtotal_cents + self.tax_cents(subtotal_cents)
+
+    def __repr__(self):
+        return f"TaxPolicy(rate={self.rate}, rounding={self.rounding})"
+
+
+def format_cents(cents):
+    # 1234 -> "12.34", exact for any number of cents
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{cents:02d}"
+
@@ -0,0 +1,107 @@
+import math
+import sys
+from types import MappingProxyType
+
+from money import HALF_UP, TaxPolicy
+
+
+def to_cents(price):
+    # Menu prices are written as dollars; everything below works in cents
+    return int(round(price * 100))
+
+
+class Category:
+    # One frozen menu category.
+    # Single-choice categories store a code: 0 means nothing was chosen and
+    # items are numbered from 1, the same numbers the menu prompts show.
+    # Multi-choice categories store a bitmask with bit i set for item i.
+    __slots__ = ("name", "multi", "names", "prices", "cents", "labels", "codes", "table", "selections")
+
+    def __init__(self, name, items, multi=False):
+        set_ = object.__setattr__
+        set_(self, "name", name)
+        set_(self, "multi", multi)
+        # Interned so lookups with literal names hit the identity fast path
+        set_(self, "names", tuple(sys.intern(n) for n in items))
+        set_(self, "prices", tuple(items.values()))
+        # A negative subtotal would index Menu.totals from the end
+        for n, p in zip(self.names, self.prices):
+            if p.__class__ not in (int, float) or not 0 <= p < math.inf:
+                raise ValueError(f"Invalid price for {n} in category '{name}': {p!r}.")
+        set_(self, "cents", tuple(to_cents(p) for p in self.prices))
+        # "name - $price" for each item, as the menus and receipts print it
+        set_(self, "labels", tuple(f"{n} - ${p:.2f}" for n, p in zip(self.names, self.prices)))
+        if multi:
+            codes = {n: 1 << i for i, n in enumerate(self.names)}
+            # Price of every possible selection, built from the mask with its
+            # lowest bit cleared so each entry costs one addition
+            table = [0] * (1 << len(self.names))
+            # Item names for every mask, in menu order, built the same way:
+            # the lowest set bit is the first item named
+            selections = [()] * len(table)
+            for mask in range(1, len(table)):
+                low = mask & -mask
+                item = low.bit_length() - 1
+                table[mask] = table[mask ^ low] + self.cents[item]
+                selections[mask] = (self.names[item],) + selections[mask ^ low]
+            set_(self, "selections", tuple(selections))
+        else:
+            codes = {n: i for i, n in enumerate(self.names, 1)}
+            table = (0,) + self.cents
+            set_(self, "selections", (None,) + self.names)
+        set_(self, "codes", MappingProxyType(codes))
+        # table[code] (or table[mask]) is the price of that selection in cents,
+        # selections[code] (or selections[mask]) is what it names
+        set_(self, "table", tuple(table))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Menu category '{self.name}' is frozen.")
+
+    def cents_of(self, name):
+        return self.table[self.codes[name]]
+
+    def items(self):
+        return zip(self.names, self.prices)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"Category(name={self.name}, items={len(self.names)}, multi={self.multi})"
+
+
+class Menu:
+    # A frozen set of categories plus the tax they are sold under.
+    # Every subtotal the menu can produce is priced once up front, so turning
+    # a subtotal into a total is a single tuple lookup.
+    __slots__ = ("categories", "tax_rate", "tax", "max_subtotal", "totals", "_by_name")
+
+    def __init__(self, categories, tax_rate=0.0, rounding=HALF_UP):
+        set_ = object.__setattr__
+        set_(self, "categories", tuple(categories))
+        set_(self, "tax_rate", tax_rate)
+        # Tax is worked out in integer cents with an explicit rounding mode
+        set_(self, "tax", TaxPolicy(tax_rate, rounding))
+        set_(self, "_by_name", MappingProxyType({c.name: c for c in self.categories}))
+        set_(self, "max_subtotal", sum(max(c.table) for c in self.categories))
+        set_(self, "totals", tuple(map(self.tax.total_cents, range(self.max_subtotal + 1))))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Menu is frozen.")
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def __iter__(self):
+        return iter(self.categories)
+
+    def subtotal_cents(self, key):
+        # key holds one code or mask per category, in category order
+        return sum(c.table[v] for c, v in zip(self.categories, key))
+
+    def total_cents(self, subtotal):
+        return self.totals[subtotal]
+
+    def __repr__(self):
+        return (f"Menu(categories={[c.name for c in self.categories]}, tax_rate={self.tax_rate}, "
+                f"rounding={self.tax.rounding})")
@@ -0,0 +1,260 @@
+import json
+import threading
+import time
+
+# Promotions are data: a list of rules, each with a name, the order
+# conditions it needs, an optional happy-hour window and one discount.
+#
+#   {"name": "Meal deal", "when": {"base": true, "size": ["large", "Mega"],
+#                                  "food": true}, "cents_off": 100}
+#   {"name": "Free toppings on Mega", "when": {"size": "Mega"}, "free": ["topping"]}
+#   {"name": "Happy hour", "hours": [15, 17], "when": {"icecream_flavor": true},
+#    "percent_off": 50, "of": ["icecream_flavor", "icecream_topping"]}
+#
+# "when" maps menu category names to a condition on that category:
+#   true / false       something / nothing chosen
+#   "name", [names]    one of these chosen (multi-choice: any one of them)
+#   {"all": [names]}   multi-choice only: every one of these chosen
+# "hours" is [start, end) in whole local hours, start != end, and may wrap
+# past midnight.
+# The discount is one of
+#   "cents_off": n     n cents, at most the amount it is taken from
+#   "percent_off": p   p percent, rounded half up to the cent
+#   "free": [names]    the full price of these categories
+# taken from the prices of the "of" categories (not allowed with "free"),
+# or the whole subtotal when "of" is not given. Every rule that matches
+# applies, in list order, until the subtotal reaches zero; tax is charged
+# on what is left.
+#
+# Rules are compiled once per menu into lookup tables: for each tested
+# category, a bitset (one bit per rule) of the rules each code or mask
+# satisfies, and the same for each hour. Matching an order is one AND per
+# tested category whatever the number of rules, and only the rules that
+# match are priced. Bulk pricing that works from menu.totals directly
+# (columnar.py, configs.py) charges list prices.
+
+DISCOUNTS = ("cents_off", "percent_off", "free")
+
+
+def load_promotions(path, **kwargs):
+    # {"promotions": [rule, ...]} or just the list
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    return Promotions(doc["promotions"] if isinstance(doc, dict) else doc, **kwargs)
+
+
+def _fail(rule, problem):
+    raise ValueError(f"Promotion {rule.get('name')!r}: {problem}.")
+
+
+def _test(rule, category, condition):
+    # The condition as a predicate over one category's code or mask
+    if condition is True:
+        return bool
+    if condition is False:
+        return lambda value: not value
+    if isinstance(condition, dict):
+        if set(condition) != {"all"} or not category.multi:
+            _fail(rule, f"{category.name} condition must be true, false, a name or a list of names")
+        names = condition["all"]
+    else:
+        names = [condition] if isinstance(condition, str) else condition
+    try:
+        codes = [category.codes[name] for name in names]
+    except (KeyError, TypeError):
+        _fail(rule, f"{category.name} condition names an item not on the menu: {condition}")
+    if isinstance(condition, dict):
+        mask = sum(codes)
+        return lambda value: value & mask == mask
+    if category.multi:
+        mask = sum(codes)
+        return lambda value: value & mask
+    codes = frozenset(codes)
+    return codes.__contains__
+
+
+def _hours(rule):
+    window = rule.get("hours")
+    if window is None:
+        return range(24)
+    try:
+        start, end = window
+    except (TypeError, ValueError):
+        start = end = None
+    # Whole hours only; start == end could mean no hours or all of them
+    if not (start.__class__ is int and end.__class__ is int and 0 <= start < 24 and 0 <= end <= 24
+            and start != end):
+        _fail(rule, f"hours must be [start, end) with whole hours 0-24 and start != end, got {window}")
+    if start < end:
+        return range(start, end)
+    return [*range(start, 24), *range(end)]
+
+
+def _discount(rule, menu):
+    # (kind, value, category positions or None for the whole subtotal)
+    kinds = [kind for kind in DISCOUNTS if kind in rule]
+    if len(kinds) != 1:
+        _fail(rule, f"needs exactly one of {', '.join(DISCOUNTS)}")
+    kind = kinds[0]
+    value = rule[kind]
+    of = rule.get("of")
+    if kind == "free":
+        if of is not None:
+            _fail(rule, "a free rule names its categories in free, not of")
+        kind, of, value = "percent_off", value, 100
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0 or (
+            kind == "percent_off" and value > 100):
+        _fail(rule, f"{kind} must be a whole number of {'percent' if kind == 'percent_off' else 'cents'}")
+    if of is None:
+        return kind, value, None
+    positions = {c.name: i for i, c in enumerate(menu.categories)}
+    if isinstance(of, str) or any(name not in positions for name in of):
+        _fail(rule, f"discount must be taken from a list of menu categories, got {of}")
+    return kind, value, tuple(positions[name] for name in of)
+
+
+class RuleSet:
+    # Promotions compiled for one menu
+
+    def __init__(self, rules, menu):
+        self.menu = menu
+        self.names = tuple(rule["name"] for rule in rules)
+        self.timed = any("hours" in rule for rule in rules)
+        everything = (1 << len(rules)) - 1
+        categories = {c.name: (i, c) for i, c in enumerate(menu.categories)}
+        admits = {}
+        self._hours = [everything] * 24
+        self._discounts = []
+        for number, rule in enumerate(rules):
+            bit = 1 << number
+            for field, condition in rule.get("when", {}).items():
+                if field not in categories:
+                    _fail(rule, f"no menu category named {field}")
+                i, category = categories[field]
+                admit = admits.get(i)
+                if admit is None:
+                    admit = admits[i] = [everything] * len(category.table)
+                test = _test(rule, category, condition)
+                for value in range(len(admit)):
+                    if not test(value):
+                        admit[value] &= ~bit
+            for hour in set(range(24)).difference(_hours(rule)):
+                self._hours[hour] &= ~bit
+            kind, value, of = _discount(rule, menu)
+            self._discounts.append((rule["name"], kind == "percent_off", value, of))
+        # Most selective first, so a miss usually stops after one lookup
+        self._checks = sorted(admits.items(), key=lambda check: sum(map(int.bit_count, check[1])))
+        self._tables = [c.table for c in menu.categories]
+
+    def match(self, key, hour=0):
+        # Bitset of the rules key satisfies, bit n for rule n
+        matched = self._hours[hour]
+        for i, admit in self._checks:
+            matched &= admit[key[i]]
+            if not matched:
+                break
+        return matched
+
+    def apply(self, key, hour=0):
+        # ((rule name, cents off), ...) for key, in rule order
+        matched = self.match(key, hour)
+        if not matched:
+            return ()
+        tables = self._tables
+        discounts = self._discounts
+        left = self.menu.subtotal_cents(key)
+        applied = []
+        while matched and left:
+            low = matched & -matched
+            matched ^= low
+            name, percent, value, of = discounts[low.bit_length() - 1]
+            if of is None:
+                amount = left
+            else:
+                amount = 0
+                for i in of:
+                    amount += tables[i][key[i]]
+            if percent:
+                amount = (amount * value + 50) // 100
+            elif value < amount:
+                amount = value
+            if amount > left:
+                amount = left
+            if amount:
+                applied.append((name, amount))
+                left -= amount
+        return tuple(applied)
+
+
+class Promotions:
+    # A list of promotion rules, compiled against whichever menu an order is
+    # priced with. clock() gives the time for "hours" windows (seconds since
+    # the epoch). Results are memoised per order key and hour, up to
+    # memo_size of them, since the same few configurations make up most
+    # orders.
+
+    def __init__(self, rules, clock=time.time, memo_size=4096):
+        rules = [dict(rule) for rule in rules]
+        for rule in rules:
+            if not isinstance(rule.get("name"), str) or not rule["name"]:
+                _fail(rule, "every rule needs a name")
+            if not isinstance(rule.get("when", {}), dict):
+                _fail(rule, "when must map category names to conditions")
+            _hours(rule)
+        self.rules = tuple(rules)
+        self.clock = clock
+        self.memo_size = memo_size
+        self._compiled = None
+        self._memo = {}
+        self._hour = (0, float("-inf"), float("-inf"))  # hour, from, until
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.rules)
+
+    def compile(self, menu):
+        # The RuleSet for menu, built once; raises ValueError if a rule names
+        # a category or item the menu does not have
+        compiled = self._compiled
+        if compiled is None or compiled.menu is not menu:
+            with self._lock:
+                compiled = self._compiled
+                if compiled is None or compiled.menu is not menu:
+                    compiled = RuleSet(self.rules, menu)
+                    self._memo = {}
+                    self._compiled = compiled
+        return compiled
+
+    def hour(self):
+        # Local hour of clock(), worked out again only when the hour changes
+        now = self.clock()
+        hour, since, until = self._hour
+        if not since <= now < until:
+            local = time.localtime(now)
+            since = now - local.tm_min * 60 - local.tm_sec - now % 1
+            hour = local.tm_hour
+            self._hour = (hour, since, since + 3600)
+        return hour
+
+    def _lookup(self, menu, key):
+        # (applied, cents off in all) for the order key right now
+        rules = self._compiled
+        if rules is None or rules.menu is not menu:
+            rules = self.compile(menu)
+        memo = self._memo
+        entry = (key, self.hour()) if rules.timed else key
+        found = memo.get(entry)
+        if found is None:
+            applied = rules.apply(key, entry[1] if rules.timed else 0)
+            found = (applied, sum([cents for _, cents in applied]))
+            if len(memo) >= self.memo_size:
+                memo.clear()
+            memo[entry] = found
+        return found
+
+    def apply(self, menu, key):
+        # ((rule name, cents off), ...) for the order key right now
+        return self._lookup(menu, key)[0]
+
+    def discount_cents(self, menu, key):
+        return self._lookup(menu, key)[1]
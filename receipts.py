@@ -0,0 +1,77 @@
+import io
+
+from money import format_cents
+
+
+class ReceiptTemplate:
+    # Every piece of a receipt, formatted once per menu.
+    # Each category gets one block per possible code or mask (the label line
+    # plus its item lines), and every reachable subtotal gets its footer, so
+    # a receipt is the header, one block per category and a footer.
+    def __init__(self, menu, labels, footer, header="======= DRINK RECEIPT ======="):
+        # labels: the receipt label for each menu category, in menu order
+        # footer: footer(subtotal_cents, total_cents) -> footer lines
+        self.menu = menu
+        self.header = header + "\n"
+        self.blocks = tuple(self._blocks(c, label) for c, label in zip(menu.categories, labels))
+        self.footers = tuple(
+            footer(subtotal, total) + "\n" for subtotal, total in enumerate(menu.totals)
+        )
+        self._encoded = {}
+
+    @staticmethod
+    def _blocks(category, label):
+        if not category.multi:
+            return (f"{label}: None\n",) + tuple(f"{label}: {item}\n" for item in category.labels)
+        lines = [f"  - {item}\n" for item in category.labels]
+        blocks = [f"{label}: None\n"]
+        for mask in range(1, len(category.table)):
+            blocks.append(f"{label}:\n" + "".join(
+                line for i, line in enumerate(lines) if mask >> i & 1
+            ))
+        return tuple(blocks)
+
+    def parts(self, key, discounts=()):
+        # discounts: ((promotion name, cents off), ...), each printed on its
+        # own line before a footer for the discounted subtotal
+        subtotal = self.menu.subtotal_cents(key) - sum([cents for _, cents in discounts])
+        return (self.header, *[b[v] for b, v in zip(self.blocks, key)], *self.discount_lines(discounts),
+                self.footers[subtotal])
+
+    @staticmethod
+    def discount_lines(discounts):
+        return [f"Promotion ({name}): -${format_cents(cents)}\n" for name, cents in discounts]
+
+    def render(self, key, discounts=()):
+        # Same text as Drink.generate_receipt(), without the trailing newline
+        return "".join(self.parts(key, discounts))[:-1]
+
+    def _fragments(self, binary):
+        if not binary:
+            return self.header, self.blocks, self.footers
+        if not self._encoded:
+            self._encoded["utf-8"] = (
+                self.header.encode(),
+                tuple(tuple(b.encode() for b in blocks) for blocks in self.blocks),
+                tuple(f.encode() for f in self.footers),
+            )
+        return self._encoded["utf-8"]
+
+    def write(self, orders, out):
+        # Streams the receipt of every order into out, each followed by a
+        # newline exactly as print(order.generate_receipt()) would.  Text
+        # streams get str, anything else (BytesIO, files opened "wb") UTF-8.
+        header, blocks, footers = self._fragments(not isinstance(out, io.TextIOBase))
+        tables = [c.table for c in self.menu.categories]
+        write = out.write
+        count = 0
+        for order in orders:
+            key = order.key()
+            write(header)
+            subtotal = 0
+            for block, table, code in zip(blocks, tables, key):
+                write(block[code])
+                subtotal += table[code]
+            write(footers[subtotal])
+            count += 1
+        return count
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import namedtuple
+
+from Cinos import Drink
+
+HOUR = 3600
+DAY = 86400
+
+# All money in integer cents. revenue_by_base sums order totals (tax
+# included) by base, so its values add up to total_cents; items maps each
+# category name to {item name: orders containing it}.
+Report = namedtuple("Report", ["orders", "subtotal_cents", "tax_cents", "total_cents",
+                               "revenue_by_base", "items", "topping_attach_rate"])
+
+
+class Tally:
+    # Running counts for one stretch of time. Orders are counted per code or
+    # mask, never per order, so adding is O(categories) and so is reporting
+    # (multi-choice masks are split into items only when a report is made).
+
+    def __init__(self, categories):
+        self.orders = 0
+        self.subtotal = 0
+        self.total = 0
+        self.by_base = {}
+        self.counts = [{} for _ in range(categories)]
+
+    def add(self, key, subtotal, total):
+        self.orders += 1
+        self.subtotal += subtotal
+        self.total += total
+        self.by_base[key[0]] = self.by_base.get(key[0], 0) + total
+        for counts, value in zip(self.counts, key):
+            counts[value] = counts.get(value, 0) + 1
+
+    def report(self, menu):
+        items = {}
+        for category, counts in zip(menu.categories, self.counts):
+            named = dict.fromkeys(category.names, 0)
+            for value, count in counts.items():
+                if value:
+                    for name in (category.selections[value] if category.multi
+                                 else (category.selections[value],)):
+                        named[name] += count
+            items[category.name] = named
+        base = menu.categories[0]
+        toppings = self.counts[menu.categories.index(menu["topping"])]
+        with_topping = self.orders - toppings.get(0, 0)
+        return Report(
+            self.orders, self.subtotal, self.total - self.subtotal, self.total,
+            {base.selections[code] or "none": cents for code, cents in self.by_base.items()},
+            items,
+            with_topping / self.orders if self.orders else 0.0,
+        )
+
+
+class SalesAggregator:
+    # Takes priced orders as they complete and keeps an all-time Tally plus
+    # one Tally per window (hourly and daily by default) that has seen sales.
+    # keep bounds how many of the most recent windows of each size are kept.
+
+    def __init__(self, windows=(HOUR, DAY), keep=None, menu=None):
+        self.windows = tuple(windows)
+        self.keep = keep
+        self._menu = menu
+        self._size = len(self.menu.categories)
+        self._all = Tally(self._size)
+        self._rollups = {w: {} for w in self.windows}
+        self._lock = threading.Lock()
+
+    @property
+    def menu(self):
+        # Item codes never change meaning across reloads, so following the
+        # live menu keeps old counts valid and picks up appended items
+        return self._menu or Drink.MENU
+
+    def add(self, key, total_cents, timestamp=None, subtotal_cents=None):
+        # One priced order: its codes, the total charged and when (seconds).
+        # subtotal_cents is what was charged before tax, after promotions;
+        # without it the order is taken to have paid list prices.
+        if timestamp is None:
+            timestamp = time.time()
+        subtotal = self.menu.subtotal_cents(key) if subtotal_cents is None else subtotal_cents
+        with self._lock:
+            self._all.add(key, subtotal, total_cents)
+            for window, tallies in self._rollups.items():
+                start = int(timestamp // window * window)
+                tally = tallies.get(start)
+                if tally is None:
+                    tally = tallies[start] = Tally(self._size)
+                    if self.keep is not None and len(tallies) > self.keep:
+                        del tallies[min(tallies)]
+                tally.add(key, subtotal, total_cents)
+
+    def add_drink(self, drink, timestamp=None):
+        self.add(drink.key(), drink.get_cost_cents(), timestamp, drink.get_subtotal_cents())
+
+    def extend(self, records):
+        # (key, subtotal cents or None, total cents, timestamp ns) tuples, as
+        # journal.Journal.records() yields them
+        for key, subtotal, total, timestamp in records:
+            self.add(key, total, timestamp / 1e9, subtotal)
+
+    def report(self):
+        with self._lock:
+            return self._all.report(self.menu)
+
+    def rollup(self, window=HOUR):
+        # [(window start in epoch seconds, Report)], oldest first
+        with self._lock:
+            return [(start, tally.report(self.menu))
+                    for start, tally in sorted(self._rollups[window].items())]
@@ -0,0 +1,113 @@
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from Cinos import Drink
+
+STAGES = ("validate", "price", "render")
+
+# An order spec holds the same choices main() collects, keyed by the
+# Drink.MENU category names; multi-choice categories take a list, e.g.
+# {"base": "sbrite", "flavor": ["lemon"], "size": "small", "topping": []}
+# See Drink.from_spec().
+
+# total is the get_cost() value; error is set instead when the spec is invalid
+OrderResult = namedtuple("OrderResult", ["total", "receipt", "error", "timings"])
+
+
+def build_drink(spec):
+    # Raises InvalidOrder (a ValueError) listing every bad field, or for a
+    # spec that is not a mapping at all
+    return Drink.from_spec(spec)
+
+
+def process_order(spec):
+    # Validate, price and render one order, timing each stage
+    start = time.perf_counter()
+    try:
+        drink = build_drink(spec)
+    except (TypeError, ValueError) as e:
+        return OrderResult(None, None, str(e), (time.perf_counter() - start, 0.0, 0.0))
+    validated = time.perf_counter()
+    total = drink.get_cost()
+    priced = time.perf_counter()
+    receipt = drink.generate_receipt()
+    rendered = time.perf_counter()
+    return OrderResult(total, receipt, None, (validated - start, priced - validated, rendered - priced))
+
+
+def _process_chunk(specs):
+    return [process_order(spec) for spec in specs]
+
+
+class LatencyStats:
+    # Per-stage latency samples in seconds
+
+    def __init__(self):
+        self.samples = {stage: [] for stage in STAGES}
+
+    def record(self, timings):
+        for stage, seconds in zip(STAGES, timings):
+            self.samples[stage].append(seconds)
+
+    def percentiles(self, points=(50, 90, 99)):
+        report = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            report[stage] = {
+                p: ordered[min(len(ordered) - 1, len(ordered) * p // 100)] if ordered else 0.0
+                for p in points
+            }
+        return report
+
+
+def drain(order_queue, sentinel=None):
+    # Reads specs from a queue.Queue until the sentinel arrives
+    while True:
+        spec = order_queue.get()
+        if spec is sentinel:
+            return
+        yield spec
+
+
+class OrderService:
+    # Headless order processing on a thread or process pool.
+    # Specs are handed to the pool in chunks; at most max_pending chunks are
+    # in flight, so a fast producer blocks instead of queueing without bound.
+    # Results come back in input order.
+
+    def __init__(self, workers=None, mode="thread", chunksize=64, max_pending=None):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Invalid mode: {mode}.")
+        self.workers = workers or os.cpu_count() or 1
+        self.mode = mode
+        self.chunksize = chunksize
+        self.max_pending = max_pending or 2 * self.workers
+        self.stats = LatencyStats()
+
+    def _executor(self):
+        if self.mode == "process":
+            return ProcessPoolExecutor(self.workers)
+        return ThreadPoolExecutor(self.workers)
+
+    def run(self, specs):
+        specs = iter(specs)
+        pending = deque()
+        with self._executor() as pool:
+            while True:
+                chunk = list(islice(specs, self.chunksize))
+                if not chunk:
+                    break
+                if len(pending) >= self.max_pending:
+                    yield from self._collect(pending.popleft())
+                pending.append(pool.submit(_process_chunk, chunk))
+            while pending:
+                yield from self._collect(pending.popleft())
+
+    def _collect(self, future):
+        results = future.result()
+        for result in results:
+            self.stats.record(result.timings)
+        return results
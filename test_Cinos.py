@@ -1,7 +1,7 @@
 from unittest.mock import patch
 import unittest
 from io import StringIO
-from Cinos import Drink, main
+from Cinos import Drink, InvalidOrder, main, write_receipts
 
 
 class TestDrink(unittest.TestCase):
@@ -81,6 +81,28 @@ class TestDrink(unittest.TestCase):
         expected = round(subtotal * 1.0725, 2)
         self.assertEqual(d.get_cost(), expected)
 
+    def test_cost_after_replacing_and_repeating_items(self):
+        d = Drink()
+        d.set_base("water")
+        d.set_base("leaf wine")
+        d.add_flavor("mint")
+        d.add_flavor("mint")
+        d.add_size("small")
+        d.add_size("large")
+        subtotal = 2.50 + 0.15 + 2.05
+        expected = round(subtotal * 1.0725, 2)
+        self.assertEqual(d.get_cost(), expected)
+
+    def test_compact_storage(self):
+        d = Drink()
+        self.assertFalse(hasattr(d, "__dict__"))
+        d.add_flavor("lime")
+        d.add_flavor("lemon")
+        d.add_flavor("lime")
+        self.assertEqual(d.get_flavors(), ["lemon", "lime"])
+        self.assertIsNone(d.get_base())
+        self.assertIsNone(d.get_size())
+
     def test_invalid_icecream_flavor_raises(self):
         d = Drink()
         with self.assertRaises(ValueError):
@@ -109,6 +131,18 @@ class TestDrink(unittest.TestCase):
         self.assertIn("Ice Cream: Chocolate", receipt)
         self.assertIn("Ice Cream Toppings:", receipt)
 
+    def test_write_receipts_matches_generate_receipt(self):
+        a = Drink()
+        a.set_base("sbrite")
+        a.add_flavor("mint")
+        a.add_topping("Bacon Bits")
+        b = Drink()
+        b.set_icecream_flavor("Banana")
+        b.add_icecream_topping("T&T's")
+        out = StringIO()
+        self.assertEqual(write_receipts([a, b], out), 2)
+        self.assertEqual(out.getvalue(), a.generate_receipt() + "\n" + b.generate_receipt() + "\n")
+
     def test_str_representation_with_icecream(self):
         d = Drink()
         d.set_base("hill fog")
@@ -131,6 +165,60 @@ class TestDrink(unittest.TestCase):
         self.assertEqual(str(d), "Drink has no base.")
 
 
+class TestFromSpec(unittest.TestCase):
+
+    def test_matches_setters(self):
+        d = Drink()
+        d.set_base("pokecola")
+        d.add_flavor("lime")
+        d.add_flavor("lemon")
+        d.add_size("Mega")
+        d.add_topping("Chilli")
+        d.set_icecream_flavor("Chocolate")
+        spec = {"base": "pokecola", "flavor": ["lime", "lemon"], "size": "Mega", "food": None,
+                "topping": ["Chilli"], "icecream_flavor": "Chocolate", "icecream_topping": []}
+        built = Drink.from_spec(spec)
+        self.assertEqual(built.key(), d.key())
+        self.assertEqual(built.get_cost(), d.get_cost())
+        self.assertEqual(built.generate_receipt(), d.generate_receipt())
+        built.add_food("corndog")
+        d.add_food("corndog")
+        self.assertEqual(built.get_cost(), d.get_cost())
+
+    def test_collects_every_error(self):
+        with self.assertRaises(InvalidOrder) as ctx:
+            Drink.from_spec({"base": "lava", "flavor": ["lime", "tar"], "garnish": "umbrella",
+                             "icecream_flavor": "Gravel", "topping": "Chilli", "size": ["small"]})
+        self.assertEqual(ctx.exception.errors, (
+            "Invalid base: lava.", "Invalid flavor: tar.", "Invalid order field: garnish.",
+            "Invalid ice cream flavor: Gravel.", "topping takes a list of items.", "Invalid size: ['small']."))
+        self.assertIsInstance(ctx.exception, ValueError)
+
+    def test_many(self):
+        drinks = Drink.many([{"base": "water"}, {"base": "sbrite", "flavor": ["mint"]}])
+        self.assertEqual([d.get_base() for d in drinks], ["water", "sbrite"])
+        with self.assertRaises(InvalidOrder) as ctx:
+            Drink.many([{"base": "water"}, {"base": "lava"}, {"size": "huge"}])
+        self.assertEqual(ctx.exception.errors, ("order 1: Invalid base: lava.", "order 2: Invalid size: huge."))
+
+    def test_spec_must_be_a_mapping(self):
+        for spec in (["base", "water"], "sbrite", None):
+            with self.assertRaises(InvalidOrder) as ctx:
+                Drink.from_spec(spec)
+            self.assertEqual(ctx.exception.errors, ("Order must be a mapping.",))
+        with self.assertRaises(InvalidOrder) as ctx:
+            Drink.many([{"base": "water"}, "sbrite", {"base": "lava"}])
+        self.assertEqual(ctx.exception.errors, ("order 1: Order must be a mapping.", "order 2: Invalid base: lava."))
+
+    def test_multi_choice_takes_list_or_tuple(self):
+        self.assertEqual(Drink.from_spec({"flavor": ("lemon", "lime")}).key(),
+                         Drink.from_spec({"flavor": ["lime", "lemon"]}).key())
+        for value in ({"lemon": 1}, {"lemon"}, "lemon", 1):
+            with self.assertRaises(InvalidOrder) as ctx:
+                Drink.from_spec({"flavor": value})
+            self.assertEqual(ctx.exception.errors, ("flavor takes a list of items.",))
+
+
 class TestMainIntegration(unittest.TestCase):
 
     @patch("builtins.input", side_effect=[
@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import batch
+from Cinos import Drink
+from _testing import random_drinks
+
+JSONL = """{"base": "sbrite", "flavor": ["lemon", "cherry"], "size": "small"}
+not json
+{"base": "lava juice"}
+
+["water"]
+{"base": "water", "food": "hotdog", "topping": ["Chilli"]}
+{"base": "sbrite", "flavor": ["lemon", "cherry"], "size": "small"}
+"""
+
+CSV = """base,flavor,size,food,topping,icecream_flavor,icecream_topping
+sbrite,lemon;cherry,small,,,,
+water,,,hotdog,Chilli,,
+water,,,gold,,,
+"""
+
+
+def cost(**choices):
+    d = Drink()
+    d.set_base(choices["base"])
+    for flavor in choices.get("flavor", []):
+        d.add_flavor(flavor)
+    if "size" in choices:
+        d.add_size(choices["size"])
+    if "food" in choices:
+        d.add_food(choices["food"])
+    for topping in choices.get("topping", []):
+        d.add_topping(topping)
+    return d
+
+
+class TestBatchRun(unittest.TestCase):
+
+    def setUp(self):
+        self.first = cost(base="sbrite", flavor=["lemon", "cherry"], size="small")
+        self.second = cost(base="water", food="hotdog", topping=["Chilli"])
+
+    def run_batch(self, text, **options):
+        out, err = io.StringIO(), io.StringIO()
+        result = batch.run(io.StringIO(text), out, err, **options)
+        return result, out.getvalue(), err.getvalue()
+
+    def test_jsonl_totals_skip_invalid_lines(self):
+        (priced, skipped), out, err = self.run_batch(JSONL)
+        self.assertEqual((priced, skipped), (3, 3))
+        self.assertEqual(out, f"1\t{self.first.get_cost():.2f}\n"
+                              f"6\t{self.second.get_cost():.2f}\n"
+                              f"7\t{self.first.get_cost():.2f}\n")
+        self.assertIn("line 2:", err)
+        self.assertIn("line 3: Invalid base: lava juice.", err)
+        self.assertIn("line 5: Order must be a mapping.", err)
+
+    def test_receipts(self):
+        _, out, _ = self.run_batch(JSONL, receipts=True)
+        first, second = self.first.generate_receipt(), self.second.generate_receipt()
+        self.assertEqual(out, f"{first}\n{second}\n{first}\n")
+
+    def test_csv(self):
+        (priced, skipped), out, err = self.run_batch(CSV, fmt="csv")
+        self.assertEqual((priced, skipped), (2, 1))
+        self.assertEqual(out, f"2\t{self.first.get_cost():.2f}\n3\t{self.second.get_cost():.2f}\n")
+        self.assertIn("line 4: Invalid food: gold.", err)
+
+    def test_csv_bad_header(self):
+        with self.assertRaises(ValueError):
+            self.run_batch("base,garnish\nwater,umbrella\n", fmt="csv")
+
+    def test_workers_keep_order(self):
+        text = JSONL * 50
+        _, serial, _ = self.run_batch(text)
+        (priced, skipped), parallel, _ = self.run_batch(text, workers=2, chunksize=16)
+        self.assertEqual((priced, skipped), (150, 150))
+        self.assertEqual(parallel, serial)
+
+
+class TestPiecePricer(unittest.TestCase):
+
+    def setUp(self):
+        self.menu = Drink.MENU
+        self.pricer = batch.PiecePricer(self.menu)
+
+    def check(self, line):
+        # The field-by-field total, which must agree with the full path
+        result = self.pricer.price(line)
+        if result is not None:
+            self.assertEqual(result, batch.price_line(line, batch.parse_jsonl))
+        return result
+
+    def test_matches_full_pricing(self):
+        for d in random_drinks(300, seed=5):
+            spec = {c.name: (list(v) if c.multi else v) for c, v in zip(self.menu, (
+                d._selected(i) for i in range(len(self.menu.categories))))}
+            line = json.dumps(spec)
+            self.assertIsNotNone(self.check(line), line)
+        self.assertEqual(self.check("{}"), f"{0:.2f}\n")
+
+    def test_other_lines_take_the_full_path(self):
+        for line in ['{"base":"water"}', '{"base": "water", "base": "sbrite"}', '{"base": "lava"}',
+                     '{"garnish": "umbrella"}', '{"flavor": "lemon"}', '{"base": "wa\\u0074er"}',
+                     '["water"]', '{"size": ["small"]}', '{"base": "water"} ']:
+            self.assertIsNone(self.check(line), line)
+
+
+class TestBatchCommand(unittest.TestCase):
+
+    def test_python_m_cinos_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.jsonl")
+            with open(path, "w") as f:
+                f.write(JSONL)
+            result = subprocess.run(
+                [sys.executable, "-m", "Cinos", "batch", path],
+                capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(batch.__file__)))
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(len(result.stdout.splitlines()), 3)
+        self.assertIn("priced 3 orders, skipped 3 invalid lines", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from benchmarks import suite
+
+
+class TestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.baseline = os.path.join(self.dir.name, "baseline.json")
+        self.results = os.path.join(self.dir.name, "results.json")
+        self.write(self.baseline, {"cinos.get_cost": 100.0, "drink.get_cost": 200.0})
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, path, timings):
+        with open(path, "w") as f:
+            json.dump({"machine": suite.machine(), "ns_per_op": timings}, f)
+
+    def compare(self):
+        with patch("sys.stdout", new_callable=StringIO):
+            return suite.main(["compare", self.results, "--baseline", self.baseline, "--threshold", "0.2"])
+
+    def test_within_threshold_passes(self):
+        self.write(self.results, {"cinos.get_cost": 115.0, "drink.get_cost": 150.0})
+        self.assertEqual(self.compare(), 0)
+
+    def test_regression_fails(self):
+        self.write(self.results, {"cinos.get_cost": 130.0, "drink.get_cost": 150.0})
+        self.assertEqual(self.compare(), 1)
+
+    def test_every_case_runs(self):
+        names = set(suite.cases())
+        for stmt, globals_ in suite.cases().values():
+            exec(stmt, dict(globals_))
+        self.assertIn("cinos.main_session", names)
+        self.assertIn("drink.main_session", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
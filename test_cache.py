@@ -0,0 +1,84 @@
+import unittest
+from cache import RenderCache
+from Cinos import Drink, RENDER_CACHE
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def setUp(self):
+        self.menu = object()
+        self.calls = 0
+
+    def render(self):
+        self.calls += 1
+        return f"text {self.calls}"
+
+    def test_hit_and_miss_counters(self):
+        cache = RenderCache(maxsize=4)
+        self.assertEqual(cache.lookup(self.menu, "str", (1, 0), self.render), "text 1")
+        self.assertEqual(cache.lookup(self.menu, "str", (1, 0), self.render), "text 1")
+        self.assertEqual(cache.lookup(self.menu, "repr", (1, 0), self.render), "text 2")
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = RenderCache(maxsize=2)
+        cache.lookup(self.menu, "str", 1, self.render)
+        cache.lookup(self.menu, "str", 2, self.render)
+        cache.lookup(self.menu, "str", 1, self.render)
+        cache.lookup(self.menu, "str", 3, self.render)
+        self.assertEqual(cache.lookup(self.menu, "str", 1, self.render), "text 1")
+        self.assertEqual(cache.lookup(self.menu, "str", 2, self.render), "text 4")
+
+    def test_new_menu_invalidates(self):
+        cache = RenderCache()
+        cache.lookup(self.menu, "str", 1, self.render)
+        self.assertEqual(cache.lookup(object(), "str", 1, self.render), "text 2")
+        self.assertEqual(cache.info().currsize, 1)
+
+    def test_resize_and_disable(self):
+        cache = RenderCache(maxsize=3)
+        for key in range(3):
+            cache.lookup(self.menu, "str", key, self.render)
+        cache.resize(1)
+        self.assertEqual(cache.info().currsize, 1)
+        cache.resize(0)
+        cache.lookup(self.menu, "str", 9, self.render)
+        cache.lookup(self.menu, "str", 9, self.render)
+        self.assertEqual(self.calls, 5)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_invalidate(self):
+        cache = RenderCache()
+        cache.lookup(self.menu, "str", 1, self.render)
+        cache.invalidate()
+        self.assertEqual(cache.info().currsize, 0)
+
+
+class TestDrinkUsesCache(unittest.TestCase):
+
+    def test_same_configuration_hits(self):
+        RENDER_CACHE.invalidate()
+        RENDER_CACHE.clear_stats()
+        drinks = []
+        for _ in range(3):
+            d = Drink()
+            d.set_base("Mr.Salt")
+            d.add_flavor("cherry")
+            drinks.append(d)
+        texts = {d.generate_receipt() for d in drinks}
+        self.assertEqual(len(texts), 1)
+        self.assertEqual(RENDER_CACHE.info().misses, 1)
+        self.assertEqual(RENDER_CACHE.info().hits, 2)
+        self.assertEqual(str(drinks[0]), "Drink with base: Mr.Salt, flavors: cherry. Total (with tax): $2.31")
+
+    def test_different_configurations_do_not_collide(self):
+        a = Drink()
+        a.set_base("water")
+        b = Drink()
+        b.set_base("sbrite")
+        self.assertNotEqual(repr(a), repr(b))
+
+
+if __name__ == "__main__":
+    unittest.main()
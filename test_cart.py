@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+from Cinos import Drink
+from _testing import order
+from cart import Cart
+from pricing import Menu
+from promotions import Promotions
+
+
+class TestCart(unittest.TestCase):
+
+    def test_empty(self):
+        cart = Cart()
+        self.assertEqual((len(cart), cart.subtotal_cents(), cart.total_cents()), (0, 0, 0))
+        self.assertTrue(cart.generate_receipt().startswith("======= DRINK RECEIPT =======\n===="))
+
+    def test_tax_is_charged_once_on_the_ticket(self):
+        # 7.25% of $2.00 is 14.5 cents, rounded up on each drink on its own
+        cart = Cart([order(base="Mr.Salt"), order(base="Mr.Salt")])
+        self.assertEqual(cart.subtotal_cents(), 400)
+        self.assertEqual(cart.tax_cents(), 29)
+        self.assertEqual(cart.total_cents(), 429)
+        self.assertEqual(cart.get_cost(), 4.29)
+        self.assertEqual(sum(d.get_cost_cents() for _, d in cart), 430)
+
+    def test_add_and_remove(self):
+        cart = Cart()
+        first = cart.add(order(base="water", size="small"))
+        second = cart.add(order(base="pokecola", flavor=["lime"]))
+        self.assertEqual(cart.subtotal_cents(), 250 + 190)
+        removed = cart.remove(first)
+        self.assertEqual(removed.key(), order(base="water", size="small").key())
+        self.assertEqual((len(cart), cart.subtotal_cents()), (1, 190))
+        self.assertNotIn(first, cart)
+        self.assertIn(second, cart)
+        with self.assertRaises(KeyError):
+            cart.remove(first)
+        third = cart.add(order(base="water"))
+        self.assertEqual([line_id for line_id, _ in cart], [second, third])
+        cart.clear()
+        self.assertEqual((len(cart), cart.total_cents()), (0, 0))
+
+    def test_lines_are_snapshots(self):
+        drink = order(base="water")
+        cart = Cart([drink])
+        drink.add_size("Mega")
+        self.assertEqual(cart.subtotal_cents(), 100)
+        self.assertEqual(cart.keys(), [order(base="water").key()])
+
+    def test_receipt(self):
+        cart = Cart([order(base="water", topping=["Chilli"]), order(base="sbrite")])
+        self.assertEqual(cart.generate_receipt(), "\n".join([
+            "======= DRINK RECEIPT =======",
+            "-- Drink 1 --",
+            "Base: water - $1.00",
+            "Flavors: None",
+            "Size: None",
+            "Food: None",
+            "Toppings:",
+            "  - Chilli - $0.60",
+            "Ice Cream: None",
+            "Ice Cream Toppings: None",
+            "-- Drink 2 --",
+            "Base: sbrite - $1.50",
+            "Flavors: None",
+            "Size: None",
+            "Food: None",
+            "Toppings: None",
+            "Ice Cream: None",
+            "Ice Cream Toppings: None",
+            "=============================",
+            "Subtotal: $3.10",
+            "Tax (7.25%): $0.22",
+            "Total (with tax): $3.32",
+            "=============================",
+        ]))
+
+    def test_promotions_apply_per_drink(self):
+        rule = {"name": "Mega deal", "when": {"size": "Mega"}, "cents_off": 50}
+        with patch.object(Drink, "PROMOTIONS", Promotions([rule])):
+            cart = Cart([order(base="water", size="Mega"), order(base="water")])
+            self.assertEqual(cart.subtotal_cents(), 315 - 50 + 100)
+            self.assertEqual(cart.generate_receipt().count("Promotion (Mega deal): -$0.50"), 1)
+
+    def test_menu_reload_reprices_lines(self):
+        cart = Cart([order(base="Mr.Salt"), order(base="Mr.Salt")])
+        menu = Drink.MENU
+        Drink._use_menu(Menu(menu.categories, 0.10))
+        try:
+            self.assertEqual(cart.total_cents(), 440)
+            cart.add(order(base="water"))
+            self.assertEqual(cart.total_cents(), 550)
+        finally:
+            Drink._use_menu(menu)
+        self.assertEqual(cart.subtotal_cents(), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
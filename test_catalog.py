@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import Cinos
+from catalog import MENU_DIR, Catalog, load_menu
+from Cinos import Drink
+from columnar import columns_from, price_orders
+
+
+def write_json(path, tax_rate, categories):
+    with open(path, "w") as f:
+        json.dump({"tax_rate": tax_rate, "categories": categories}, f)
+
+
+class TestLoadMenu(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_shipped_menus_load(self):
+        cinos = load_menu(os.path.join(MENU_DIR, "cinos.json"))
+        self.assertEqual(cinos.tax_rate, 0.0725)
+        self.assertEqual(cinos["topping"].cents_of("Chilli"), 60)
+        drink = load_menu(os.path.join(MENU_DIR, "drink.json"))
+        self.assertEqual(drink["flavor"].cents_of("blueberry"), 40)
+
+    def test_csv(self):
+        path = os.path.join(self.dir, "menu.csv")
+        with open(path, "w") as f:
+            f.write("category,name,price,multi\n"
+                    "tax_rate,,0.05,\n"
+                    "base,water,1.00,\n"
+                    "base,sbrite,1.50,\n"
+                    "flavor,lemon,0.25,true\n")
+        menu = load_menu(path)
+        self.assertEqual(menu.tax_rate, 0.05)
+        self.assertEqual(menu["base"].names, ("water", "sbrite"))
+        self.assertTrue(menu["flavor"].multi)
+        self.assertEqual(menu["base"].labels[1], "sbrite - $1.50")
+
+    def test_bad_prices_are_value_errors(self):
+        path = os.path.join(self.dir, "menu.json")
+        write_json(path, 0.0, [{"name": "base", "items": {"water": 1.0}}, {"name": "coupon", "items": {"c": -2.0}}])
+        with self.assertRaises(ValueError):
+            load_menu(path)
+        path = os.path.join(self.dir, "menu.csv")
+        with open(path, "w") as f:
+            f.write("category,name,price,multi\nbase,water,free,\n")
+        with self.assertRaises(ValueError):
+            load_menu(path)
+
+    def test_bad_shape_is_value_error(self):
+        path = os.path.join(self.dir, "menu.json")
+        for doc in ([], {"categories": {}}, {"categories": [["base"]]},
+                    {"categories": [{"name": "base", "items": ["water"]}]},
+                    {"categories": [{"items": {"water": 1.0}}]},
+                    {"categories": [{"name": "base", "items": {"water": 1.0}, "multi": "no"}]}):
+            with open(path, "w") as f:
+                json.dump(doc, f)
+            with self.assertRaises(ValueError, msg=doc):
+                load_menu(path)
+
+
+class TestCatalogReload(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "menu.json")
+        write_json(self.path, 0.0, [{"name": "base", "items": {"water": 1.00}}])
+        self.catalog = Catalog(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_reload_swaps_menu_and_notifies(self):
+        seen = []
+        self.catalog.subscribe(seen.append)
+        old = self.catalog.menu
+        write_json(self.path, 0.0, [{"name": "base", "items": {"water": 1.25, "sbrite": 1.50}}])
+        new = self.catalog.reload()
+        self.assertIsNot(new, old)
+        self.assertIs(self.catalog.menu, new)
+        self.assertEqual(seen, [new])
+        self.assertEqual(old["base"].cents_of("water"), 100)
+        self.assertEqual(new["base"].cents_of("water"), 125)
+
+    def test_reload_if_changed(self):
+        self.assertIsNone(self.catalog.reload_if_changed())
+        write_json(self.path, 0.0, [{"name": "base", "items": {"water": 2.00}}])
+        self.assertIsNotNone(self.catalog.reload_if_changed())
+
+    def test_watch_survives_a_bad_edit(self):
+        stop = self.catalog.watch(interval=0.01)
+        self.addCleanup(stop.set)
+        with open(self.path, "w") as f:
+            json.dump({"categories": [{"name": "base", "items": ["water"]}]}, f)
+        os.utime(self.path, ns=(1, 1))
+        time.sleep(0.1)
+        self.assertEqual(self.catalog.menu["base"].cents_of("water"), 100)
+        write_json(self.path, 0.0, [{"name": "base", "items": {"water": 1.25}}])
+        os.utime(self.path, ns=(2, 2))
+        deadline = time.monotonic() + 5
+        while self.catalog.menu["base"].cents_of("water") != 125 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.catalog.menu["base"].cents_of("water"), 125)
+
+    def test_incompatible_reload_keeps_old_menu(self):
+        old = self.catalog.menu
+        write_json(self.path, 0.0, [{"name": "base", "items": {"sbrite": 1.50}}])
+        with self.assertRaises(ValueError):
+            self.catalog.reload()
+        write_json(self.path, 0.0, [{"name": "size", "items": {"water": 1.00}}])
+        with self.assertRaises(ValueError):
+            self.catalog.reload()
+        self.assertIs(self.catalog.menu, old)
+
+
+class TestDrinkFollowsCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.original = Cinos.CATALOG.path
+        with open(self.original) as f:
+            self.doc = json.load(f)
+
+    def tearDown(self):
+        Cinos.CATALOG.path = self.original
+        Cinos.CATALOG.reload()
+        shutil.rmtree(self.dir)
+
+    def test_price_change_reprices_open_orders(self):
+        d = Drink()
+        d.set_base("water")
+        d.add_flavor("lemon")
+        self.assertEqual(d.get_cost(), round(1.15 * 1.0725, 2))
+        self.doc["categories"][0]["items"]["water"] = 2.00
+        path = os.path.join(self.dir, "cinos.json")
+        with open(path, "w") as f:
+            json.dump(self.doc, f)
+        Cinos.CATALOG.path = path
+        Cinos.CATALOG.reload()
+        self.assertEqual(d.get_cost(), round(2.15 * 1.0725, 2))
+        d.add_flavor("lime")
+        self.assertEqual(d.get_cost(), round(2.30 * 1.0725, 2))
+        self.assertIn("Base: water - $2.00", d.generate_receipt())
+        self.assertIs(Drink._derived[0], Drink.MENU)
+        self.assertEqual(Drink.from_spec({"base": "water"}).get_cost(), round(2.00 * 1.0725, 2))
+
+    def test_batch_pricing_follows_reload(self):
+        self.doc["categories"][0]["items"]["water"] = 2.00
+        path = os.path.join(self.dir, "cinos.json")
+        with open(path, "w") as f:
+            json.dump(self.doc, f)
+        Cinos.CATALOG.path = path
+        Cinos.CATALOG.reload()
+        d = Drink()
+        d.set_base("water")
+        self.assertEqual(list(price_orders(columns_from([d]))["total"]), [d.get_cost_cents()])
+
+
+if __name__ == "__main__":
+    unittest.main()
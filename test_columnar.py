@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+import columnar
+from Cinos import Drink
+from _testing import random_drinks
+from columnar import columns_from, price_orders
+
+
+class TestPriceOrders(unittest.TestCase):
+
+    def check_matches_drink(self):
+        drinks = random_drinks(500)
+        priced = price_orders(columns_from(drinks))
+        for d, subtotal, tax, total in zip(drinks, priced["subtotal"], priced["tax"], priced["total"]):
+            self.assertEqual(total / 100, d.get_cost())
+            self.assertEqual(subtotal + tax, total)
+
+    def test_matches_drink_get_cost(self):
+        self.check_matches_drink()
+
+    def test_pure_python_path(self):
+        with patch.object(columnar, "np", None):
+            self.check_matches_drink()
+
+    def test_columns(self):
+        d = Drink()
+        d.set_base("water")
+        d.add_flavor("lemon")
+        d.add_flavor("lime")
+        batch = columns_from([d])
+        self.assertEqual(batch["base"], [1])
+        self.assertEqual(batch["flavor"], [0b100001])
+        self.assertEqual(list(price_orders(batch)["subtotal"]), [130])
+
+    def test_empty_batch(self):
+        self.assertEqual(len(price_orders(columns_from([]))["total"]), 0)
+
+    def test_invalid_code_raises(self):
+        batch = columns_from(random_drinks(3))
+        batch["size"] = [1, 5, 2]
+        with self.assertRaises(ValueError):
+            price_orders(batch)
+        batch["size"] = [1, -1, 2]
+        with self.assertRaises(ValueError):
+            price_orders(batch)
+
+    def test_ragged_columns_raise(self):
+        batch = columns_from(random_drinks(3))
+        batch["food"] = [1]
+        with self.assertRaises(ValueError):
+            price_orders(batch)
+
+
+if __name__ == "__main__":
+    unittest.main()
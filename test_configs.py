@@ -0,0 +1,77 @@
+import os
+import random
+import tempfile
+import unittest
+from itertools import islice
+import configs
+from Cinos import Drink
+from pricing import Category, Menu
+
+
+class TestConfigurations(unittest.TestCase):
+
+    def test_count_and_order(self):
+        self.assertEqual(configs.count(), 7 * 64 * 5 * 8 * 512 * 7 * 512)
+        first = list(islice(configs.configurations(), 3))
+        self.assertEqual(first, [(0,) * 7, (0,) * 6 + (1,), (0,) * 6 + (2,)])
+
+    def test_pack_round_trip(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            key = tuple(rng.randrange(r) for r in configs.radices())
+            self.assertEqual(configs.unpack(configs.pack(key)), key)
+        self.assertEqual(configs.pack((0,) * 6 + (1,)), 1)
+        with self.assertRaises(ValueError):
+            configs.pack((7, 0, 0, 0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            configs.unpack(configs.count())
+
+    def test_small_menu_enumerates_fully(self):
+        menu = Menu((Category("base", {"water": 1.00, "tea": 2.00}),
+                     Category("flavor", {"lemon": 0.15, "lime": 0.25}, multi=True)), 0.0725)
+        keys = list(configs.configurations(menu))
+        self.assertEqual(len(keys), configs.count(menu))
+        self.assertEqual([configs.pack(k, menu) for k in keys], list(range(12)))
+
+
+class TestPriceTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "prices.bin")
+        cls.size = configs.build_table(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_prices_match_drink(self):
+        rng = random.Random(6)
+        menu = Drink.MENU
+        with configs.PriceTable(self.path) as table:
+            self.assertEqual(len(table), configs.count())
+            for _ in range(2000):
+                key = tuple(rng.randrange(r) for r in configs.radices())
+                expected = Drink.from_key(key).get_cost_cents()
+                self.assertEqual(table.price(key), expected)
+                self.assertEqual(table.total_cents(configs.pack(key, menu)), expected)
+
+    def test_index_out_of_range(self):
+        with configs.PriceTable(self.path) as table:
+            self.assertEqual(table.total_cents(len(table) - 1), table.price(configs.unpack(len(table) - 1)))
+            for index in (-1, -len(table), len(table)):
+                with self.assertRaises(ValueError):
+                    table.total_cents(index)
+
+    def test_file_is_small(self):
+        self.assertLess(self.size, 8 << 20)
+
+    def test_rejects_other_menu(self):
+        menu = Menu(Drink.MENU.categories, 0.08)
+        with self.assertRaises(ValueError):
+            configs.PriceTable(self.path, menu)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+from catalog import Catalog
+from engine import Order
+
+
+def write_menu(path, tax_rate, bases):
+    with open(path, "w") as f:
+        json.dump({"tax_rate": tax_rate, "categories": [
+            {"name": "base", "items": bases},
+            {"name": "extra", "multi": True, "items": {"ice": 0.10, "lemon": 0.25}},
+        ]}, f)
+
+
+class TestOrderEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "menu.json")
+        write_menu(self.path, 0.10, {"tea": 2.00, "coffee": 2.50})
+        self.catalog = Catalog(self.path)
+
+        class Cup(Order, catalog=self.catalog, labels=("Cup", "Extras"),
+                  footer=lambda subtotal, total, menu: f"Pay: {total}"):
+            __slots__ = ()
+
+            def set_base(self, name):
+                if not self._choose(0, name):
+                    raise ValueError(name)
+
+            def add_extra(self, name):
+                if not self._add(1, name):
+                    raise ValueError(name)
+
+            def _summary(self):
+                return f"cup of {self._selected(0)}"
+
+            def _debug(self):
+                return f"Cup{self.key()}"
+
+        self.Cup = Cup
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_profile_prices_and_renders(self):
+        cup = self.Cup()
+        cup.set_base("tea")
+        cup.set_base("coffee")
+        cup.add_extra("lemon")
+        cup.add_extra("lemon")
+        self.assertEqual(cup.key(), (2, 0b10))
+        self.assertEqual(cup.get_cost_cents(), 303)
+        self.assertEqual(cup.generate_receipt(),
+                         "======= DRINK RECEIPT =======\nCup: coffee - $2.50\nExtras:\n  - lemon - $0.25\nPay: 303")
+        self.assertEqual((str(cup), repr(cup)), ("cup of coffee", "Cup(2, 2)"))
+        self.assertFalse(hasattr(cup, "__dict__"))
+        with self.assertRaises(ValueError):
+            cup.set_base("milk")
+
+    def test_follows_catalog_reload(self):
+        cup = self.Cup()
+        cup.set_base("tea")
+        receipt = cup.generate_receipt()
+        write_menu(self.path, 0.0, {"tea": 1.00, "coffee": 2.50, "cocoa": 3.00})
+        self.catalog.reload()
+        self.assertEqual(cup.get_cost(), 1.00)
+        self.assertNotEqual(cup.generate_receipt(), receipt)
+        cup.set_base("cocoa")
+        self.assertEqual(self.Cup.from_key(cup.key()).get_cost_cents(), 300)
+
+    def test_profiles_are_separate(self):
+        import Cinos
+        import drink
+        self.assertIsNot(Cinos.Drink.RENDER_CACHE, drink.Drink.RENDER_CACHE)
+        self.assertIsNot(Cinos.Drink.MENU, self.Cup.MENU)
+        self.assertEqual(len(drink.Drink().key()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
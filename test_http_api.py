@@ -0,0 +1,80 @@
+import http.client
+import json
+import threading
+import unittest
+from Cinos import Drink
+from http_api import make_server
+
+ORDER = {"base": "pokecola", "flavor": ["lime"], "size": "Mega", "topping": ["Chilli"]}
+
+
+class TestHttpApi(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = make_server(port=0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.conn = http.client.HTTPConnection(*self.server.server_address, timeout=5)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def request(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode() if body is not None else None
+        self.conn.request(method, path, data, headers or {})
+        response = self.conn.getresponse()
+        payload = response.read()
+        return response, json.loads(payload) if payload else None
+
+    def expected(self):
+        return Drink.from_spec(ORDER)
+
+    def test_price_and_receipt_reuse_connection(self):
+        response, result = self.request("POST", "/price", ORDER)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(result["total"], self.expected().get_cost())
+        self.assertEqual(result["subtotal_cents"] + result["tax_cents"], result["total_cents"])
+        sock = self.conn.sock
+        response, result = self.request("POST", "/receipt", ORDER)
+        self.assertIs(self.conn.sock, sock)  # same keep-alive connection
+        self.assertEqual(result["receipt"], self.expected().generate_receipt())
+
+    def test_batch(self):
+        response, result = self.request("POST", "/batch", [ORDER, {"base": "lava"}, "junk"])
+        self.assertEqual(response.status, 200)
+        first, second, third = result["results"]
+        self.assertEqual(first["total_cents"], self.expected().get_cost_cents())
+        self.assertEqual(second, {"errors": ["Invalid base: lava."]})
+        self.assertEqual(third, {"errors": ["Order must be a mapping."]})
+
+    def test_bad_requests(self):
+        response, result = self.request("POST", "/price", {"base": "lava", "garnish": "umbrella"})
+        self.assertEqual(response.status, 400)
+        self.assertEqual(result["errors"], ["Invalid base: lava.", "Invalid order field: garnish."])
+        self.conn.request("POST", "/price", b"{not json")
+        response = self.conn.getresponse()
+        self.assertEqual(response.status, 400)
+        self.assertIn("Invalid JSON", json.loads(response.read())["errors"][0])
+        response, _ = self.request("GET", "/nowhere")
+        self.assertEqual(response.status, 404)
+
+    def test_menu_etag(self):
+        response, menu = self.request("GET", "/menu")
+        self.assertEqual(response.status, 200)
+        etag = response.getheader("ETag")
+        self.assertEqual([c["name"] for c in menu["categories"]], [c.name for c in Drink.MENU])
+        self.assertEqual(menu["categories"][0]["items"]["water"], 1.00)
+        response, body = self.request("GET", "/menu", headers={"If-None-Match": etag})
+        self.assertEqual((response.status, body), (304, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
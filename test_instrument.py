@@ -0,0 +1,135 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import Cinos
+import drink
+import instrument
+from Cinos import Drink
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = instrument.Metrics()
+
+    def tearDown(self):
+        instrument.disable()
+
+    def order(self):
+        d = Drink()
+        d.set_base("sbrite")
+        d.add_flavor("lime")
+        d.add_size("large")
+        return d
+
+    def test_disabled_leaves_methods_untouched(self):
+        original = Drink.get_cost, Drink.set_base
+        instrument.enable(metrics=self.metrics)
+        self.assertIsNot(Drink.get_cost, original[0])
+        self.assertTrue(instrument.enabled())
+        instrument.disable()
+        self.assertEqual((Drink.get_cost, Drink.set_base), original)
+        self.assertNotIn("get_cost", Drink.__dict__)
+        self.assertFalse(instrument.enabled())
+
+    def test_counts_calls_and_errors(self):
+        instrument.enable(metrics=self.metrics)
+        d = self.order()
+        cost = d.get_cost()
+        d.generate_receipt()
+        with self.assertRaises(ValueError):
+            d.set_base("milk")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["Cinos.Drink.set_base"].count, 2)
+        self.assertEqual(snapshot["Cinos.Drink.set_base"].errors, 1)
+        self.assertEqual(snapshot["Cinos.Drink.get_cost"].count, 1)
+        self.assertEqual(sum(snapshot["Cinos.Drink.get_cost"].counts), 1)
+        self.assertEqual(snapshot["Cinos.Drink.generate_receipt"].count, 1)
+        instrument.disable()
+        self.assertEqual(self.order().get_cost(), cost)
+
+    def test_enable_checks_methods_first(self):
+        original = drink.Drink.set_base
+        with self.assertRaises(AttributeError):
+            instrument.enable(drink.Drink, ["set_base", "add_size"], metrics=self.metrics)
+        self.assertFalse(instrument.enabled(drink.Drink))
+        self.assertIs(drink.Drink.set_base, original)
+        instrument.enable(drink.Drink, metrics=self.metrics)
+        d = drink.Drink()
+        d.set_base("sbrite")
+        d.get_cost()
+        instrument.disable()
+        self.assertEqual(sorted(self.metrics.snapshot()), ["drink.Drink.get_cost", "drink.Drink.set_base"])
+        self.assertFalse(instrument.enabled(drink.Drink))
+
+    def test_same_named_classes_kept_apart(self):
+        instrument.enable(metrics=self.metrics)
+        instrument.enable(drink.Drink, metrics=self.metrics)
+        Drink().set_base("water")
+        drink.Drink().set_base("water")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["Cinos.Drink.set_base"].count, 1)
+        self.assertEqual(snapshot["drink.Drink.set_base"].count, 1)
+
+    def test_interactive_session_times_setters(self):
+        instrument.enable(metrics=self.metrics)
+        choices = ["2", "1", "done", "1", "1", "6", "done", "2", "4", "done"]
+        with patch("builtins.input", side_effect=choices), patch("sys.stdout", new_callable=io.StringIO):
+            Cinos.main()
+        snapshot = self.metrics.snapshot()
+        for method, calls in (("set_base", 1), ("add_flavor", 1), ("add_size", 1), ("add_food", 1),
+                              ("add_topping", 1), ("set_icecream_flavor", 1), ("add_icecream_topping", 1),
+                              ("generate_receipt", 1)):
+            self.assertEqual(snapshot[f"Cinos.Drink.{method}"].count, calls, method)
+
+    def test_enable_twice_does_not_double_wrap(self):
+        instrument.enable(metrics=self.metrics)
+        instrument.enable(metrics=self.metrics)
+        self.order().get_cost()
+        self.assertEqual(self.metrics.snapshot()["Cinos.Drink.get_cost"].count, 1)
+
+    def test_prometheus_file_sink(self):
+        instrument.enable(metrics=self.metrics)
+        self.order().get_cost()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "drink.prom")
+            instrument.PrometheusFileSink(path).emit(self.metrics.snapshot())
+            with open(path) as f:
+                text = f.read()
+            self.assertEqual(os.listdir(tmp), ["drink.prom"])
+        self.assertIn("# TYPE drink_call_seconds histogram", text)
+        self.assertIn('drink_call_seconds_bucket{method="Cinos.Drink.get_cost",le="+Inf"} 1', text)
+        self.assertIn('drink_call_seconds_count{method="Cinos.Drink.set_base"} 1', text)
+        self.assertIn('drink_errors_total{method="Cinos.Drink.add_flavor"} 0', text)
+
+    def test_log_and_memory_sinks(self):
+        instrument.enable(metrics=self.metrics)
+        self.order()
+        sink = instrument.InMemorySink()
+        stop = instrument.start_export(sink, interval=60, metrics=self.metrics)
+        stop.set()
+        for _ in range(100):
+            if sink.latest:
+                break
+            time.sleep(0.01)
+        self.assertEqual(sink.latest["Cinos.Drink.add_size"].count, 1)
+        with self.assertLogs("drink.metrics") as logs:
+            instrument.LogSink().emit(self.metrics.snapshot())
+        self.assertTrue(any("Cinos.Drink.add_flavor calls=1 errors=0" in line for line in logs.output))
+
+    def test_profile_and_trace_memory(self):
+        with instrument.profile() as result:
+            self.order().generate_receipt()
+        self.assertIn("generate_receipt", result["report"])
+        with instrument.trace_memory() as result:
+            drinks = [self.order() for _ in range(100)]
+        self.assertGreater(result["peak"], 0)
+        self.assertTrue(result["top"])
+        self.assertEqual(len(drinks), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
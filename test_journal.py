@@ -0,0 +1,115 @@
+import os
+import tempfile
+import time
+import unittest
+from columnar import price_orders
+from Cinos import Drink
+from journal import MAGIC, RECORD, Journal, JournalWriter
+
+
+def make_drink(base, *toppings):
+    d = Drink()
+    d.set_base(base)
+    d.add_size("large")
+    for topping in toppings:
+        d.add_topping(topping)
+    return d
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "orders.journal")
+        self.drinks = [make_drink("sbrite", "Chilli"), make_drink("water"),
+                       make_drink("pokecola", "Bacon Bits", "Chilli")]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, **kwargs):
+        with JournalWriter(self.path, **kwargs) as writer:
+            for i, d in enumerate(self.drinks):
+                writer.append(d, timestamp=1_000 + i)
+
+    def test_round_trip(self):
+        self.write()
+        with Journal(self.path) as journal:
+            self.assertEqual(len(journal), 3)
+            records = list(journal.records())
+            replayed = list(journal.drinks())
+        self.assertEqual([r[0] for r in records], [d.key() for d in self.drinks])
+        self.assertEqual([r[1] for r in records], [d.get_subtotal_cents() for d in self.drinks])
+        self.assertEqual([r[2] for r in records], [round(d.get_cost() * 100) for d in self.drinks])
+        self.assertEqual([r[3] for r in records], [1_000, 1_001, 1_002])
+        self.assertEqual([d.generate_receipt() for d in replayed],
+                         [d.generate_receipt() for d in self.drinks])
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 3 * RECORD.size)
+
+    def test_columns_reprice_in_place(self):
+        self.write()
+        journal = Journal(self.path)
+        columns = journal.columns()
+        self.assertEqual(list(price_orders(columns)["total"]), list(columns["total"]))
+        self.assertEqual(list(columns["timestamp"]), [1_000, 1_001, 1_002])
+        self.assertEqual(list(columns["base"]), [d.key()[0] for d in self.drinks])
+        del columns
+        journal.close()
+
+    def test_group_commit(self):
+        writer = JournalWriter(self.path, group=2, max_delay=60)
+        writer.append(self.drinks[0])
+        self.assertEqual(len(Journal(self.path)), 0)
+        writer.append(self.drinks[1])
+        self.assertEqual(len(Journal(self.path)), 2)
+        writer.append(self.drinks[2])
+        writer.flush()
+        self.assertEqual(len(Journal(self.path)), 3)
+        writer.close()
+
+    def test_max_delay_syncs_without_another_append(self):
+        writer = JournalWriter(self.path, group=100, max_delay=0.05)
+        writer.append(self.drinks[0])
+        self.assertEqual(len(Journal(self.path)), 0)
+        time.sleep(0.5)
+        self.assertEqual(len(Journal(self.path)), 1)
+        writer.close()
+
+    def test_append_after_torn_tail(self):
+        self.write()
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02\x03")  # half-written record after a crash
+        self.write()
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 6 * RECORD.size)
+        with Journal(self.path) as journal:
+            records = list(journal.records())
+        self.assertEqual([r[0] for r in records], [d.key() for d in self.drinks] * 2)
+        self.assertEqual([r[3] for r in records], [1_000, 1_001, 1_002] * 2)
+
+    def test_append_to_existing_and_torn_tail(self):
+        self.write()
+        self.write()
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02\x03")  # half-written record after a crash
+        with Journal(self.path) as journal:
+            self.assertEqual(len(journal), 6)
+            self.assertEqual(len(list(journal.drinks())), 6)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a journal")
+        with self.assertRaises(ValueError):
+            Journal(self.path)
+        with self.assertRaises(ValueError):
+            JournalWriter(self.path)
+
+    def test_from_key_validates(self):
+        with self.assertRaises(ValueError):
+            Drink.from_key((99, 0, 0, 0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            Drink.from_key((1, 0))
+        self.assertEqual(Drink.from_key(self.drinks[2].key()).get_cost(), self.drinks[2].get_cost())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+from kiosk_async import handle_client
+
+SCRIPT = ['2', '1', '2', 'done', '1', '1', '1', '6', 'done', '2', '4', '8', 'done']
+
+
+class TestOrderSession(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def order(self, lines, prefix=b""):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(prefix + "".join(line + "\n" for line in lines).encode())
+        await writer.drain()
+        writer.write_eof()
+        output = (await reader.read()).decode()
+        writer.close()
+        return output
+
+    async def test_full_session(self):
+        output = await self.order(SCRIPT)
+        self.assertIn("Drink with base: sbrite", output)
+        self.assertIn("Food: hotdog - $2.30", output)
+        self.assertIn("Chilli - $0.60", output)
+        self.assertIn("Ice Cream: Chocolate - $3.00", output)
+        self.assertIn("Cookie Dough - $1.00", output)
+        self.assertIn("Total (with tax): $11.48", output)
+
+    async def test_invalid_choices_reprompt(self):
+        output = await self.order(['0', 'x', '7'] + SCRIPT)
+        self.assertEqual(output.count("Invalid selection. Try again."), 3)
+        self.assertIn("Drink with base: sbrite", output)
+
+    async def test_invalid_utf8_reprompts(self):
+        output = await self.order(SCRIPT, prefix=b"\xff\xfe2\n")
+        self.assertEqual(output.count("Invalid selection. Try again."), 1)
+        self.assertIn("Total (with tax): $11.48", output)
+
+    async def test_disconnect_mid_session(self):
+        output = await self.order(['2', '1'])
+        self.assertNotIn("DRINK RECEIPT", output)
+
+    async def test_concurrent_sessions(self):
+        outputs = await asyncio.gather(*(self.order(SCRIPT) for _ in range(20)))
+        self.assertTrue(all("DRINK RECEIPT" in o for o in outputs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from _testing import order
+from kitchen import STATIONS, Kitchen, Station, simulate, synthetic_arrivals
+
+BAR = (Station("bar", "base", setup=0.0, per_item=10.0, max_batch=2, workers=1),)
+
+
+class TestKitchen(unittest.TestCase):
+
+    def setUp(self):
+        self.kitchen = Kitchen(STATIONS)
+
+    def test_same_item_is_batched(self):
+        ids = [self.kitchen.submit(order(food="french fries"), now=t) for t in range(3)]
+        self.kitchen.submit(order(food="hotdog"), now=5)
+        batch = self.kitchen.next_batch("grill", now=10)
+        self.assertEqual((batch.item, batch.orders), ("french fries", tuple(ids)))
+        self.assertEqual(batch.end, 10 + 120 + 3 * 5)
+        self.assertEqual(self.kitchen.next_batch("grill", now=10).item, "hotdog")
+        self.assertIsNone(self.kitchen.next_batch("grill", now=10))
+
+    def test_earliest_deadline_first(self):
+        self.kitchen.submit(order(icecream_flavor="Banana"), now=0, deadline=500)
+        self.kitchen.submit(order(icecream_flavor="Chocolate"), now=1, deadline=100)
+        self.kitchen.submit(order(icecream_flavor="Banana"), now=2, deadline=50)
+        self.assertEqual(self.kitchen.next_batch("freezer", now=3).item, "Banana")
+        self.assertEqual(self.kitchen.next_batch("freezer", now=3).item, "Chocolate")
+
+    def test_max_batch(self):
+        kitchen = Kitchen(BAR)
+        for t in range(5):
+            kitchen.submit(order(base="water"), now=t)
+        self.assertEqual([len(kitchen.next_batch("bar", now=5).orders) for _ in range(3)], [2, 2, 1])
+        self.assertEqual(kitchen.pending(), 0)
+
+    def test_order_is_done_after_every_station(self):
+        order_id = self.kitchen.submit(order(base="water", food="hotdog"), now=0)
+        self.assertEqual(self.kitchen.pending(), 2)
+        self.assertEqual(self.kitchen.finish(self.kitchen.next_batch("bar", now=0)), [])
+        self.assertIn(order_id, self.kitchen)
+        done = self.kitchen.finish(self.kitchen.next_batch("grill", now=0))
+        self.assertEqual(done, [(order_id, 0, 600.0)])
+        self.assertNotIn(order_id, self.kitchen)
+        self.assertNotIn(self.kitchen.submit(order(topping=["Chilli"]), now=0), self.kitchen)
+
+
+class TestSimulate(unittest.TestCase):
+
+    def test_timeline(self):
+        # A at 0 is poured alone, B and C wait and are poured together at 10
+        arrivals = [(0.0, order(base="water")), (1.0, order(base="water")), (2.0, order(base="water"))]
+        stats = simulate(arrivals, Kitchen(BAR, target=20))
+        self.assertEqual((stats.orders, stats.makespan), (3, 30.0))
+        self.assertEqual((stats.p50_latency, stats.max_latency), (28.0, 29.0))
+        self.assertAlmostEqual(stats.mean_latency, (10 + 29 + 28) / 3)
+        self.assertEqual(stats.late, 2)
+        self.assertEqual((stats.batches, stats.mean_batch), ({"bar": 2}, {"bar": 1.5}))
+        self.assertEqual(stats.utilization, {"bar": 1.0})
+
+    def test_synthetic_load(self):
+        arrivals = synthetic_arrivals(rate=120, hours=1, seed=3)
+        self.assertEqual(arrivals, sorted(arrivals, key=lambda a: a[0]))
+        self.assertEqual([d.key() for _, d in arrivals], [d.key() for _, d in synthetic_arrivals(120, 1, seed=3)])
+        batched = simulate(arrivals)
+        one_at_a_time = simulate(arrivals, Kitchen([s._replace(max_batch=1) for s in STATIONS]))
+        self.assertEqual(batched.orders, len(arrivals))
+        self.assertGreater(batched.mean_batch["grill"], 1)
+        self.assertLess(batched.mean_latency, one_at_a_time.mean_latency)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from listing import Listing, Step, listings, run_steps
+from pricing import Category, Menu
+
+MENU = Menu((
+    Category("base", {"water": 1.00, "sbrite": 1.50}),
+    Category("flavor", {"lemon": 0.25, "cherry": 0.30}, multi=True),
+))
+
+
+class Order:
+
+    def __init__(self):
+        self.base = None
+        self.flavors = []
+
+    def set_base(self, base):
+        self.base = base
+
+    def add_flavor(self, flavor):
+        self.flavors.append(flavor)
+
+
+STEPS = (
+    Step("base", "set_base", "Pick a base:", "Base: ", "Bad base."),
+    Step("flavor", "add_flavor", "Pick flavors:", "Flavor: ", "Bad flavor.", "done",
+         repeat=True, confirm="Added {item}"),
+)
+
+
+class TestListing(unittest.TestCase):
+
+    def test_text_is_formatted_once(self):
+        listing = Listing(MENU["base"], "Pick a base:")
+        self.assertEqual(listing.text, "Pick a base:\n1. water - $1.00\n2. sbrite - $1.50")
+
+    def test_choose(self):
+        listing = Listing(MENU["flavor"], "Pick flavors:")
+        self.assertEqual(listing.choose("2"), "cherry")
+        for bad in ("0", "3", "-1", "cherry", ""):
+            with self.assertRaises(ValueError):
+                listing.choose(bad)
+
+    def test_pick_takes_numbers_or_names(self):
+        listing = Listing(MENU["flavor"], "Pick flavors:")
+        self.assertEqual(listing.pick("2"), "cherry")
+        self.assertEqual(listing.pick("CHERY"), "cherry")
+        self.assertEqual(listing.pick("lem"), "lemon")
+        for bad in ("0", "-1", "grape", ""):
+            with self.assertRaises(ValueError):
+                listing.pick(bad)
+
+    def test_listings_cached_per_menu(self):
+        self.assertIs(listings(MENU, STEPS), listings(MENU, STEPS))
+
+
+class TestRunSteps(unittest.TestCase):
+
+    @patch("builtins.input", side_effect=["x", "2", "1", "7", "2", "done"])
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_walks_every_step(self, mock_stdout, mock_input):
+        order = run_steps(Order(), MENU, STEPS)
+        self.assertEqual(order.base, "sbrite")
+        self.assertEqual(order.flavors, ["lemon", "cherry"])
+        self.assertEqual(mock_stdout.getvalue(), "\n".join([
+            "Pick a base:", "1. water - $1.00", "2. sbrite - $1.50",
+            "Bad base.",
+            "Pick flavors:", "1. lemon - $0.25", "2. cherry - $0.30",
+            "Added lemon", "Bad flavor.", "Added cherry",
+        ]) + "\n")
+
+    @patch("builtins.input", side_effect=["Sbrite", "lemons", "done"])
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_typed_names(self, mock_stdout, mock_input):
+        order = run_steps(Order(), MENU, STEPS)
+        self.assertEqual((order.base, order.flavors), ("sbrite", ["lemon"]))
+        self.assertIn("Added lemon", mock_stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
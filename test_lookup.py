@@ -0,0 +1,84 @@
+import unittest
+from Cinos import Drink
+from lookup import compact, distance, index, resolve, search
+from pricing import Category
+
+
+class TestLookup(unittest.TestCase):
+
+    def setUp(self):
+        self.menu = Drink.MENU
+
+    def resolve(self, category, text):
+        return resolve(self.menu[category], text)
+
+    def test_compact(self):
+        self.assertEqual(compact(" Mr. Salt "), "mrsalt")
+        self.assertEqual(compact("T&T's"), "tts")
+
+    def test_exact_ignores_case_and_punctuation(self):
+        self.assertEqual(self.resolve("base", "mr salt"), "Mr.Salt")
+        self.assertEqual(self.resolve("icecream_flavor", "smore"), "S'more")
+        self.assertEqual(self.resolve("food", "Ice Cream"), "ice cream")
+
+    def test_prefixes(self):
+        self.assertEqual(self.resolve("base", "poke"), "pokecola")
+        self.assertEqual(self.resolve("icecream_flavor", "choc"), "Chocolate")  # not Mint Chocolate Chip
+        self.assertEqual(self.resolve("topping", "whipped"), "Whipped Cream")
+        self.assertEqual(self.resolve("food", "fries"), "french fries")  # a later word
+        self.assertIsNone(self.resolve("topping", "sauce"))  # Caramel or Chocolate Sauce
+        self.assertIsNone(self.resolve("base", "w"))  # too short to guess from
+
+    def test_typos(self):
+        self.assertEqual(self.resolve("base", "watr"), "water")
+        self.assertEqual(self.resolve("base", "pokecloa"), "pokecola")  # swapped letters
+        self.assertEqual(self.resolve("icecream_flavor", "vanila"), "Vanilla Bean")
+        self.assertEqual(self.resolve("topping", "chery"), "Cherry")
+
+    def test_no_match(self):
+        for category, text in [("base", "lava"), ("food", "lava fries"), ("size", "extra grande"),
+                               ("icecream_topping", "sprinkles"), ("base", ""), ("base", None),
+                               ("base", ["water"])]:
+            with self.subTest(text=text):
+                self.assertIsNone(self.resolve(category, text))
+
+    def test_search_every_category(self):
+        self.assertEqual(search(self.menu, "cherry"),
+                         [("flavor", "cherry"), ("topping", "Cherry"), ("icecream_topping", "Cherry")])
+
+    def test_distance(self):
+        self.assertEqual(distance("kitten", "sitting", 5), 3)
+        self.assertEqual(distance("abcd", "abdc", 5), 1)
+        self.assertEqual(distance("abc", "xyzxyz", 1), 2)
+
+    def test_index_per_category(self):
+        category = Category("base", {"tea": 2.0})
+        self.assertIs(index(category), index(category))
+        self.assertIsNot(index(category), index(Category("base", {"tea": 2.0})))
+
+
+class TestSetters(unittest.TestCase):
+
+    def test_setters_take_exact_names_only(self):
+        d = Drink()
+        with self.assertRaisesRegex(ValueError, "Invalid base: Water."):
+            d.set_base("Water")
+        with self.assertRaisesRegex(ValueError, "Invalid topping: whiped cream."):
+            d.add_topping("whiped cream")
+        self.assertEqual(d.key(), Drink().key())
+
+    def test_resolve_then_set(self):
+        typed = {"base": "mr salt", "flavor": "LIME", "size": "mega", "food": "fries",
+                 "topping": "whiped cream", "icecream_flavor": "vanila", "icecream_topping": "tts"}
+        resolved = {field: Drink.resolve(field, text) for field, text in typed.items()}
+        self.assertEqual(resolved, {"base": "Mr.Salt", "flavor": "lime", "size": "Mega", "food": "french fries",
+                                    "topping": "Whipped Cream", "icecream_flavor": "Vanilla Bean",
+                                    "icecream_topping": "T&T's"})
+        self.assertIsNone(Drink.resolve("topping", "sauce"))
+        d = Drink()
+        d.set_base(resolved["base"])
+        d.add_topping(resolved["topping"])
+        self.assertEqual(d.key(), Drink.from_spec({"base": "Mr.Salt", "topping": ["Whipped Cream"]}).key())
+
+if __name__ == '__main__':
+    unittest.main()
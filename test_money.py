@@ -0,0 +1,55 @@
+import unittest
+from fractions import Fraction
+from money import DOWN, HALF_EVEN, HALF_UP, UP, TaxPolicy, format_cents
+from Cinos import Drink, sum_totals
+
+
+class TestTaxPolicy(unittest.TestCase):
+
+    def test_rate_is_exact(self):
+        self.assertEqual(TaxPolicy(0.0725).rate, Fraction(29, 400))
+
+    def test_rounding_modes_on_a_half_cent(self):
+        # 7.25% of $6.00 is 43.5 cents
+        self.assertEqual(TaxPolicy(0.0725, HALF_UP).tax_cents(600), 44)
+        self.assertEqual(TaxPolicy(0.0725, HALF_EVEN).tax_cents(600), 44)
+        self.assertEqual(TaxPolicy(0.0725, HALF_EVEN).tax_cents(200), 14)
+        self.assertEqual(TaxPolicy(0.0725, DOWN).tax_cents(600), 43)
+        self.assertEqual(TaxPolicy(0.0725, UP).tax_cents(601), 44)
+        self.assertEqual(TaxPolicy(0.0725).total_cents(600), 644)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            TaxPolicy(0.0725, "bankers")
+
+    def test_format_cents(self):
+        self.assertEqual(format_cents(241), "2.41")
+        self.assertEqual(format_cents(5), "0.05")
+        self.assertEqual(format_cents(-1234), "-12.34")
+
+
+class TestDrinkMoney(unittest.TestCase):
+
+    def drink(self, base, size):
+        d = Drink()
+        d.set_base(base)
+        d.add_size(size)
+        return d
+
+    def test_receipt_footer_adds_up(self):
+        d = self.drink("pokecola", "Mega")
+        d.add_topping("Chilli")
+        lines = d.generate_receipt().splitlines()
+        subtotal, tax, total = (int(line.split("$")[1].replace(".", "")) for line in lines[-4:-1])
+        self.assertEqual(subtotal + tax, total)
+        self.assertEqual(total, d.get_cost_cents())
+        self.assertEqual(subtotal, Drink.MENU.subtotal_cents(d.key()))
+
+    def test_sum_totals(self):
+        drinks = [self.drink("water", "small"), self.drink("sbrite", "large")] * 1000
+        self.assertEqual(sum_totals(drinks), sum(d.get_cost_cents() for d in drinks))
+        self.assertEqual(sum_totals(drinks), round(sum(d.get_cost() for d in drinks) * 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
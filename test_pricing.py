@@ -0,0 +1,71 @@
+import unittest
+from money import DOWN, HALF_EVEN, UP
+from pricing import Category, Menu
+
+
+class TestCategory(unittest.TestCase):
+
+    def test_single_choice_codes_start_at_one(self):
+        c = Category("size", {"small": 1.50, "large": 2.05})
+        self.assertEqual(c.codes["small"], 1)
+        self.assertEqual(c.codes["large"], 2)
+        self.assertEqual(c.table, (0, 150, 205))
+
+    def test_multi_choice_table_covers_every_mask(self):
+        c = Category("flavor", {"lemon": 0.15, "cherry": 0.30, "mint": 0.20}, multi=True)
+        self.assertEqual(len(c.table), 8)
+        self.assertEqual(c.table[c.codes["lemon"] | c.codes["mint"]], 35)
+        self.assertEqual(c.table[0b111], 65)
+
+    def test_cents_of(self):
+        c = Category("base", {"water": 1.00, "sbrite": 1.50})
+        self.assertEqual(c.cents_of("sbrite"), 150)
+
+    def test_prices_must_be_non_negative_numbers(self):
+        for price in (-2.0, -1, "1.00", None, True, float("nan"), float("inf")):
+            with self.assertRaises(ValueError, msg=price):
+                Category("coupon", {"c": price})
+        self.assertEqual(Category("base", {"free": 0, "water": 1}).cents, (0, 100))
+
+    def test_frozen(self):
+        c = Category("base", {"water": 1.00})
+        with self.assertRaises(AttributeError):
+            c.table = (0,)
+        with self.assertRaises(TypeError):
+            c.codes["lava"] = 2
+
+
+class TestMenu(unittest.TestCase):
+
+    def setUp(self):
+        self.menu = Menu((
+            Category("base", {"water": 1.00, "Mr.Salt": 2.00}),
+            Category("flavor", {"lemon": 0.15, "lime": 0.15}, multi=True),
+        ), 0.0725)
+
+    def test_subtotal_from_key(self):
+        self.assertEqual(self.menu.subtotal_cents((2, 0b11)), 230)
+
+    def test_totals_round_tax_half_up(self):
+        for subtotal in range(self.menu.max_subtotal + 1):
+            tax = (subtotal * 725 * 2 + 10000) // 20000
+            self.assertEqual(self.menu.total_cents(subtotal), subtotal + tax)
+
+    def test_rounding_mode(self):
+        categories = self.menu.categories
+        # 7.25% of $2.00 is exactly 14.5 cents
+        self.assertEqual(Menu(categories, 0.0725).total_cents(200), 215)
+        self.assertEqual(Menu(categories, 0.0725, HALF_EVEN).total_cents(200), 214)
+        self.assertEqual(Menu(categories, 0.0725, DOWN).total_cents(230), 246)
+        self.assertEqual(Menu(categories, 0.0725, UP).total_cents(230), 247)
+
+    def test_lookup_by_name(self):
+        self.assertEqual(self.menu["flavor"].names, ("lemon", "lime"))
+
+    def test_frozen(self):
+        with self.assertRaises(AttributeError):
+            self.menu.tax_rate = 0
+
+
+if __name__ == "__main__":
+    unittest.main()
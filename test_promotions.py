@@ -0,0 +1,236 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import batch
+import http_api
+from Cinos import Drink, write_receipts
+from _testing import order
+from catalog import MENU_DIR
+from journal import Journal, JournalWriter
+from promotions import Promotions, load_promotions
+from sales import SalesAggregator
+
+MEAL_DEAL = {"name": "Meal deal", "when": {"base": True, "size": ["large", "Mega"], "food": True},
+             "cents_off": 100}
+FREE_TOPPINGS = {"name": "Free toppings", "when": {"size": "Mega"}, "free": ["topping"]}
+HAPPY_HOUR = {"name": "Happy hour", "hours": [15, 17], "when": {"icecream_flavor": True},
+              "percent_off": 50, "of": ["icecream_flavor", "icecream_topping"]}
+
+
+def at_hour(hour):
+    # A clock reading hour:30 local time today
+    local = time.localtime()
+    return lambda: time.mktime((local.tm_year, local.tm_mon, local.tm_mday, hour, 30, 0, 0, 0, -1))
+
+
+class TestRuleSet(unittest.TestCase):
+
+    def setUp(self):
+        self.menu = Drink.MENU
+
+    def apply(self, rules, drink, clock=time.time):
+        return Promotions(rules, clock=clock).apply(self.menu, drink.key())
+
+    def test_combo_needs_every_condition(self):
+        meal = order(base="pokecola", size="large", food="hotdog")
+        self.assertEqual(self.apply([MEAL_DEAL], meal), (("Meal deal", 100),))
+        self.assertEqual(self.apply([MEAL_DEAL], order(base="pokecola", size="small", food="hotdog")), ())
+        self.assertEqual(self.apply([MEAL_DEAL], order(base="pokecola", size="Mega")), ())
+
+    def test_free_category(self):
+        mega = order(base="water", size="Mega", topping=["Chilli", "Caramel Sauce", "Cherry"])
+        self.assertEqual(self.apply([FREE_TOPPINGS], mega), (("Free toppings", 110),))
+        # nothing to give away, so nothing is listed
+        self.assertEqual(self.apply([FREE_TOPPINGS], order(base="water", size="Mega")), ())
+
+    def test_hours(self):
+        scoop = order(icecream_flavor="Banana", icecream_topping=["Pecans"])
+        self.assertEqual(self.apply([HAPPY_HOUR], scoop, at_hour(15)), (("Happy hour", 200),))
+        self.assertEqual(self.apply([HAPPY_HOUR], scoop, at_hour(17)), ())
+        late = dict(HAPPY_HOUR, hours=[22, 2])
+        self.assertEqual(self.apply([late], scoop, at_hour(1)), (("Happy hour", 200),))
+        self.assertEqual(self.apply([late], scoop, at_hour(12)), ())
+
+    def test_multi_conditions(self):
+        drink = order(base="water", flavor=["lemon", "lime"])
+        any_of = {"name": "a", "when": {"flavor": ["mint", "lime"]}, "cents_off": 5}
+        all_of = {"name": "b", "when": {"flavor": {"all": ["lemon", "mint"]}}, "cents_off": 5}
+        no_flavor = {"name": "c", "when": {"flavor": False}, "cents_off": 5}
+        self.assertEqual(self.apply([any_of, all_of, no_flavor], drink), (("a", 5),))
+
+    def test_rules_stack_in_order_down_to_zero(self):
+        drink = order(base="water", size="Mega", food="hotdog")  # 545 cents
+        rules = [MEAL_DEAL, {"name": "Half off", "percent_off": 50},
+                 {"name": "Big", "cents_off": 1000}, {"name": "More", "cents_off": 1}]
+        self.assertEqual(self.apply(rules, drink), (("Meal deal", 100), ("Half off", 223), ("Big", 222)))
+
+    def test_many_rules(self):
+        rules = [{"name": f"r{n}", "when": {"base": "sbrite", "size": "small"}, "cents_off": 1}
+                 for n in range(300)]
+        rules[150] = dict(rules[150], when={"base": "water"})
+        self.assertEqual(self.apply(rules, order(base="water")), (("r150", 1),))
+        self.assertEqual(len(self.apply(rules, order(base="sbrite", size="small"))), 299)
+
+    def test_invalid_rules(self):
+        for rule in [
+            {"when": {"base": "water"}, "cents_off": 1},
+            {"name": "x", "when": {"base": "lava"}, "cents_off": 1},
+            {"name": "x", "when": {"colour": True}, "cents_off": 1},
+            {"name": "x", "when": {"base": {"all": ["water"]}}, "cents_off": 1},
+            {"name": "x", "cents_off": 1, "percent_off": 5},
+            {"name": "x", "percent_off": 150},
+            {"name": "x", "cents_off": 1.5},
+            {"name": "x", "free": ["colour"]},
+            {"name": "x", "hours": [9, 30], "cents_off": 1},
+            {"name": "x", "hours": [15.5, 17], "cents_off": 1},
+            {"name": "x", "hours": [15, 15], "cents_off": 1},
+            {"name": "x", "hours": [True, 17], "cents_off": 1},
+            {"name": "x", "hours": 15, "cents_off": 1},
+            {"name": "x", "free": ["topping"], "of": ["base"]},
+        ]:
+            with self.subTest(rule=rule), self.assertRaises(ValueError):
+                Promotions([rule]).compile(self.menu)
+
+    def test_compiled_once_per_menu(self):
+        promotions = Promotions([MEAL_DEAL])
+        self.assertIs(promotions.compile(self.menu), promotions.compile(self.menu))
+
+    def test_shipped_rules_compile(self):
+        promotions = load_promotions(os.path.join(MENU_DIR, "cinos_promotions.json"))
+        self.assertEqual(len(promotions), 3)
+        promotions.compile(self.menu)
+
+    def test_bad_rules_file_fails_at_startup(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "promotions.json")
+            with open(path, "w") as f:
+                json.dump([{"name": "Lava", "when": {"base": "lava"}, "cents_off": 10}], f)
+            env = dict(os.environ, CINOS_PROMOTIONS=path)
+            run = subprocess.run([sys.executable, "-c", "import Cinos"], env=env, cwd=os.path.dirname(MENU_DIR),
+                                 capture_output=True, text=True)
+        self.assertNotEqual(run.returncode, 0)
+        self.assertIn("lava", run.stderr)
+
+
+class TestDrinkWithPromotions(unittest.TestCase):
+
+    def setUp(self):
+        promotions = Promotions([MEAL_DEAL, FREE_TOPPINGS, HAPPY_HOUR], clock=at_hour(16))
+        patcher = patch.object(Drink, "PROMOTIONS", promotions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(Drink.RENDER_CACHE.invalidate)
+
+    def test_cost_is_taxed_after_discounts(self):
+        drink = order(base="pokecola", size="large", food="hotdog")
+        self.assertEqual(drink.get_cost_cents(), Drink.MENU.totals[610 - 100])
+        self.assertEqual(drink.get_cost(), Drink.MENU.totals[510] / 100)
+        self.assertIn(f"${Drink.MENU.totals[510] / 100:.2f}", str(drink))
+        self.assertIn(f"total={Drink.MENU.totals[510] / 100:.2f}", repr(drink))
+
+    def test_no_promotion_is_list_price(self):
+        drink = order(base="pokecola")
+        self.assertEqual(drink.get_cost_cents(), Drink.MENU.totals[175])
+        with patch.object(Drink, "PROMOTIONS", None):
+            self.assertEqual(drink.generate_receipt(), order(base="pokecola").generate_receipt())
+
+    def test_receipt_lists_promotions(self):
+        drink = order(base="pokecola", size="Mega", food="hotdog", topping=["Chilli"],
+                      icecream_flavor="Chocolate")
+        lines = drink.generate_receipt().split("\n")
+        footer = lines.index("=============================")
+        self.assertEqual(lines[footer - 3:footer], [
+            "Promotion (Meal deal): -$1.00",
+            "Promotion (Free toppings): -$0.60",
+            "Promotion (Happy hour): -$1.50",
+        ])
+        self.assertIn("Subtotal: $6.70", lines)
+        total = Drink.MENU.totals[670]
+        self.assertEqual(drink.get_cost_cents(), total)
+        self.assertIn(f"Total (with tax): ${total // 100}.{total % 100:02d}", lines)
+
+    def test_receipt_follows_the_clock(self):
+        drink = order(icecream_flavor="Chocolate")
+        during = drink.generate_receipt()
+        Drink.PROMOTIONS.clock = at_hour(18)
+        after = drink.generate_receipt()
+        self.assertIn("Happy hour", during)
+        self.assertNotIn("Happy hour", after)
+
+    def test_write_receipts(self):
+        drinks = [order(base="pokecola", size="Mega", food="hotdog"), order(base="water")]
+        out = io.StringIO()
+        self.assertEqual(write_receipts(drinks, out), 2)
+        self.assertEqual(out.getvalue(), "".join(d.generate_receipt() + "\n" for d in drinks))
+        raw = io.BytesIO()
+        write_receipts(drinks, raw)
+        self.assertEqual(raw.getvalue(), out.getvalue().encode())
+
+
+class TestSubtotalsWithPromotions(unittest.TestCase):
+    # Everything that reports a subtotal next to a total has to take both
+    # after promotions, or the tax between them comes out wrong
+
+    def setUp(self):
+        promotions = load_promotions(os.path.join(MENU_DIR, "cinos_promotions.json"))
+        promotions.clock = at_hour(16)
+        patcher = patch.object(Drink, "PROMOTIONS", promotions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(Drink.RENDER_CACHE.invalidate)
+        self.spec = {"base": "water", "size": "Mega", "food": "hotdog", "topping": ["Chilli"]}
+        self.drink = Drink.from_spec(self.spec)
+
+    def test_subtotal_is_after_discounts(self):
+        # $1.00 meal deal and the $0.60 Chilli free on a Mega
+        list_price = Drink.MENU.subtotal_cents(self.drink.key())
+        self.assertEqual(self.drink.get_subtotal_cents(), list_price - 160)
+        self.assertEqual(self.drink.get_cost_cents(), Drink.MENU.totals[list_price - 160])
+        subtotal = self.drink.get_subtotal_cents()
+        self.assertIn(f"Subtotal: ${subtotal // 100}.{subtotal % 100:02d}", self.drink.generate_receipt())
+
+    def test_http_price(self):
+        result = http_api.price(self.spec)
+        self.assertEqual(result["subtotal_cents"], self.drink.get_subtotal_cents())
+        self.assertEqual(result["total_cents"], self.drink.get_cost_cents())
+        self.assertGreaterEqual(result["tax_cents"], 0)
+        self.assertEqual(result["subtotal_cents"] + result["tax_cents"], result["total_cents"])
+
+    def test_sales_tax(self):
+        sales = SalesAggregator()
+        sales.add_drink(self.drink, timestamp=0)
+        report = sales.report()
+        self.assertEqual(report.total_cents, self.drink.get_cost_cents())
+        self.assertEqual(report.tax_cents, self.drink.get_cost_cents() - self.drink.get_subtotal_cents())
+        self.assertGreaterEqual(report.tax_cents, 0)
+
+    def test_journal_replay(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.journal")
+            with JournalWriter(path) as writer:
+                writer.append(self.drink, timestamp=10**9)
+            replayed = SalesAggregator()
+            with Journal(path) as journal:
+                replayed.extend(journal.records())
+        live = SalesAggregator()
+        live.add_drink(self.drink, timestamp=1)
+        self.assertEqual(replayed.report(), live.report())
+
+    def test_batch_results_kept_per_hour(self):
+        line = '{"icecream_flavor": "Chocolate"}'
+        self.addCleanup(batch._memo.clear)
+        during, _ = batch.price_chunk([(1, line)])
+        Drink.PROMOTIONS.clock = at_hour(18)
+        after, _ = batch.price_chunk([(1, line)])
+        self.assertNotEqual(during, after)
+        self.assertEqual(after, f"1\t{Drink.from_spec({'icecream_flavor': 'Chocolate'}).get_cost():.2f}\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
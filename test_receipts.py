@@ -0,0 +1,59 @@
+import io
+import unittest
+from pricing import Category, Menu
+from receipts import ReceiptTemplate
+
+
+class Order:
+
+    def __init__(self, *key):
+        self._key = key
+
+    def key(self):
+        return self._key
+
+
+class TestReceiptTemplate(unittest.TestCase):
+
+    def setUp(self):
+        menu = Menu((
+            Category("base", {"water": 1.00, "sbrite": 1.50}),
+            Category("flavor", {"lemon": 0.25, "cherry": 0.30}, multi=True),
+        ))
+        self.template = ReceiptTemplate(
+            menu, ("Base", "Flavors"), lambda subtotal, total: f"Total: ${total / 100:.2f}")
+
+    def test_render(self):
+        self.assertEqual(self.template.render((2, 0b11)), "\n".join([
+            "======= DRINK RECEIPT =======",
+            "Base: sbrite - $1.50",
+            "Flavors:",
+            "  - lemon - $0.25",
+            "  - cherry - $0.30",
+            "Total: $2.05",
+        ]))
+
+    def test_render_nothing_chosen(self):
+        self.assertEqual(self.template.render((0, 0)), "\n".join([
+            "======= DRINK RECEIPT =======",
+            "Base: None",
+            "Flavors: None",
+            "Total: $0.00",
+        ]))
+
+    def test_write_text_stream(self):
+        orders = [Order(1, 0b10), Order(0, 0)]
+        out = io.StringIO()
+        self.assertEqual(self.template.write(orders, out), 2)
+        expected = "".join(self.template.render(o.key()) + "\n" for o in orders)
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_write_binary_stream(self):
+        orders = [Order(2, 0b01)]
+        out = io.BytesIO()
+        self.template.write(orders, out)
+        self.assertEqual(out.getvalue(), (self.template.render((2, 0b01)) + "\n").encode())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from Cinos import Drink
+from _testing import random_drinks
+from pricing import to_cents
+from sales import DAY, HOUR, SalesAggregator
+
+
+class TestSalesAggregator(unittest.TestCase):
+
+    def setUp(self):
+        self.drinks = random_drinks(500, seed=4)
+
+    def test_reconciles_with_get_cost(self):
+        sales = SalesAggregator()
+        for i, d in enumerate(self.drinks):
+            sales.add_drink(d, timestamp=i * 60)
+        report = sales.report()
+        self.assertEqual(report.orders, 500)
+        self.assertEqual(report.total_cents, sum(to_cents(d.get_cost()) for d in self.drinks))
+        self.assertEqual(report.subtotal_cents, sum(Drink.MENU.subtotal_cents(d.key()) for d in self.drinks))
+        self.assertEqual(report.tax_cents, report.total_cents - report.subtotal_cents)
+        self.assertEqual(sum(report.revenue_by_base.values()), report.total_cents)
+
+    def test_item_counts_and_attach_rate(self):
+        sales = SalesAggregator()
+        for d in self.drinks:
+            sales.add_drink(d, timestamp=0)
+        report = sales.report()
+        for flavor, count in report.items["flavor"].items():
+            self.assertEqual(count, sum(flavor in d.get_flavors() for d in self.drinks))
+        sizes = report.items["size"]
+        self.assertEqual(sum(sizes.values()), sum(d.get_size() is not None for d in self.drinks))
+        with_topping = sum(d.key()[4] != 0 for d in self.drinks)
+        self.assertAlmostEqual(report.topping_attach_rate, with_topping / 500)
+        water = sum(to_cents(d.get_cost()) for d in self.drinks if d.get_base() == "water")
+        self.assertEqual(report.revenue_by_base.get("water", 0), water)
+
+    def test_windows(self):
+        sales = SalesAggregator()
+        for i, d in enumerate(self.drinks):
+            sales.add_drink(d, timestamp=i * 600)  # one order every 10 minutes
+        hourly = sales.rollup(HOUR)
+        self.assertEqual(len(hourly), 84)
+        self.assertEqual([start for start, _ in hourly[:2]], [0, HOUR])
+        self.assertEqual(hourly[0][1].orders, 6)
+        daily = sales.rollup(DAY)
+        self.assertEqual(len(daily), 4)
+        self.assertEqual(sum(r.total_cents for _, r in daily), sales.report().total_cents)
+
+    def test_keep_drops_oldest_windows(self):
+        sales = SalesAggregator(windows=(HOUR,), keep=3)
+        for i, d in enumerate(self.drinks[:10]):
+            sales.add_drink(d, timestamp=i * HOUR)
+        self.assertEqual([start for start, _ in sales.rollup(HOUR)], [7 * HOUR, 8 * HOUR, 9 * HOUR])
+        self.assertEqual(sales.report().orders, 10)
+
+    def test_journal_records(self):
+        sales = SalesAggregator()
+        sales.extend((d.key(), None, to_cents(d.get_cost()), 3 * HOUR * 10**9) for d in self.drinks[:5])
+        self.assertEqual([start for start, _ in sales.rollup(HOUR)], [3 * HOUR])
+
+    def test_empty(self):
+        report = SalesAggregator().report()
+        self.assertEqual((report.orders, report.total_cents, report.topping_attach_rate), (0, 0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import queue
+import unittest
+from Cinos import Drink
+from service import OrderService, build_drink, drain, process_order
+
+SPEC = {
+    "base": "sbrite",
+    "flavor": ["lemon", "cherry"],
+    "size": "small",
+    "food": "hotdog",
+    "topping": ["Cherry", "Chilli"],
+    "icecream_flavor": "Chocolate",
+    "icecream_topping": ["Chocolate Sauce", "Cookie Dough"],
+}
+
+
+def expected_drink():
+    d = Drink()
+    d.set_base("sbrite")
+    d.add_flavor("lemon")
+    d.add_flavor("cherry")
+    d.add_size("small")
+    d.add_food("hotdog")
+    d.add_topping("Cherry")
+    d.add_topping("Chilli")
+    d.set_icecream_flavor("Chocolate")
+    d.add_icecream_topping("Chocolate Sauce")
+    d.add_icecream_topping("Cookie Dough")
+    return d
+
+
+class TestProcessOrder(unittest.TestCase):
+
+    def test_build_drink_matches_setters(self):
+        self.assertEqual(build_drink(SPEC).key(), expected_drink().key())
+
+    def test_process_order(self):
+        result = process_order(SPEC)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.total, expected_drink().get_cost())
+        self.assertEqual(result.receipt, expected_drink().generate_receipt())
+        self.assertEqual(len(result.timings), 3)
+
+    def test_invalid_item_reports_error(self):
+        result = process_order({"base": "lava juice"})
+        self.assertIsNone(result.total)
+        self.assertIn("Invalid base", result.error)
+
+    def test_unknown_field_reports_error(self):
+        self.assertIn("Invalid order field", process_order({"garnish": "umbrella"}).error)
+
+    def test_non_mapping_spec_reports_error(self):
+        for spec in (["base", "water"], "water", None, 3):
+            self.assertEqual(process_order(spec).error, "Order must be a mapping.")
+
+
+class TestOrderService(unittest.TestCase):
+
+    def specs(self):
+        return [SPEC, {"base": "water"}, {"size": "Mega"}, {"food": "lava fries"}] * 10
+
+    def check(self, service):
+        results = list(service.run(self.specs()))
+        self.assertEqual(len(results), 40)
+        self.assertEqual(results[0].total, expected_drink().get_cost())
+        self.assertEqual(results[1].total, round(1.00 * 1.0725, 2))
+        self.assertIsNotNone(results[3].error)
+        report = service.stats.percentiles()
+        self.assertEqual(set(report), {"validate", "price", "render"})
+        self.assertLessEqual(report["render"][50], report["render"][99])
+
+    def test_thread_pool(self):
+        self.check(OrderService(workers=3, chunksize=3, max_pending=2))
+
+    def test_process_pool(self):
+        self.check(OrderService(workers=2, mode="process", chunksize=8))
+
+    def test_drain_queue(self):
+        q = queue.Queue()
+        for spec in self.specs()[:4]:
+            q.put(spec)
+        q.put(None)
+        results = list(OrderService(workers=2).run(drain(q)))
+        self.assertEqual(len(results), 4)
+
+    def test_malformed_spec_does_not_stop_the_run(self):
+        specs = [{"base": "water"}, ["base", "water"], "sbrite", {"base": "sbrite"}]
+        for service in (OrderService(workers=2, chunksize=1), OrderService(workers=2, mode="process")):
+            results = list(service.run(specs))
+            self.assertEqual([r.error for r in results],
+                             [None, "Order must be a mapping.", "Order must be a mapping.", None])
+            self.assertEqual(results[3].total, round(1.50 * 1.0725, 2))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            OrderService(mode="fibers")
+
+
+if __name__ == "__main__":
+    unittest.main()
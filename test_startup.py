@@ -0,0 +1,18 @@
+import unittest
+from benchmarks.startup import BUDGET_US, HEAVY, import_time, imported_modules
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_entry_points_stay_light(self):
+        for module in BUDGET_US:
+            heavy = [m for m in imported_modules(module) if m.split(".")[0] in HEAVY]
+            self.assertEqual(heavy, [], f"import {module} loads {heavy}")
+
+    def test_import_time_budget(self):
+        for module, budget in BUDGET_US.items():
+            self.assertLessEqual(import_time(module, runs=3), budget, f"import {module} is over budget")
+
+
+if __name__ == '__main__':
+    unittest.main()
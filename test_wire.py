@@ -0,0 +1,85 @@
+import pickle
+import unittest
+from unittest.mock import patch
+import drink
+import wire
+from Cinos import Drink
+from _testing import order
+
+
+class TestWire(unittest.TestCase):
+
+    def setUp(self):
+        self.orders = [
+            order(base="pokecola", flavor=["lime", "mint"], size="Mega", food="hotdog",
+                  topping=["Chilli", "Mustard"], icecream_flavor="Banana", icecream_topping=["Pecans"]),
+            order(base="water"),
+            order(),
+        ]
+
+    def test_one_order(self):
+        for d in self.orders:
+            data = d.to_bytes()
+            self.assertEqual(len(data), 2 + 2 * 7)
+            self.assertEqual(Drink.from_bytes(data).key(), d.key())
+            self.assertEqual(Drink.from_bytes(memoryview(data)).get_cost_cents(), d.get_cost_cents())
+
+    def test_layout(self):
+        self.assertEqual(order(base="water", topping=["Chilli"]).to_bytes(),
+                         b"\x01\x07" + b"\x01\x00" + b"\x00\x00" * 3 + b"\x20\x00" + b"\x00\x00" * 2)
+
+    def test_many_orders(self):
+        data = Drink.dumps_many(self.orders)
+        self.assertEqual(len(data), wire.HEADER + 3 * 14)
+        loaded = Drink.loads_many(data)
+        self.assertEqual([d.key() for d in loaded], [d.key() for d in self.orders])
+        self.assertEqual([d.get_cost_cents() for d in loaded], [d.get_cost_cents() for d in self.orders])
+        self.assertEqual(Drink.loads_many(Drink.dumps_many([])), [])
+
+    def test_records_are_read_in_place(self):
+        data = bytearray(Drink.dumps_many(self.orders))
+        records = wire.records(data, 7)
+        self.assertIs(records.obj, data)
+        self.assertEqual(list(records[0::7]), [d.key()[0] for d in self.orders])
+        records.release()
+
+    def test_as_words(self):
+        data = memoryview(b"\x01\x00\x02\x00\x00\x01\x00\x00")
+        self.assertEqual(list(wire.as_words(data, "H")), [1, 2, 256, 0])
+        self.assertEqual(list(wire.as_words(data, "I")), [0x20001, 0x100])
+        # big-endian hosts byteswap a copy; on this host that swaps instead
+        with patch.object(wire.sys, "byteorder", "big"):
+            self.assertEqual(list(wire.as_words(data, "H")), [256, 512, 1, 0])
+
+    def test_other_shop(self):
+        d = drink.Drink()
+        d.set_base("sbrite")
+        d.add_flavor("mint")
+        self.assertEqual(drink.Drink.from_bytes(d.to_bytes()).key(), d.key())
+        self.assertEqual([x.key() for x in drink.Drink.loads_many(drink.Drink.dumps_many([d]))], [d.key()])
+        with self.assertRaises(ValueError):
+            Drink.loads_many(drink.Drink.dumps_many([d]))
+
+    def test_bad_input(self):
+        good = self.orders[0].to_bytes()
+        for data in [b"", b"\x02" + good[1:], good[:-1], good + b"\0\0"]:
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                Drink.from_bytes(data)
+        with self.assertRaises(ValueError):
+            Drink.from_bytes(wire.dumps((99, 0, 0, 0, 0, 0, 0)))
+        batch = Drink.dumps_many(self.orders)
+        for data in [b"", b"XXXX" + batch[4:], batch[:-2], batch + b"\0\0"]:
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                Drink.loads_many(data)
+        with self.assertRaises(ValueError):
+            Drink.loads_many(wire.dumps_many([(0, 0, 0, 0, 0, 0, 1 << 12)], 7))
+        with self.assertRaises(ValueError):
+            wire.dumps((1 << 16,))
+
+    def test_pickle(self):
+        for d in self.orders:
+            self.assertEqual(pickle.loads(pickle.dumps(d)).key(), d.key())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import sys
+from array import array
+
+# Binary wire format for orders passed between processes. Everything is
+# little-endian and an order is nothing but its key: one uint16 code or mask
+# per menu category, in menu order. Codes are stable across menu reloads, so
+# bytes written before a reload still decode after it.
+#
+#   one order (Order.to_bytes):    version u8, category count u8, codes
+#   many orders (Order.dumps_many): MAGIC, version u8, category count u8,
+#                                   2 bytes reserved, order count u32, then
+#                                   the codes of each order back to back
+#
+# Decoding casts the buffer to uint16 in place, so loading a batch reads the
+# codes straight out of the bytes (or mmap, or socket buffer) it arrived in.
+VERSION = 1
+MAGIC = b"CNWR"
+HEADER = 12  # bytes before the first record of a batch
+
+
+def _codes(codes):
+    try:
+        codes = array("H", codes)
+    except OverflowError:
+        raise ValueError("Order codes must fit in 16 bits.") from None
+    if sys.byteorder != "little":
+        codes.byteswap()
+    return codes
+
+
+def as_words(view, typecode):
+    # A little-endian byte memoryview as words of typecode, cast in place;
+    # big-endian hosts pay for one copy. Shared by everything that reads
+    # these formats out of a buffer (journal.py and configs.py too).
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    words = array(typecode)
+    words.frombytes(view)
+    words.byteswap()
+    return memoryview(words)
+
+
+def dumps(key):
+    return bytes((VERSION, len(key))) + _codes(key).tobytes()
+
+
+def loads(data):
+    # The key one order was written with
+    view = memoryview(data).cast("B")
+    if len(view) < 2 or view[0] != VERSION:
+        raise ValueError("Not an encoded order (or an unsupported version).")
+    if len(view) != 2 + 2 * view[1]:
+        raise ValueError(f"Encoded order should be {2 + 2 * view[1]} bytes, got {len(view)}.")
+    return tuple(as_words(view[2:], "H"))
+
+
+def dumps_many(keys, categories):
+    # keys: an iterable of order keys, each of `categories` codes
+    codes = array("H")
+    count = 0
+    for key in keys:
+        if len(key) != categories:
+            raise ValueError(f"Order key needs {categories} codes, got {len(key)}.")
+        codes.extend(key)
+        count += 1
+    if sys.byteorder != "little":
+        codes.byteswap()
+    return b"".join([MAGIC, bytes((VERSION, categories, 0, 0)), count.to_bytes(4, "little"), codes.tobytes()])
+
+
+def records(data, categories):
+    # The codes of a dumps_many() batch as one flat uint16 memoryview over
+    # data, `categories` codes per order; order n is records[n * categories:
+    # (n + 1) * categories] and category i of every order is
+    # records[i::categories]
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER or view[:4] != MAGIC or view[4] != VERSION:
+        raise ValueError("Not an encoded batch of orders (or an unsupported version).")
+    if view[5] != categories:
+        raise ValueError(f"Batch was written with {view[5]} categories, the menu has {categories}.")
+    count = int.from_bytes(view[8:HEADER], "little")
+    size = HEADER + 2 * count * categories
+    if len(view) != size:
+        raise ValueError(f"Batch of {count} orders should be {size} bytes, got {len(view)}.")
+    return as_words(view[HEADER:], "H")